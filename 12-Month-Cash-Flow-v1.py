@@ -1,8 +1,7 @@
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
-import io
+from ledger.charts import png_chart, subplots
+from ledger.exports import download_csv
+from ledger.score import process_score_cashflow, score_batch
 
 # Set page configuration
 st.set_page_config(
@@ -10,42 +9,115 @@ st.set_page_config(
     layout="wide"
 )
 
-def process_score_cashflow(uploaded_file):
-    """
-    Process SCORE cash flow template and convert it to the required format with
-    Month, Cash Inflow, and Cash Outflow columns.
-    """
-    # Read the Excel file
-    df = pd.read_excel(uploaded_file)
+@png_chart
+def draw_cash_flow_trend(processed_data):
+    """Line chart of monthly inflow, outflow and net cash flow."""
+    fig, ax = subplots(figsize=(12, 6))
     
-    # Extract months (excluding Pre-Startup EST and Total Item EST columns)
-    months = [col for col in df.columns if col.endswith('-YY')]
+    # Plot with better styling
+    ax.plot(processed_data['Month'], processed_data['Cash Inflow'], 
+           label='Cash Inflow', marker='o', color='green', linewidth=2)
+    ax.plot(processed_data['Month'], processed_data['Cash Outflow'], 
+           label='Cash Outflow', marker='o', color='red', linewidth=2)
+    ax.plot(processed_data['Month'], processed_data['Net Cash Flow'], 
+           label='Net Cash Flow', marker='o', color='blue', linewidth=2)
     
-    # Initialize lists to store data
-    processed_data = []
+    ax.set_xlabel("Month")
+    ax.set_ylabel("Amount ($)")
+    ax.set_title("Monthly Cash Flow")
+    ax.legend()
+    ax.tick_params(axis='x', labelrotation=45)
+    ax.grid(True, linestyle='--', alpha=0.7)
     
-    for month in months:
-        # Cash Inflows (Cash Receipts)
-        cash_inflow = df.loc[df.index[df['CASH RECEIPTS'].notna()].min():
-                           df.index[df['TOTAL CASH RECEIPTS'].notna()].min()-1, 
-                           month].sum()
+    # Adjust layout to prevent label cutoff
+    fig.tight_layout()
+    return fig
+
+def show_cash_flow(uploaded_file):
+    try:
+        # Process the SCORE template
+        processed_data = process_score_cashflow(uploaded_file)
         
-        # Cash Outflows (Cash Paid Out)
-        cash_outflow = df.loc[df.index[df['CASH PAID OUT'].notna()].min():
-                            df.index[df['TOTAL CASH PAID OUT'].notna()].min()-1,
-                            month].sum()
+        # Display raw data
+        st.subheader("Processed Data")
+        st.dataframe(processed_data)
         
-        # Store the processed data
-        processed_data.append({
-            'Month': month.replace('-YY', ''),
-            'Cash Inflow': cash_inflow,
-            'Cash Outflow': cash_outflow
-        })
-    
-    # Convert to DataFrame
-    result_df = pd.DataFrame(processed_data)
-    
-    return result_df
+        # Summary metrics
+        st.subheader("Summary Metrics")
+        processed_data['Net Cash Flow'] = (processed_data['Cash Inflow'] - 
+                                         processed_data['Cash Outflow'])
+        
+        # Create columns for metrics
+        col1, col2, col3 = st.columns(3)
+        
+        total_inflow = processed_data['Cash Inflow'].sum()
+        total_outflow = processed_data['Cash Outflow'].sum()
+        net_flow = processed_data['Net Cash Flow'].sum()
+        
+        with col1:
+            st.metric("Total Cash Inflow", f"${total_inflow:,.2f}")
+        with col2:
+            st.metric("Total Cash Outflow", f"${total_outflow:,.2f}")
+        with col3:
+            st.metric("Net Cash Flow", f"${net_flow:,.2f}")
+        
+        # Visualization
+        st.subheader("Cash Flow Trend")
+        st.image(draw_cash_flow_trend(processed_data), use_column_width=True)
+        
+        # Download processed data
+        st.download_button(
+            label="Download Processed Data",
+            data=processed_data.to_csv(index=False).encode('utf-8'),
+            file_name="processed_cashflow.csv",
+            mime="text/csv"
+        )
+        
+    except Exception as e:
+        st.error(f"Error processing file: {str(e)}")
+        st.info("Please ensure you're uploading a valid SCORE cash flow template.")
+
+def process_score_batch(uploaded_files):
+    """
+    Parse several uploaded SCORE workbooks across a process pool; the result
+    is kept in the session until the set of uploaded files changes.
+    """
+    key = tuple(uploaded_file.id for uploaded_file in uploaded_files)
+    if st.session_state.get("score_batch_key") != key:
+        files = [(uploaded_file.name.rsplit('.', 1)[0], uploaded_file.getvalue()) for uploaded_file in uploaded_files]
+        with st.spinner(f"Processing {len(files)} workbooks..."):
+            st.session_state.score_batch = score_batch(files)
+        st.session_state.score_batch_key = key
+    return key, st.session_state.score_batch
+
+def show_batch(uploaded_files):
+    key, (combined, errors) = process_score_batch(uploaded_files)
+
+    # Summary metrics
+    st.subheader("Batch Summary")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Workbooks Processed", f"{len(uploaded_files) - len(errors)} of {len(uploaded_files)}")
+    with col2:
+        st.metric("Total Cash Inflow", f"${combined['Cash Inflow'].sum():,.2f}")
+    with col3:
+        st.metric("Net Cash Flow", f"${combined['Net Cash Flow'].sum():,.2f}")
+
+    if not errors.empty:
+        st.error(f"{len(errors)} workbook(s) could not be processed.")
+        st.dataframe(errors)
+
+    # Per-client totals
+    st.subheader("Totals by Client")
+    totals = combined.groupby('Client', sort=False)[['Cash Inflow', 'Cash Outflow', 'Net Cash Flow']].sum()
+    st.dataframe(totals)
+
+    # Combined long-format table, one row per client and month
+    st.subheader("Combined Data")
+    st.dataframe(combined)
+    download_csv(lambda: combined, "combined_cashflow", key)
+    if not errors.empty:
+        download_csv(lambda: errors, "cashflow_errors", key)
 
 def main():
     st.title("12-Month Cash Flow Application")
@@ -53,78 +125,19 @@ def main():
     # Add instructions
     st.markdown("""
     ### Instructions:
-    1. Upload your SCORE cash flow Excel file
+    1. Upload your SCORE cash flow Excel file (or several, one per client, to process them as a batch)
     2. View the processed data and visualizations
     3. Download the processed results if needed
     """)
     
     # File upload
-    uploaded_file = st.file_uploader("Upload your SCORE cash flow Excel file", 
-                                   type=["xls", "xlsx"])
+    uploaded_files = st.file_uploader("Upload your SCORE cash flow Excel file(s)", 
+                                    type=["xls", "xlsx"], accept_multiple_files=True)
     
-    if uploaded_file:
-        try:
-            # Process the SCORE template
-            processed_data = process_score_cashflow(uploaded_file)
-            
-            # Display raw data
-            st.subheader("Processed Data")
-            st.dataframe(processed_data)
-            
-            # Summary metrics
-            st.subheader("Summary Metrics")
-            processed_data['Net Cash Flow'] = (processed_data['Cash Inflow'] - 
-                                             processed_data['Cash Outflow'])
-            
-            # Create columns for metrics
-            col1, col2, col3 = st.columns(3)
-            
-            total_inflow = processed_data['Cash Inflow'].sum()
-            total_outflow = processed_data['Cash Outflow'].sum()
-            net_flow = processed_data['Net Cash Flow'].sum()
-            
-            with col1:
-                st.metric("Total Cash Inflow", f"${total_inflow:,.2f}")
-            with col2:
-                st.metric("Total Cash Outflow", f"${total_outflow:,.2f}")
-            with col3:
-                st.metric("Net Cash Flow", f"${net_flow:,.2f}")
-            
-            # Visualization
-            st.subheader("Cash Flow Trend")
-            fig, ax = plt.subplots(figsize=(12, 6))
-            
-            # Plot with better styling
-            ax.plot(processed_data['Month'], processed_data['Cash Inflow'], 
-                   label='Cash Inflow', marker='o', color='green', linewidth=2)
-            ax.plot(processed_data['Month'], processed_data['Cash Outflow'], 
-                   label='Cash Outflow', marker='o', color='red', linewidth=2)
-            ax.plot(processed_data['Month'], processed_data['Net Cash Flow'], 
-                   label='Net Cash Flow', marker='o', color='blue', linewidth=2)
-            
-            ax.set_xlabel("Month")
-            ax.set_ylabel("Amount ($)")
-            ax.set_title("Monthly Cash Flow")
-            ax.legend()
-            plt.xticks(rotation=45)
-            plt.grid(True, linestyle='--', alpha=0.7)
-            
-            # Adjust layout to prevent label cutoff
-            plt.tight_layout()
-            
-            st.pyplot(fig)
-            
-            # Download processed data
-            st.download_button(
-                label="Download Processed Data",
-                data=processed_data.to_csv(index=False).encode('utf-8'),
-                file_name="processed_cashflow.csv",
-                mime="text/csv"
-            )
-            
-        except Exception as e:
-            st.error(f"Error processing file: {str(e)}")
-            st.info("Please ensure you're uploading a valid SCORE cash flow template.")
+    if len(uploaded_files) == 1:
+        show_cash_flow(uploaded_files[0])
+    elif uploaded_files:
+        show_batch(uploaded_files)
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+from ledger.exports import download_csv, download_xlsx, frame_version
 
 def display_month_data(month_index, month_name, cash_flow_data):
     st.header(f"{month_name} Cash Flow Data")
@@ -187,21 +188,14 @@ def create_cash_flow_app():
         df = pd.DataFrame(st.session_state.cash_flow_data, index=months)
         st.dataframe(df)
 
-    # Export to CSV
-    if st.sidebar.button('Export to CSV'):
-        try:
-            df = pd.DataFrame(st.session_state.cash_flow_data, index=months)
-            csv = df.to_csv(index=True)
-
-            # Download the CSV file
-            st.sidebar.download_button(
-                label="Download CSV",
-                data=csv,
-                file_name='cash_flow.csv',
-                mime='text/csv'
-            )
-        except Exception as e:
-            st.error(f"Error exporting to CSV: {str(e)}")
+    # Export to CSV and Excel
+    try:
+        df = pd.DataFrame(st.session_state.cash_flow_data, index=months)
+        version = frame_version(df)
+        download_csv(lambda: df, 'cash_flow', version, index=True, container=st.sidebar)
+        download_xlsx(lambda: {'Cash Flow': df}, 'cash_flow', version, container=st.sidebar)
+    except Exception as e:
+        st.error(f"Error exporting: {str(e)}")
 
 if __name__ == '__main__':
     create_cash_flow_app()
@@ -1,67 +1,55 @@
 import streamlit as st
-
-class Account:
-    def __init__(self, name, account_type, balance=0):
-        self.name = name
-        self.account_type = account_type  # e.g., "asset", "liability", "income", "expense"
-        self.balance = balance
-
-    def __repr__(self):
-        return f"{self.name} ({self.account_type}): {self.balance:.2f}"
-
-
-class AccountingApp:
-    def __init__(self):
-        self.accounts = {}
-
-    def create_account(self, name, account_type, initial_balance=0):
-        if name in self.accounts:
-            st.warning(f"Account with name '{name}' already exists.")
-            return
-        self.accounts[name] = Account(name, account_type, initial_balance)
+from ledger.accounts import ACCOUNT_TYPES
+from ledger.engine import AccountingEngine, DuplicateAccountError, LedgerError
+
+
+def create_account(app, name, account_type, initial_balance):
+    try:
+        app.create_account(name, account_type, initial_balance)
+    except DuplicateAccountError as e:
+        st.warning(str(e))
+    except LedgerError as e:
+        st.error(str(e))
+    else:
         st.success(f"Account '{name}' created successfully.")
 
-    def record_transaction(self, debit_account, credit_account, amount):
-        if debit_account not in self.accounts or credit_account not in self.accounts:
-            st.error("One or both accounts do not exist.")
-            return
 
-        if amount <= 0:
-            st.error("Transaction amount must be positive.")
-            return
+def record_transaction(app, debit_account, credit_account, amount):
+    try:
+        posting = app.record_transaction(debit_account, credit_account, amount)
+    except LedgerError as e:
+        st.error(str(e))
+    else:
+        st.success(
+            f"Transaction recorded: Debit {posting.debit_account} / Credit {posting.credit_account} - {posting.amount:.2f}"
+        )
+
 
-        self.accounts[debit_account].balance += amount
-        self.accounts[credit_account].balance -= amount
-        st.success(f"Transaction recorded: Debit {debit_account} / Credit {credit_account} - {amount:.2f}")
+def show_balance_sheet(app):
+    st.header("Balance Sheet")
+    balance_sheet = app.generate_balance_sheet()
 
-    def generate_balance_sheet(self):
-        st.header("Balance Sheet")
-        total_assets = sum(acc.balance for acc in self.accounts.values() if acc.account_type == "asset")
-        total_liabilities = sum(acc.balance for acc in self.accounts.values() if acc.account_type == "liability")
-        equity = total_assets - total_liabilities
+    st.subheader("Assets")
+    for name, balance in balance_sheet.assets.items():
+        st.write(f"  {name}: {balance:.2f}")
 
-        st.subheader("Assets")
-        for acc in self.accounts.values():
-            if acc.account_type == "asset":
-                st.write(f"  {acc.name}: {acc.balance:.2f}")
+    st.subheader("Liabilities")
+    for name, balance in balance_sheet.liabilities.items():
+        st.write(f"  {name}: {balance:.2f}")
 
-        st.subheader("Liabilities")
-        for acc in self.accounts.values():
-            if acc.account_type == "liability":
-                st.write(f"  {acc.name}: {acc.balance:.2f}")
+    st.subheader("Equity")
+    st.write(f"  Total Equity: {balance_sheet.equity:.2f}")
 
-        st.subheader("Equity")
-        st.write(f"  Total Equity: {equity:.2f}")
 
-    def list_accounts(self):
-        st.header("Accounts")
-        for account in self.accounts.values():
-            st.write(account)
+def show_accounts(app):
+    st.header("Accounts")
+    for account in app.list_accounts():
+        st.write(account)
 
 
 def get_app():
     if "app" not in st.session_state:
-        st.session_state.app = AccountingApp()
+        st.session_state.app = AccountingEngine()
     return st.session_state.app
 
 
@@ -75,10 +63,10 @@ def main():
     if choice == "Create Account":
         st.subheader("Create Account")
         name = st.text_input("Enter account name")
-        account_type = st.selectbox("Enter account type", ["asset", "liability", "income", "expense"])
+        account_type = st.selectbox("Enter account type", ACCOUNT_TYPES)
         initial_balance = st.number_input("Enter initial balance", min_value=0.0, step=0.01)
         if st.button("Create Account"):
-            app.create_account(name, account_type, initial_balance)
+            create_account(app, name, account_type, initial_balance)
 
     elif choice == "Record Transaction":
         st.subheader("Record Transaction")
@@ -88,17 +76,17 @@ def main():
             credit_account = st.selectbox("Select credit account", account_names)
             amount = st.number_input("Enter transaction amount", min_value=0.0, step=0.01)
             if st.button("Record Transaction"):
-                app.record_transaction(debit_account, credit_account, amount)
+                record_transaction(app, debit_account, credit_account, amount)
         else:
             st.warning("No accounts available. Please create accounts first.")
 
     elif choice == "Generate Balance Sheet":
         st.subheader("Generate Balance Sheet")
-        app.generate_balance_sheet()
+        show_balance_sheet(app)
 
     elif choice == "List Accounts":
         st.subheader("List Accounts")
-        app.list_accounts()
+        show_accounts(app)
 
 
 if __name__ == "__main__":
@@ -1,106 +1,61 @@
 import streamlit as st
 import pandas as pd
-from io import BytesIO
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+from ledger.accounts import ACCOUNT_TYPES
+from ledger.engine import AccountingEngine, DuplicateAccountError, LedgerError
+from ledger.exports import download_csv, download_pdf, download_xlsx
+
+
+def create_account(app, name, account_type, initial_balance):
+    try:
+        app.create_account(name, account_type, initial_balance)
+    except DuplicateAccountError as e:
+        st.warning(str(e))
+    except LedgerError as e:
+        st.error(str(e))
+    else:
+        st.success(f"Account '{name}' created successfully.")
 
 
-class Account:
-    def __init__(self, name, account_type, balance=0):
-        self.name = name
-        self.account_type = account_type  # e.g., "asset", "liability", "income", "expense"
-        self.balance = balance
+def record_transaction(app, debit_account, credit_account, amount):
+    try:
+        posting = app.record_transaction(debit_account, credit_account, amount)
+    except LedgerError as e:
+        st.error(str(e))
+    else:
+        st.success(
+            f"Transaction recorded: Debit {posting.debit_account} / Credit {posting.credit_account} - {posting.amount:.2f}"
+        )
 
-    def __repr__(self):
-        return f"{self.name} ({self.account_type}): {self.balance:.2f}"
 
+def record_batch(app, file):
+    try:
+        postings = pd.read_csv(file, usecols=["Debit Account", "Credit Account", "Amount"])
+        batch = app.record_transactions(postings["Debit Account"], postings["Credit Account"], postings["Amount"])
+    except LedgerError as e:
+        st.error(str(e))
+    except ValueError as e:
+        st.error(f"Error reading file: {e}")
+    else:
+        st.success(f"Recorded {batch.count} transactions totalling {batch.total:.2f}")
 
-class AccountingApp:
-    def __init__(self):
-        self.accounts = {}
 
-    def create_account(self, name, account_type, initial_balance=0):
-        if name in self.accounts:
-            st.warning(f"Account with name '{name}' already exists.")
-            return
-        self.accounts[name] = Account(name, account_type, initial_balance)
-        st.success(f"Account '{name}' created successfully.")
+def accounts_frame(app):
+    names, types, balances = app.account_arrays()
+    return pd.DataFrame({"Account Name": names, "Type": types, "Balance": balances})
 
-    def record_transaction(self, debit_account, credit_account, amount):
-        if debit_account not in self.accounts or credit_account not in self.accounts:
-            st.error("One or both accounts do not exist.")
-            return
-
-        if amount <= 0:
-            st.error("Transaction amount must be positive.")
-            return
-
-        self.accounts[debit_account].balance += amount
-        self.accounts[credit_account].balance -= amount
-        st.success(f"Transaction recorded: Debit {debit_account} / Credit {credit_account} - {amount:.2f}")
-
-    def generate_balance_sheet(self):
-        assets = [(acc.name, acc.balance) for acc in self.accounts.values() if acc.account_type == "asset"]
-        liabilities = [(acc.name, acc.balance) for acc in self.accounts.values() if acc.account_type == "liability"]
-        equity = sum(balance for _, balance in assets) - sum(balance for _, balance in liabilities)
-
-        data = {
-            "Assets": dict(assets),
-            "Liabilities": dict(liabilities),
-            "Equity": equity
-        }
-
-        df = pd.DataFrame({"Type": ["Asset", "Liability", "Equity"],
-                           "Total": [sum(balance for _, balance in assets),
-                                     sum(balance for _, balance in liabilities),
-                                     equity]})
-        return data, df
-
-    def list_accounts(self):
-        account_data = [(acc.name, acc.account_type, acc.balance) for acc in self.accounts.values()]
-        return pd.DataFrame(account_data, columns=["Account Name", "Type", "Balance"])
-
-
-def download_csv(df, filename):
-    csv = df.to_csv(index=False).encode('utf-8')
-    st.download_button(label=f"Download {filename}.csv", data=csv, file_name=f"{filename}.csv", mime="text/csv")
-
-
-def download_pdf(data, filename):
-    buffer = BytesIO()
-    pdf = canvas.Canvas(buffer, pagesize=letter)
-
-    y = 750
-    pdf.setFont("Helvetica-Bold", 14)
-    pdf.drawString(30, y, f"{filename}")
-    y -= 30
-
-    pdf.setFont("Helvetica", 12)
-    for key, values in data.items():
-        if isinstance(values, dict):
-            pdf.drawString(30, y, f"{key}:")
-            y -= 20
-            for subkey, subvalue in values.items():
-                pdf.drawString(50, y, f"- {subkey}: {subvalue:.2f}")
-                y -= 20
-        elif isinstance(values, list):
-            pdf.drawString(30, y, f"{key}:")
-            y -= 20
-            for value in values:
-                pdf.drawString(50, y, f"- {value}")
-                y -= 20
-        else:
-            pdf.drawString(30, y, f"{key}: {values}")
-            y -= 20
 
-    pdf.save()
-    buffer.seek(0)
-    st.download_button(label=f"Download {filename}.pdf", data=buffer, file_name=f"{filename}.pdf", mime="application/pdf")
+def balance_sheet_frame(balance_sheet):
+    return pd.DataFrame({"Type": ["Asset", "Liability", "Equity"],
+                         "Total": [balance_sheet.total_assets, balance_sheet.total_liabilities, balance_sheet.equity]})
+
+
+def workbook_sheets(app):
+    return {"Balance Sheet": balance_sheet_frame(app.generate_balance_sheet()), "Accounts": accounts_frame(app)}
 
 
 def get_app():
     if "app" not in st.session_state:
-        st.session_state.app = AccountingApp()
+        st.session_state.app = AccountingEngine()
     return st.session_state.app
 
 
@@ -114,10 +69,10 @@ def main():
     if choice == "Create Account":
         st.subheader("Create Account")
         name = st.text_input("Enter account name")
-        account_type = st.selectbox("Enter account type", ["asset", "liability", "income", "expense"])
+        account_type = st.selectbox("Enter account type", ACCOUNT_TYPES)
         initial_balance = st.number_input("Enter initial balance", min_value=0.0, step=0.01)
         if st.button("Create Account"):
-            app.create_account(name, account_type, initial_balance)
+            create_account(app, name, account_type, initial_balance)
 
     elif choice == "Record Transaction":
         st.subheader("Record Transaction")
@@ -127,23 +82,35 @@ def main():
             credit_account = st.selectbox("Select credit account", account_names)
             amount = st.number_input("Enter transaction amount", min_value=0.0, step=0.01)
             if st.button("Record Transaction"):
-                app.record_transaction(debit_account, credit_account, amount)
+                record_transaction(app, debit_account, credit_account, amount)
+
+            st.write("### Batch Upload")
+            batch_file = st.file_uploader(
+                "Upload postings (CSV with Debit Account, Credit Account and Amount columns)", type=["csv"]
+            )
+            if batch_file and st.button("Record Batch"):
+                record_batch(app, batch_file)
         else:
             st.warning("No accounts available. Please create accounts first.")
 
     elif choice == "Generate Balance Sheet":
         st.subheader("Generate Balance Sheet")
-        data, df = app.generate_balance_sheet()
+        balance_sheet = app.generate_balance_sheet()
+        df = balance_sheet_frame(balance_sheet)
         st.dataframe(df)
-        download_csv(df, "balance_sheet")
-        download_pdf(data, "Balance_Sheet")
+        download_csv(lambda: df, "balance_sheet", app.version)
+        download_pdf(balance_sheet.to_dict, "Balance_Sheet", app.version)
 
     elif choice == "List Accounts":
         st.subheader("List Accounts")
-        df = app.list_accounts()
+        df = accounts_frame(app)
         st.dataframe(df)
-        download_csv(df, "accounts")
-        download_pdf(df.to_dict(orient='list'), "Accounts")
+        download_csv(lambda: df, "accounts", app.version)
+        download_pdf(lambda: df, "Accounts", app.version)
+
+    # Rendered last so the workbook reflects anything posted in this run
+    st.sidebar.write("### Export")
+    download_xlsx(lambda: workbook_sheets(app), "accounting", app.version, container=st.sidebar)
 
 
 if __name__ == "__main__":
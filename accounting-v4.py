@@ -1,7 +1,16 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
+from ledger.backend import shared_backend
+from ledger.cache import RenderCache
+from ledger.charts import figure_png, subplots
+from ledger.consolidation import INTERCOMPANY_ELIMINATIONS, consolidate
+from ledger.exports import CSV_CHUNK_ROWS, download_xlsx, forget_download
+from ledger.importer import import_transactions
+from ledger.money import format_cents, to_dollars
+from ledger.paging import paged_dataframe
+from ledger.statements import monthly_ratios
+from ledger.store import LedgerStore
 
 # Page Configuration
 st.set_page_config(page_title="Accounting", layout="wide")
@@ -16,67 +25,194 @@ Accounting is the process of interpreting, summarizing, and analyzing financial
 """)
 st.write("This app simulates core accounting tasks with interactive tools.")
 
+DEBIT_ACCOUNTS = [
+    "Cash", "Accounts Receivable", "Inventory", "Equipment", "Rent Expense", "Salaries Expense",
+    "Due from Affiliates", "Intercompany Expense"
+]
+CREDIT_ACCOUNTS = [
+    "Cash", "Accounts Payable", "Sales Revenue", "Loans Payable", "Capital", "Retained Earnings",
+    "Due to Affiliates", "Intercompany Revenue"
+]
+
+# Each business unit (entity) keeps its own journal of (possibly compound) entries, one row per leg
+st.sidebar.title("Accounting Tools")
+entity = st.sidebar.text_input("Entity", "accounting", help="Business unit whose ledger you are working on")
+ledger_table = shared_backend().journal(entity)
+
 # Initialize Session State
+if st.session_state.get("entity", entity) != entity:
+    del st.session_state["transactions"]
+st.session_state.entity = entity
 if "transactions" not in st.session_state:
-    st.session_state.transactions = []
+    st.session_state.transactions = LedgerStore()
+    st.session_state.transactions.extend_legs(ledger_table.frame(cents=True))
+    st.session_state.transactions.restore_closes(ledger_table.closes())
 if "period_start" not in st.session_state:
-    st.session_state.period_start = datetime(2025, 1, 1)
+    st.session_state.period_start = datetime(2025, 1, 1).date()
 if "period_end" not in st.session_state:
-    st.session_state.period_end = datetime(2025, 3, 23)
+    st.session_state.period_end = datetime(2025, 3, 23).date()
+if "render_cache" not in st.session_state:
+    st.session_state.render_cache = RenderCache()
 
 # Sidebar Navigation
-st.sidebar.title("Accounting Tools")
 option = st.sidebar.selectbox(
     "Choose a Task",
-    ["Enter Transactions", "General Ledger", "Financial Statements", "Financial Analysis", "Accounting Principles"]
+    [
+        "Enter Transactions", "Import Transactions", "General Ledger", "Financial Statements", "Financial Analysis",
+        "Consolidation", "Accounting Principles"
+    ]
 )
-period_start = st.sidebar.date_input("Period Start", value=st.session_state.period_start, key="period_start")
-period_end = st.sidebar.date_input("Period End", value=st.session_state.period_end, key="period_end")
-st.session_state.period_start = period_start
-st.session_state.period_end = period_end
+# The widgets own the "period_start"/"period_end" keys, so they keep the session state in sync
+period_start = st.sidebar.date_input("Period Start", key="period_start")
+period_end = st.sidebar.date_input("Period End", key="period_end")
+
+# Closed periods are locked, so new postings start the day after the latest close
+closed_through = st.session_state.transactions.closed_through
+open_start = period_start
+if closed_through:
+    open_start = max(open_start, closed_through + timedelta(days=1))
+    st.sidebar.write(f"Books closed through {closed_through}")
+
+
+def cached(name, compute):
+    """Reuse a computed table or chart until the ledger, period or page changes."""
+    key = (entity, st.session_state.transactions.version, period_start, period_end, option, name)
+    return st.session_state.render_cache.get(key, compute)
+
+
+def build_trial_balance():
+    account_totals = st.session_state.transactions.period_totals(period_start, period_end)
+    account_totals = account_totals[(account_totals["Debit"] != 0) | (account_totals["Credit"] != 0)]
+    trial_balance_df = pd.DataFrame({
+        "Account": account_totals.index,
+        "Net Balance": to_dollars(account_totals["Debit"] - account_totals["Credit"])
+    }).reset_index(drop=True)
+    return trial_balance_df, account_totals["Debit"].sum(), account_totals["Credit"].sum()
+
+
+def workbook_sheets():
+    """Trial balance, statements and the period's ledger, one worksheet each; the ledger is streamed in chunks."""
+    transactions = st.session_state.transactions
+    statements = transactions.statements(period_start, period_end)
+    return {
+        "Trial Balance": build_trial_balance()[0],
+        "Income Statement": pd.DataFrame.from_dict(statements["Income Statement"], orient="index", columns=["Amount"]),
+        "Balance Sheet": pd.DataFrame.from_dict(statements["Balance Sheet"], orient="index").T,
+        "General Ledger": transactions.period_chunks(period_start, period_end, CSV_CHUNK_ROWS),
+    }
+
 
 # --- Enter Transactions ---
 if option == "Enter Transactions":
     st.subheader("Enter Transactions")
     st.write("Record financial events using the double-entry system.")
-
-    with st.form(key="transaction_form"):
-        date = st.date_input("Date", value=datetime(2025, 3, 23), min_value=period_start, max_value=period_end)
-        description = st.text_input("Description", "e.g., Sold goods on credit")
-        amount = st.number_input("Amount ($)", min_value=0.0, value=100.0, step=10.0)
+    if open_start > period_end:
+        st.info(f"The books are closed through {closed_through}. Choose a later period to record transactions.")
+    else:
+        default_date = max(datetime(2025, 3, 23).date(), open_start)
+        with st.form(key="transaction_form"):
+            date = st.date_input("Date", value=default_date, min_value=open_start, max_value=period_end)
+            description = st.text_input("Description", "e.g., Sold goods on credit")
+            amount = st.number_input("Amount ($)", min_value=0.0, value=100.0, step=10.0)
         
-        col1, col2 = st.columns(2)
-        with col1:
-            debit_account = st.selectbox(
-                "Debit Account",
-                ["Cash", "Accounts Receivable", "Inventory", "Equipment", "Rent Expense", "Salaries Expense"],
-                help="Account increased"
+            col1, col2 = st.columns(2)
+            with col1:
+                debit_account = st.selectbox(
+                    "Debit Account",
+                    DEBIT_ACCOUNTS,
+                    help="Account increased"
+                )
+            with col2:
+                credit_account = st.selectbox(
+                    "Credit Account",
+                    CREDIT_ACCOUNTS,
+                    help="Account decreased or source"
+                )
+        
+            submit_button = st.form_submit_button(label="Record Transaction")
+
+        if submit_button:
+            if debit_account == credit_account:
+                st.error("Debit and Credit accounts must be different!")
+            elif date < open_start or date > period_end:
+                st.error("Date must be within the selected, open period!")
+            else:
+                try:
+                    ledger_table.append_entry(date, description, [(debit_account, amount, 0.0), (credit_account, 0.0, amount)])
+                except ValueError as e:
+                    st.error(str(e))
+                else:
+                    st.session_state.transactions.append(date, description, debit_account, credit_account, amount)
+                    st.success(f"Transaction recorded: {description} for ${amount:.2f}")
+
+        # Compound entries touch more than two accounts, e.g. a payroll run or a sale with tax
+        st.write("### Compound Entry")
+        st.write("Record one entry with several debit and credit lines. Total debits must equal total credits.")
+        with st.form(key="compound_form"):
+            compound_date = st.date_input(
+                "Date", value=default_date, min_value=open_start, max_value=period_end, key="compound_date"
             )
-        with col2:
-            credit_account = st.selectbox(
-                "Credit Account",
-                ["Cash", "Accounts Payable", "Sales Revenue", "Loans Payable", "Capital", "Retained Earnings"],
-                help="Account decreased or source"
+            compound_description = st.text_input("Description", "e.g., Paid salaries and rent", key="compound_description")
+            lines = st.data_editor(
+                pd.DataFrame({
+                    "Account": ["Salaries Expense", "Rent Expense", "Cash"],
+                    "Debit": [0.0, 0.0, 0.0],
+                    "Credit": [0.0, 0.0, 0.0],
+                }),
+                num_rows="dynamic",
+                use_container_width=True,
+                column_config={
+                    "Account": st.column_config.SelectboxColumn(
+                        "Account", options=sorted(set(DEBIT_ACCOUNTS) | set(CREDIT_ACCOUNTS)), required=True
+                    ),
+                    "Debit": st.column_config.NumberColumn("Debit ($)", min_value=0.0, step=10.0),
+                    "Credit": st.column_config.NumberColumn("Credit ($)", min_value=0.0, step=10.0),
+                },
+                key="compound_lines",
             )
-        
-        submit_button = st.form_submit_button(label="Record Transaction")
+            compound_submit = st.form_submit_button(label="Record Compound Entry")
+
+        if compound_submit:
+            lines = lines.dropna(subset=["Account"]).fillna({"Debit": 0.0, "Credit": 0.0})
+            lines = lines[(lines["Debit"] != 0) | (lines["Credit"] != 0)]
+            legs = list(lines[["Account", "Debit", "Credit"]].itertuples(index=False, name=None))
+            try:
+                # Validates the entry before anything is written
+                ledger_table.append_entry(compound_date, compound_description, legs)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                st.session_state.transactions.append_entry(compound_date, compound_description, legs)
+                st.success(f"Compound entry recorded: {compound_description} ({len(legs)} lines, ${lines['Debit'].sum():.2f})")
+
+# --- Import Transactions ---
+elif option == "Import Transactions":
+    st.subheader("Import Transactions")
+    st.write("Bulk-load journal lines from a CSV or Parquet file (e.g., bank or subledger exports).")
+    st.write("Required columns: **Date**, **Debit Account**, **Credit Account**, **Amount**. **Description** is optional.")
 
-    if submit_button:
-        if debit_account == credit_account:
-            st.error("Debit and Credit accounts must be different!")
-        elif date < period_start or date > period_end:
-            st.error("Date must be within the selected period!")
+    uploaded_file = st.file_uploader("Upload journal file", type=["csv", "parquet"])
+    if uploaded_file and st.button("Import"):
+        known_accounts = sorted(set(DEBIT_ACCOUNTS) | set(CREDIT_ACCOUNTS))
+        try:
+            imported, rejected = import_transactions(
+                st.session_state.transactions, uploaded_file, uploaded_file.name,
+                open_start, period_end, known_accounts, table=ledger_table
+            )
+        except ValueError as e:
+            st.error(f"Error importing file: {str(e)}")
         else:
-            transaction = {
-                "Date": date,
-                "Description": description,
-                "Debit Account": debit_account,
-                "Debit Amount": amount,
-                "Credit Account": credit_account,
-                "Credit Amount": amount
-            }
-            st.session_state.transactions.append(transaction)
-            st.success(f"Transaction recorded: {description} for ${amount:.2f}")
+            st.success(f"Imported {imported} transactions.")
+            if len(rejected):
+                st.warning(f"{len(rejected)} rows were rejected.")
+                st.write(rejected["Reason"].value_counts())
+                st.dataframe(rejected.head(1000))
+                st.download_button(
+                    label="Download Rejected Rows",
+                    data=rejected.to_csv(index=False).encode("utf-8"),
+                    file_name="rejected_rows.csv",
+                    mime="text/csv"
+                )
 
 # --- General Ledger ---
 elif option == "General Ledger":
@@ -84,28 +220,21 @@ elif option == "General Ledger":
     st.write("View all transactions recorded in the accounting period.")
 
     if st.session_state.transactions:
-        ledger_df = pd.DataFrame(st.session_state.transactions)
-        filtered_df = ledger_df[
-            (ledger_df["Date"] >= period_start) & (ledger_df["Date"] <= period_end)
-        ]
-        st.dataframe(filtered_df)
+        paged_dataframe(
+            lambda *page: st.session_state.transactions.page(period_start, period_end, *page),
+            "ledger", ["Date", "Entry", "Description", "Account", "Debit", "Credit"],
+            {"Account": st.session_state.transactions.account_names}
+        )
 
         # Trial Balance
         st.write("### Trial Balance")
-        accounts = {}
-        for entry in filtered_df.to_dict("records"):
-            debit_acc = entry["Debit Account"]
-            credit_acc = entry["Credit Account"]
-            accounts[debit_acc] = accounts.get(debit_acc, 0) + entry["Debit Amount"]
-            accounts[credit_acc] = accounts.get(credit_acc, 0) - entry["Credit Amount"]
-        
-        trial_balance_df = pd.DataFrame(list(accounts.items()), columns=["Account", "Net Balance"])
-        total_debits = filtered_df["Debit Amount"].sum()
-        total_credits = filtered_df["Credit Amount"].sum()
+
+        # Totals are int cents, so the balance check is exact
+        trial_balance_df, total_debits, total_credits = cached("trial_balance", build_trial_balance)
         st.table(trial_balance_df)
-        st.write(f"**Total Debits**: ${total_debits:.2f}")
-        st.write(f"**Total Credits**: ${total_credits:.2f}")
-        if abs(total_debits - total_credits) < 0.01:
+        st.write(f"**Total Debits**: ${format_cents(total_debits)}")
+        st.write(f"**Total Credits**: ${format_cents(total_credits)}")
+        if total_debits == total_credits:
             st.success("Trial Balance is balanced!")
         else:
             st.error("Trial Balance is not balanced!")
@@ -118,20 +247,13 @@ elif option == "Financial Statements":
     st.write("Generate key financial reports based on recorded transactions.")
 
     if st.session_state.transactions:
-        ledger_df = pd.DataFrame(st.session_state.transactions)
-        filtered_df = ledger_df[
-            (ledger_df["Date"] >= period_start) & (ledger_df["Date"] <= period_end)
-        ]
+        statements = st.session_state.transactions.statements(period_start, period_end)
 
         # Income Statement
         st.write("### Income Statement")
-        revenue = filtered_df[filtered_df["Credit Account"] == "Sales Revenue"]["Credit Amount"].sum()
-        expenses = filtered_df[
-            filtered_df["Debit Account"].isin(["Rent Expense", "Salaries Expense"])
-        ]["Debit Amount"].sum()
-        net_income = revenue - expenses
-        income_data = {"Revenue": revenue, "Expenses": expenses, "Net Income": net_income}
-        income_df = pd.DataFrame.from_dict(income_data, orient="index", columns=["Amount"])
+        income_data = statements["Income Statement"]
+        net_income = income_data["Net Income"]
+        income_df = cached("income_table", lambda: pd.DataFrame.from_dict(income_data, orient="index", columns=["Amount"]))
         st.table(income_df)
         st.write(f"Period: {period_start} to {period_end}")
         if net_income > 0:
@@ -141,48 +263,51 @@ elif option == "Financial Statements":
 
         # Balance Sheet
         st.write("### Balance Sheet")
-        cash = (
-            filtered_df[filtered_df["Debit Account"] == "Cash"]["Debit Amount"].sum() -
-            filtered_df[filtered_df["Credit Account"] == "Cash"]["Credit Amount"].sum()
-        )
-        accounts_receivable = filtered_df[filtered_df["Debit Account"] == "Accounts Receivable"]["Debit Amount"].sum()
-        inventory = filtered_df[filtered_df["Debit Account"] == "Inventory"]["Debit Amount"].sum()
-        equipment = filtered_df[filtered_df["Debit Account"] == "Equipment"]["Debit Amount"].sum()
-        total_assets = cash + accounts_receivable + inventory + equipment
-
-        accounts_payable = filtered_df[filtered_df["Credit Account"] == "Accounts Payable"]["Credit Amount"].sum()
-        loans_payable = filtered_df[filtered_df["Credit Account"] == "Loans Payable"]["Credit Amount"].sum()
-        total_liabilities = accounts_payable + loans_payable
-
-        capital = filtered_df[filtered_df["Credit Account"] == "Capital"]["Credit Amount"].sum()
-        retained_earnings = net_income  # Simplified: assumes no prior retained earnings
-        total_equity = capital + retained_earnings
-
-        balance_data = {
-            "Assets": {"Cash": cash, "Accounts Receivable": accounts_receivable, "Inventory": inventory, "Equipment": equipment, "Total Assets": total_assets},
-            "Liabilities": {"Accounts Payable": accounts_payable, "Loans Payable": loans_payable, "Total Liabilities": total_liabilities},
-            "Equity": {"Capital": capital, "Retained Earnings": retained_earnings, "Total Equity": total_equity}
-        }
-        balance_df = pd.DataFrame.from_dict(balance_data, orient="index").T
+        balance_data = statements["Balance Sheet"]
+        total_assets = balance_data["Assets"]["Total Assets"]
+        total_liabilities = balance_data["Liabilities"]["Total Liabilities"]
+        total_equity = balance_data["Equity"]["Total Equity"]
+        balance_df = cached("balance_table", lambda: pd.DataFrame.from_dict(balance_data, orient="index").T)
         st.table(balance_df)
         st.write(f"As of: {period_end}")
-        if abs(total_assets - (total_liabilities + total_equity)) < 0.01:
+        if statements["Balance Sheet Balances"]:
             st.success("Balance Sheet balances!")
         else:
             st.error("Balance Sheet does not balance!")
 
         # Visualization
         st.write("### Visualization")
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 5))
-        income_df.plot(kind="bar", ax=ax1, color="#4CAF50")
-        ax1.set_title("Income Statement")
-        ax1.set_ylabel("Amount ($)")
-        balance_totals = [total_assets, total_liabilities, total_equity]
-        ax2.bar(["Assets", "Liabilities", "Equity"], balance_totals, color=["#4CAF50", "#FF5722", "#2196F3"])
-        ax2.set_title("Balance Sheet")
-        ax2.set_ylabel("Amount ($)")
-        plt.tight_layout()
-        st.pyplot(fig)
+
+        def draw_statements():
+            fig, (ax1, ax2) = subplots(1, 2, figsize=(10, 5))
+            income_df.plot(kind="bar", ax=ax1, color="#4CAF50")
+            ax1.set_title("Income Statement")
+            ax1.set_ylabel("Amount ($)")
+            balance_totals = [total_assets, total_liabilities, total_equity]
+            ax2.bar(["Assets", "Liabilities", "Equity"], balance_totals, color=["#4CAF50", "#FF5722", "#2196F3"])
+            ax2.set_title("Balance Sheet")
+            ax2.set_ylabel("Amount ($)")
+            fig.tight_layout()
+            return figure_png(fig)
+
+        st.image(cached("statements_chart", draw_statements), use_column_width=True)
+
+        # Period Close
+        st.write("### Period Close")
+        st.write(
+            "Closing the books snapshots every account's balance and rolls revenue and expenses into "
+            "Retained Earnings. Later balance sheets start from the snapshot, and the closed period is locked."
+        )
+        if closed_through and closed_through >= period_end:
+            st.info(f"The books are closed through {closed_through}.")
+        elif st.button(f"Close Books Through {period_end}"):
+            try:
+                ledger_table.close_period(period_end)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                st.session_state.transactions.close_period(period_end)
+                st.success(f"Books closed through {period_end}.")
     else:
         st.write("Record transactions to generate statements.")
 
@@ -192,41 +317,110 @@ elif option == "Financial Analysis":
     st.write("Analyze financial data for insights.")
 
     if st.session_state.transactions:
-        ledger_df = pd.DataFrame(st.session_state.transactions)
-        filtered_df = ledger_df[
-            (ledger_df["Date"] >= period_start) & (ledger_df["Date"] <= period_end)
-        ]
-
-        revenue = filtered_df[filtered_df["Credit Account"] == "Sales Revenue"]["Credit Amount"].sum()
-        expenses = filtered_df[
-            filtered_df["Debit Account"].isin(["Rent Expense", "Salaries Expense"])
-        ]["Debit Amount"].sum()
-        net_income = revenue - expenses
-        total_assets = (
-            filtered_df[filtered_df["Debit Account"] == "Cash"]["Debit Amount"].sum() -
-            filtered_df[filtered_df["Credit Account"] == "Cash"]["Credit Amount"].sum()
-        ) + filtered_df[filtered_df["Debit Account"] == "Accounts Receivable"]["Debit Amount"].sum() + \
-            filtered_df[filtered_df["Debit Account"] == "Inventory"]["Debit Amount"].sum() + \
-            filtered_df[filtered_df["Debit Account"] == "Equipment"]["Debit Amount"].sum()
+        ratios = st.session_state.transactions.statements(period_start, period_end)["Ratios"]
 
         # Key Metrics
         st.write("### Key Metrics")
-        profit_margin = (net_income / revenue * 100) if revenue > 0 else 0
+        profit_margin = ratios["Profit Margin"]
         st.write(f"**Profit Margin**: {profit_margin:.2f}% (Net Income / Revenue)")
-        return_on_assets = (net_income / total_assets * 100) if total_assets > 0 else 0
+        return_on_assets = ratios["Return on Assets"]
         st.write(f"**Return on Assets (ROA)**: {return_on_assets:.2f}% (Net Income / Total Assets)")
 
         # Trend Visualization (Simplified)
         st.write("### Transaction Trend")
-        daily_totals = filtered_df.groupby("Date")["Debit Amount"].sum()
-        fig, ax = plt.subplots()
-        daily_totals.plot(kind="line", ax=ax, marker="o", color="#2196F3")
-        ax.set_title("Daily Transaction Totals")
-        ax.set_ylabel("Amount ($)")
-        st.pyplot(fig)
+
+        def draw_trend():
+            # Served from the daily rollup, so the cost follows the number of days, not transactions
+            daily_debits, _ = st.session_state.transactions.rollup(period_start, period_end)
+            daily_totals = to_dollars(daily_debits.sum(axis=1))
+            daily_totals = daily_totals[daily_totals != 0]
+            fig, ax = subplots()
+            daily_totals.plot(kind="line", ax=ax, marker="o", color="#2196F3")
+            ax.set_title("Daily Transaction Totals")
+            ax.set_ylabel("Amount ($)")
+            return figure_png(fig)
+
+        st.image(cached("trend_chart", draw_trend), use_column_width=True)
+
+        # Monthly Ratios
+        st.write("### Monthly Ratios")
+
+        def compute_monthly_ratios():
+            store = st.session_state.transactions
+            monthly_debits, monthly_credits = store.rollup(period_start, period_end, freq="M")
+            opening = store.balances(period_start - timedelta(days=1))
+            return monthly_ratios(store.chart, monthly_debits, monthly_credits, opening)
+
+        ratios_df = cached("monthly_ratios", compute_monthly_ratios)
+
+        def draw_ratios():
+            fig, ax = subplots()
+            ratios_df[["Profit Margin", "Return on Assets"]].plot(kind="line", ax=ax, marker="o")
+            ax.set_title("Profit Margin and ROA by Month")
+            ax.set_ylabel("Percent (%)")
+            return figure_png(fig)
+
+        st.image(cached("ratio_chart", draw_ratios), use_column_width=True)
+        st.dataframe(ratios_df.rename(index=lambda month: month.strftime("%Y-%m")))
     else:
         st.write("No data for analysis. Add transactions first.")
 
+# --- Consolidation ---
+elif option == "Consolidation":
+    st.subheader("Consolidation")
+    st.write(
+        "Combine the statements of several entities. Each entity is computed in its own process, "
+        "then reciprocal intercompany balances are eliminated."
+    )
+
+    entities = st.multiselect("Entities", shared_backend().journals(), default=shared_backend().journals())
+    account_options = shared_backend().chart.names
+    rules = st.data_editor(
+        pd.DataFrame(INTERCOMPANY_ELIMINATIONS, columns=["Debit Account", "Credit Account"]),
+        num_rows="dynamic",
+        use_container_width=True,
+        column_config={
+            "Debit Account": st.column_config.SelectboxColumn("Debit Account", options=account_options, required=True),
+            "Credit Account": st.column_config.SelectboxColumn("Credit Account", options=account_options, required=True),
+        },
+        key="elimination_rules",
+    )
+
+    if st.button("Consolidate"):
+        eliminations = list(rules.dropna().itertuples(index=False, name=None))
+        try:
+            consolidated = consolidate(shared_backend(), entities, period_start, period_end, eliminations)
+        except ValueError as e:
+            st.error(str(e))
+        else:
+            statements = consolidated["Consolidated"]
+            st.write("### Consolidated Income Statement")
+            st.table(pd.DataFrame.from_dict(statements["Income Statement"], orient="index", columns=["Amount"]))
+            st.write(f"Period: {period_start} to {period_end}")
+
+            st.write("### Consolidated Balance Sheet")
+            st.table(pd.DataFrame.from_dict(statements["Balance Sheet"], orient="index").T)
+            st.write(f"As of: {period_end}")
+            if statements["Balance Sheet Balances"]:
+                st.success("Consolidated Balance Sheet balances!")
+            else:
+                st.error("Consolidated Balance Sheet does not balance!")
+
+            st.write("### Intercompany Eliminations")
+            st.dataframe(consolidated["Eliminations"])
+            if (consolidated["Eliminations"]["Unmatched"] != 0).any():
+                st.warning("Some intercompany balances do not match between entities.")
+
+            st.write("### By Entity")
+            st.dataframe(pd.DataFrame({
+                name: {
+                    "Net Income": entity_statements["Income Statement"]["Net Income"],
+                    "Total Assets": entity_statements["Balance Sheet"]["Assets"]["Total Assets"],
+                    "Balances": entity_statements["Balance Sheet Balances"],
+                }
+                for name, entity_statements in consolidated["Entities"].items()
+            }).T)
+
 # --- Accounting Principles ---
 elif option == "Accounting Principles":
     st.subheader("Accounting Principles")
@@ -247,8 +441,18 @@ st.sidebar.write("**Sample Transactions:**")
 st.sidebar.write("- Debit Cash $1,000, Credit Sales Revenue $1,000 (Cash sale)")
 st.sidebar.write("- Debit Rent Expense $300, Credit Cash $300 (Rent payment)")
 if st.sidebar.button("Reset Transactions"):
-    st.session_state.transactions = []
+    ledger_table.clear()
+    st.session_state.transactions = LedgerStore()
+    st.session_state.render_cache.clear()
+    forget_download(f"{entity}_books.xlsx")
     st.sidebar.success("Transactions reset!")
 
+# Workbook Export
+st.sidebar.write("**Export:**")
+download_xlsx(
+    workbook_sheets, f"{entity}_books",
+    (st.session_state.transactions.version, period_start, period_end), container=st.sidebar
+)
+
 # Footer
 st.write("Built with Streamlit by Nathan Rossow at (Burst Software)")
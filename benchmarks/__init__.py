@@ -0,0 +1 @@
+"""Headless startup and rerun-latency benchmarks for the Streamlit apps."""
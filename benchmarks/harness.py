@@ -0,0 +1,167 @@
+import threading
+import time
+
+from streamlit.proto.ClientState_pb2 import ClientState
+from streamlit.proto.WidgetStates_pb2 import WidgetStates
+from streamlit.runtime import Runtime, RuntimeConfig
+from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+from streamlit.runtime.scriptrunner import RerunData, ScriptRunner, ScriptRunnerEvent
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.runtime.state.session_state import SessionState
+from streamlit.runtime.uploaded_file_manager import UploadedFileManager
+from streamlit.testing.element_tree import parse_tree_from_messages
+
+try:
+    from streamlit.testing.v1 import AppTest
+except ImportError:
+    # AppTest arrived in streamlit 1.28; requirements.txt pins 1.25
+    AppTest = None
+
+STOPPED_EVENTS = (
+    ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS,
+    ScriptRunnerEvent.SCRIPT_STOPPED_WITH_COMPILE_ERROR,
+    ScriptRunnerEvent.SCRIPT_STOPPED_FOR_RERUN,
+)
+
+
+def open_session(script_path, timeout=600):
+    """Return a headless session for `script_path`, using AppTest when streamlit provides it."""
+    if AppTest is not None:
+        return AppTestSession(script_path, timeout)
+    return ScriptSession(script_path, timeout)
+
+
+def _ensure_runtime(script_path):
+    # Caching, st.image and st.cache_resource look up the Runtime singleton;
+    # an unstarted Runtime with in-memory storage is enough for headless runs.
+    if not Runtime.exists():
+        Runtime(RuntimeConfig(
+            script_path=script_path,
+            command_line=None,
+            media_file_storage=MemoryMediaFileStorage("/media"),
+            cache_storage_manager=MemoryCacheStorageManager(),
+        ))
+
+
+class ScriptSession:
+    """
+    One browser-less session of a Streamlit script.
+
+    Every `run` executes the script once with a fresh ScriptRunner over the
+    same SessionState, the way a browser session reruns it, and returns the
+    script's own wall time measured from its start/stop events.
+    """
+
+    def __init__(self, script_path, timeout=600):
+        _ensure_runtime(script_path)
+        self.script_path = script_path
+        self.timeout = timeout
+        self.session_state = SessionState()
+        self._uploaded_file_mgr = UploadedFileManager()
+        self._script_cache = ScriptCache()
+        self.tree = None
+
+    def run(self, widget_states=None):
+        messages = []
+        times = {}
+        shutdown = threading.Event()
+
+        def on_event(sender, event, **kwargs):
+            if event == ScriptRunnerEvent.SCRIPT_STARTED:
+                times["start"] = time.perf_counter()
+            elif event in STOPPED_EVENTS:
+                times["stop"] = time.perf_counter()
+            elif event == ScriptRunnerEvent.ENQUEUE_FORWARD_MSG:
+                messages.append(kwargs["forward_msg"])
+            elif event == ScriptRunnerEvent.SHUTDOWN:
+                shutdown.set()
+
+        runner = ScriptRunner(
+            session_id="benchmark",
+            main_script_path=self.script_path,
+            client_state=ClientState(),
+            session_state=self.session_state,
+            uploaded_file_mgr=self._uploaded_file_mgr,
+            script_cache=self._script_cache,
+            initial_rerun_data=RerunData(widget_states=widget_states),
+            user_info={"email": "benchmark@example.com"},
+        )
+        runner.on_event.connect(on_event, weak=False)
+        runner.start()
+        if not shutdown.wait(self.timeout):
+            runner.request_stop()
+            raise TimeoutError(f"{self.script_path} did not finish within {self.timeout}s")
+
+        self.tree = parse_tree_from_messages(messages)
+        self.tree.script_path = self.script_path
+        self.tree._session_state = self.session_state
+        return times["stop"] - times["start"]
+
+    def exceptions(self):
+        return [exception.value for exception in self.tree.get("exception")]
+
+    def options(self, label):
+        return list(self._widget(label).options)
+
+    def select(self, label, value):
+        """Set the selectbox/radio called `label` to `value` and rerun."""
+        widget = self._widget(label)
+        widget.set_value(value)
+        return self.run(self._widget_states(widget.widget_state()))
+
+    def rerun(self):
+        """Rerun with the current widget values, as any widget interaction would."""
+        return self.run(self._widget_states())
+
+    def _widget_states(self, changed=None):
+        # Taken from the session rather than the element tree, which cannot
+        # serialize selectboxes that use a format_func in this streamlit version
+        states = WidgetStates()
+        for state in self.session_state.get_widget_states():
+            if changed is None or state.id != changed.id:
+                states.widgets.append(state)
+        if changed is not None:
+            states.widgets.append(changed)
+        return states
+
+    def _widget(self, label):
+        for widget in self.tree.get("selectbox") + self.tree.get("radio"):
+            if widget.label == label:
+                return widget
+        raise LookupError(f"No selectbox or radio labelled {label!r} in {self.script_path}")
+
+
+class AppTestSession:
+    """The ScriptSession interface on top of streamlit.testing.v1.AppTest."""
+
+    def __init__(self, script_path, timeout=600):
+        self.script_path = script_path
+        self.app = AppTest.from_file(script_path, default_timeout=timeout)
+        self.session_state = self.app.session_state
+
+    def run(self):
+        start = time.perf_counter()
+        self.app.run()
+        return time.perf_counter() - start
+
+    def exceptions(self):
+        return [exception.value for exception in self.app.exception]
+
+    def options(self, label):
+        return list(self._widget(label).options)
+
+    def select(self, label, value):
+        widget = self._widget(label)
+        start = time.perf_counter()
+        widget.set_value(value).run()
+        return time.perf_counter() - start
+
+    def rerun(self):
+        return self.run()
+
+    def _widget(self, label):
+        for widget in list(self.app.selectbox) + list(self.app.radio):
+            if widget.label == label:
+                return widget
+        raise LookupError(f"No selectbox or radio labelled {label!r} in {self.script_path}")
@@ -0,0 +1,181 @@
+"""
+Startup and rerun-latency benchmarks for the Streamlit apps.
+
+    python -m benchmarks.run                         # every app, 1k..1M records
+    python -m benchmarks.run --apps accounting-v4.py --sizes 1000 10000
+    python -m benchmarks.run --baseline old.json     # flag pages that got slower
+
+Each (app, size) runs in its own Python process so that the cold start and the
+peak RSS belong to that app alone. The worker runs the script once with empty
+state (cold start), seeds the synthetic records, then visits every sidebar page
+and reruns it; the results are written to a JSON report.
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+# script -> (page widget label, seeder name in benchmarks.seed); apps without
+# a seeder keep no records and are measured once with size 0
+APPS = {
+    "12-Month-Cash-Flow-v1.py": (None, None),
+    "12-Month-Cash-Flow-v2.py": ("Select Month", None),
+    "accounting-basics-principles.py": ("Choose a Topic", None),
+    "accounting-v1.py": ("Menu", None),
+    "accounting-v2.py": ("Menu", "seed_accounting_app"),
+    "accounting-v3.py": ("Menu", "seed_accounting_app"),
+    "accounting-v4.py": ("Choose a Task", "seed_accounting_v4"),
+    "bookkeeping-v1.py": ("Choose an Action", "seed_bookkeeping"),
+    "bookkeeping-vs-accounting-v1.py": (None, "seed_bookkeeping_vs_accounting"),
+    "credit-instrument-accounting-v1.py": ("Choose a Task", "seed_credit_instrument"),
+    "debit-instrument-accounting-v1.py": ("Choose a Task", "seed_debit_instrument"),
+    "double-entry-system-v1.py": (None, "seed_double_entry"),
+    "financial-statements-v1.py": (None, None),
+    "loan-underwriting-v1.py": ("Choose a Task", "seed_loan_underwriting"),
+    "payroll-accounting-v1.py": ("Choose a Task", "seed_payroll"),
+    "private-lending-evaluation-v1.py": ("Choose a Task", "seed_private_lending"),
+    "profit-and-loss-statement-v1.py": ("Choose a Task", "seed_profit_and_loss"),
+}
+
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure(script, size, repeat):
+    """Benchmark one app at one size inside the current (fresh) process."""
+    started = time.perf_counter()
+    from benchmarks.harness import open_session
+
+    path = os.path.join(ROOT, script)
+    label, seeder = APPS[script]
+    result = {"app": script, "records": size}
+
+    session = open_session(path)
+    session.run()
+    result["cold_start_s"] = time.perf_counter() - started
+
+    from benchmarks import seed
+
+    session = open_session(path)
+    if seeder is not None:
+        seed_started = time.perf_counter()
+        getattr(seed, seeder)(session, size)
+        result["seed_s"] = time.perf_counter() - seed_started
+    result["first_run_s"] = session.run()
+
+    pages = session.options(label) if label else [None]
+    result["pages"] = {}
+    exceptions = set(session.exceptions())
+    for page in pages:
+        first = session.select(label, page) if page is not None else session.rerun()
+        reruns = [session.rerun() for _ in range(repeat)]
+        exceptions.update(session.exceptions())
+        result["pages"][page or "(main)"] = {
+            "first_s": first,
+            "rerun_median_s": statistics.median(reruns) if reruns else first,
+            "rerun_max_s": max(reruns) if reruns else first,
+        }
+    result["peak_rss_mb"] = peak_rss_mb()
+    result["exceptions"] = sorted(exceptions)
+    return result
+
+
+def run_worker(script, size, repeat, timeout):
+    """Run `measure` in a child process with its own ledger database."""
+    with tempfile.TemporaryDirectory() as workdir:
+        env = dict(os.environ, LEDGER_DB=os.path.join(workdir, "ledger.db"), PYTHONPATH=ROOT)
+        command = [sys.executable, "-m", "benchmarks.run", "--worker", script, str(size), "--repeat", str(repeat)]
+        try:
+            completed = subprocess.run(
+                command, cwd=ROOT, env=env, capture_output=True, text=True, timeout=timeout
+            )
+        except subprocess.TimeoutExpired:
+            return {"app": script, "records": size, "error": f"timed out after {timeout}s"}
+    if completed.returncode != 0:
+        return {"app": script, "records": size, "error": completed.stderr.strip().splitlines()[-1:]}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def compare(report, baseline, threshold):
+    """Return one line per page whose median rerun slowed down by more than `threshold` (0.2 = 20%)."""
+    previous = {
+        (result["app"], result["records"], page): timings["rerun_median_s"]
+        for result in baseline["results"] if "pages" in result
+        for page, timings in result["pages"].items()
+    }
+    regressions = []
+    for result in report["results"]:
+        for page, timings in result.get("pages", {}).items():
+            before = previous.get((result["app"], result["records"], page))
+            if before and timings["rerun_median_s"] > before * (1 + threshold):
+                regressions.append(
+                    f"{result['app']} [{result['records']} records] {page}: "
+                    f"{before * 1000:.1f} ms -> {timings['rerun_median_s'] * 1000:.1f} ms"
+                )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark startup and rerun latency of the Streamlit apps.")
+    parser.add_argument("--apps", nargs="+", default=sorted(APPS), choices=sorted(APPS), metavar="SCRIPT")
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--repeat", type=int, default=3, help="reruns per page after the first visit")
+    parser.add_argument("--timeout", type=int, default=1800, help="seconds allowed per app and size")
+    parser.add_argument("--output", default="benchmark-report.json")
+    parser.add_argument("--baseline", help="earlier report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="slowdown reported as a regression")
+    parser.add_argument("--worker", nargs=2, metavar=("SCRIPT", "SIZE"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        script, size = args.worker
+        print(json.dumps(measure(script, int(size), args.repeat)))
+        return 0
+
+    import streamlit
+
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": [],
+    }
+    for script in args.apps:
+        sizes = args.sizes if APPS[script][1] else [0]
+        for size in sizes:
+            result = run_worker(script, size, args.repeat, args.timeout)
+            report["results"].append(result)
+            status = result.get("error") or f"cold {result['cold_start_s']:.2f}s, peak {result['peak_rss_mb']:.0f} MB"
+            print(f"{script} [{size} records]: {status}", flush=True)
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Report written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
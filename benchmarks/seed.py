@@ -0,0 +1,196 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from ledger.accounts import ACCOUNT_TYPES, ChartOfAccounts
+from ledger.backend import open_backend
+from ledger.engine import AccountingEngine
+from ledger.records import SortedRecords
+
+# Dates fall inside the apps' default periods (2025-01-01 .. 2025-03-23)
+FIRST_DAY = date(2025, 1, 1)
+DAYS = 82
+EVALUATION_DATE = date(2025, 3, 23)
+
+DEBIT_ACCOUNTS = ["Cash", "Accounts Receivable", "Inventory", "Equipment", "Rent Expense", "Salaries Expense"]
+CREDIT_ACCOUNTS = ["Cash", "Accounts Payable", "Sales Revenue", "Loans Payable", "Capital", "Retained Earnings"]
+
+
+def _dates(rng, n):
+    """n sorted dates spread over the default period, as datetime.date objects."""
+    offsets = np.sort(rng.integers(0, DAYS, n))
+    calendar = [FIRST_DAY + timedelta(days=int(day)) for day in range(DAYS)]
+    return [calendar[offset] for offset in offsets]
+
+
+def _amounts(rng, n, low=10, high=5000):
+    return np.round(rng.uniform(low, high, n), 2)
+
+
+def journal(n, seed=0):
+    """Synthetic two-account journal lines with distinct debit and credit accounts."""
+    rng = np.random.default_rng(seed)
+    debit = rng.integers(0, len(DEBIT_ACCOUNTS), n)
+    credit = rng.integers(0, len(CREDIT_ACCOUNTS), n)
+    debit_accounts = np.array(DEBIT_ACCOUNTS, dtype=object)[debit]
+    credit_accounts = np.array(CREDIT_ACCOUNTS, dtype=object)[credit]
+    # Cash on both sides is not a valid entry; move the credit to Sales Revenue
+    credit_accounts[debit_accounts == credit_accounts] = "Sales Revenue"
+    return pd.DataFrame({
+        "Date": _dates(rng, n),
+        "Description": [f"Synthetic entry {i}" for i in range(n)],
+        "Debit Account": debit_accounts,
+        "Credit Account": credit_accounts,
+        "Amount": _amounts(rng, n),
+    })
+
+
+def _records(frame):
+    return frame.to_dict("records")
+
+
+# --- Per-app seeders: seed(session, n) loads n synthetic records before the measured runs ---
+
+def seed_accounting_v4(session, n):
+    table = open_backend().journal("accounting")
+    table.clear()
+    table.append_frame(journal(n))
+
+
+def seed_bookkeeping(session, n):
+    frame = journal(n)
+    rng = np.random.default_rng(1)
+    frame["Type"] = rng.choice(["Income", "Expense", "Asset Purchase", "Liability Payment"], n)
+    frame["Category"] = rng.choice(["Sales", "Operating Expenses", "Capital Expenditure"], n)
+    table = open_backend().table(
+        "bookkeeping", ["Date", "Description", "Type", "Amount", "Debit Account", "Credit Account", "Category"]
+    )
+    table.clear()
+    table.append_frame(frame)
+
+
+def seed_double_entry(session, n):
+    table = open_backend().journal("double-entry", dated=False)
+    table.clear()
+    table.append_frame(journal(n))
+
+
+def seed_bookkeeping_vs_accounting(session, n):
+    frame = journal(n).drop(columns="Date")
+    frame.insert(0, "Date", EVALUATION_DATE)
+    frame["Type"] = np.random.default_rng(1).choice(["Income", "Expense", "Asset Purchase", "Liability Payment"], n)
+    chart = ChartOfAccounts()
+    for field in ("Debit Account", "Credit Account"):
+        frame[field] = chart.codes(frame[field])
+    session.session_state["bookkeeping_ledger"] = _records(frame)
+
+
+def _instrument_transactions(n, types, seed=0):
+    rng = np.random.default_rng(seed)
+    records = SortedRecords(columns=["Date", "Type", "Description", "Amount", "Balance After"])
+    frame = pd.DataFrame({
+        "Date": _dates(rng, n),
+        "Type": rng.choice(types, n),
+        "Description": [f"Synthetic transaction {i}" for i in range(n)],
+        "Amount": _amounts(rng, n, 5, 500),
+        "Balance After": 0.0,
+    })
+    records.extend(_records(frame))
+    return records
+
+
+def seed_credit_instrument(session, n):
+    session.session_state["credit_instrument"] = {"Type": "Credit Card", "Interest Rate": 0.18, "Opening Balance": 0.0}
+    session.session_state["credit_transactions"] = _instrument_transactions(
+        n, ["Charge (Debit)", "Repayment (Credit)", "Interest Charge"]
+    )
+
+
+def seed_debit_instrument(session, n):
+    session.session_state["debit_instrument"] = {
+        "Type": "Checking Account", "Overdraft Limit": 500.0, "Starting Balance": 10000.0
+    }
+    session.session_state["debit_transactions"] = _instrument_transactions(
+        n, ["Withdrawal (Debit)", "Deposit (Credit)", "Bank Fee"]
+    )
+
+
+def seed_profit_and_loss(session, n):
+    rng = np.random.default_rng(0)
+    for key, categories in (("revenues", ["Sales", "Services"]), ("expenses", ["Operating Expenses", "Cost of Goods Sold"])):
+        records = SortedRecords(columns=["Date", "Description", "Amount", "Category"])
+        records.extend(_records(pd.DataFrame({
+            "Date": _dates(rng, n // 2),
+            "Description": [f"Synthetic {key[:-1]} {i}" for i in range(n // 2)],
+            "Amount": _amounts(rng, n // 2),
+            "Category": rng.choice(categories, n // 2),
+        })))
+        session.session_state[key] = records
+
+
+def seed_payroll(session, n):
+    rng = np.random.default_rng(0)
+    starts = _dates(rng, n)
+    gross = _amounts(rng, n, 500, 6000)
+    federal = np.round(gross * 0.15, 2)
+    state = np.round(gross * 0.05, 2)
+    records = SortedRecords(date_key="Pay Period Start")
+    records.extend(_records(pd.DataFrame({
+        "Employee ID": [f"EMP{i % 500:03d}" for i in range(n)],
+        "Name": [f"Employee {i % 500}" for i in range(n)],
+        "Gross Pay": gross,
+        "Federal Tax": federal,
+        "State Tax": state,
+        "Insurance": 50.0,
+        "Net Pay": np.round(gross - federal - state - 50.0, 2),
+        "Employer Taxes": np.round(gross * 0.0765, 2),
+        "Pay Period Start": starts,
+        "Pay Period End": [start + timedelta(days=13) for start in starts],
+    })))
+    session.session_state["payroll_records"] = records
+
+
+def _applications(n, seed=0):
+    rng = np.random.default_rng(seed)
+    amounts = _amounts(rng, n, 1000, 400000)
+    rates = rng.uniform(0.03, 0.08, n)
+    terms = rng.choice([5, 15, 30], n)
+    return pd.DataFrame({
+        "Applicant ID": [f"APP{i:07d}" for i in range(n)],
+        "Name": [f"Applicant {i}" for i in range(n)],
+        "Monthly Income": _amounts(rng, n, 2000, 20000),
+        "Existing Debt Payments": _amounts(rng, n, 0, 3000),
+        "Credit Score": rng.integers(300, 851, n),
+        "Loan Amount": amounts,
+        "Interest Rate": rates,
+        "Monthly Payment": np.round(amounts * (rates / 12) / (1 - (1 + rates / 12) ** (-terms * 12)), 2),
+        "Date Submitted": EVALUATION_DATE,
+        "Term (Years)": terms,
+    })
+
+
+def seed_loan_underwriting(session, n):
+    frame = _applications(n)
+    rng = np.random.default_rng(1)
+    frame["Loan Type"] = rng.choice(["Housing Loan", "Car Loan", "Additional Loan"], n)
+    frame["Asset Value"] = np.round(frame["Loan Amount"] * 1.25, 2)
+    frame["Status"] = rng.choice(["Pending", "Approve", "Deny"], n)
+    session.session_state["applications"] = _records(frame)
+
+
+def seed_private_lending(session, n):
+    frame = _applications(n).rename(columns={"Term (Years)": "Loan Term"})
+    frame["Status"] = np.random.default_rng(1).choice(["Pending", "Approved", "Denied"], n)
+    session.session_state["loan_applications"] = _records(frame)
+
+
+def seed_accounting_app(session, n):
+    """accounting-v2/v3 keep an AccountingEngine in session state; fill it with n accounts."""
+    rng = np.random.default_rng(0)
+    types = rng.choice(ACCOUNT_TYPES, n)
+    balances = _amounts(rng, n)
+    app = AccountingEngine()
+    for i, (account_type, balance) in enumerate(zip(types, balances)):
+        app.create_account(f"Account {i}", account_type, balance)
+    session.session_state["app"] = app
@@ -1,7 +1,9 @@
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
+from ledger.backend import shared_backend
+from ledger.charts import png_chart, subplots
+from ledger.money import format_cents, to_dollars
+from ledger.paging import paged_dataframe
 
 # Page Configuration
 st.set_page_config(page_title="Bookkeeping", layout="wide")
@@ -15,9 +17,10 @@ Bookkeeping is the process of recording a business’s daily financial transacti
 - Ensuring accuracy for later financial analysis and reporting.
 """)
 
-# Initialize Session State for Ledger
-if "ledger" not in st.session_state:
-    st.session_state.ledger = []
+# General Ledger (persisted in the ledger database)
+ledger = shared_backend().table(
+    "bookkeeping", ["Date", "Description", "Type", "Amount", "Debit Account", "Credit Account", "Category"]
+)
 
 # Sidebar for Navigation and Settings
 st.sidebar.title("Bookkeeping Tools")
@@ -70,7 +73,7 @@ if option == "Add Transaction":
                 "Credit Account": credit_account,
                 "Category": category if category else "Uncategorized"
             }
-            st.session_state.ledger.append(transaction)
+            ledger.append(transaction)
             st.success(f"Transaction recorded: {description} for ${amount:.2f}")
 
 # --- View Ledger ---
@@ -78,20 +81,19 @@ elif option == "View Ledger":
     st.subheader("General Ledger")
     st.write("This is the complete record of all transactions entered.")
 
-    if st.session_state.ledger:
-        ledger_df = pd.DataFrame(st.session_state.ledger)
-        st.dataframe(ledger_df)
+    if ledger:
+        filter_options = {"Type": ledger.distinct("Type"), "Category": ledger.distinct("Category")}
+        paged_dataframe(ledger.page, "ledger", ledger.fields, filter_options)
 
         # Filter by Date
         st.write("### Filter Ledger")
-        min_date = min([entry["Date"] for entry in st.session_state.ledger])
-        max_date = max([entry["Date"] for entry in st.session_state.ledger])
+        min_date, max_date = ledger.date_range()
         date_range = st.date_input("Select Date Range", [min_date, max_date])
         if len(date_range) == 2:
-            filtered_df = ledger_df[
-                (ledger_df["Date"] >= date_range[0]) & (ledger_df["Date"] <= date_range[1])
-            ]
-            st.dataframe(filtered_df)
+            paged_dataframe(
+                lambda *page: ledger.page(*page, start=date_range[0], end=date_range[1]),
+                "filtered", ledger.fields, filter_options
+            )
     else:
         st.write("No transactions recorded yet. Add some in the 'Add Transaction' section!")
 
@@ -100,21 +102,31 @@ elif option == "Categorize Transactions":
     st.subheader("Categorize Transactions")
     st.write("Assign or edit categories for better organization and reporting.")
 
-    if st.session_state.ledger:
-        ledger_df = pd.DataFrame(st.session_state.ledger)
+    if ledger:
         st.write("### Current Ledger with Categories")
-        st.dataframe(ledger_df[["Date", "Description", "Amount", "Category"]])
 
-        # Edit Category
-        transaction_index = st.selectbox(
-            "Select Transaction to Edit",
-            range(len(st.session_state.ledger)),
-            format_func=lambda x: st.session_state.ledger[x]["Description"]
+        def fetch_categories(*page):
+            rows, total = ledger.page(*page)
+            return rows[["Date", "Description", "Amount", "Category"]], total
+
+        ledger_df = paged_dataframe(
+            fetch_categories, "categorize", ["Date", "Description", "Amount", "Category"],
+            {"Category": ledger.distinct("Category")}
         )
-        new_category = st.text_input("New Category", st.session_state.ledger[transaction_index]["Category"])
-        if st.button("Update Category"):
-            st.session_state.ledger[transaction_index]["Category"] = new_category
-            st.success(f"Category updated for '{st.session_state.ledger[transaction_index]['Description']}'")
+
+        # Edit Category (transactions on the current page)
+        if ledger_df.empty:
+            st.info("No transactions match the current filters.")
+        else:
+            transaction_id = st.selectbox(
+                "Select Transaction to Edit",
+                ledger_df.index,
+                format_func=lambda x: ledger_df.loc[x, "Description"]
+            )
+            new_category = st.text_input("New Category", ledger_df.loc[transaction_id, "Category"])
+            if st.button("Update Category"):
+                ledger.update(transaction_id, Category=new_category)
+                st.success(f"Category updated for '{ledger_df.loc[transaction_id, 'Description']}'")
     else:
         st.write("No transactions to categorize yet.")
 
@@ -123,31 +135,23 @@ elif option == "Summary Report":
     st.subheader("Summary Report")
     st.write("A breakdown of transactions by type and category.")
 
-    if st.session_state.ledger:
-        ledger_df = pd.DataFrame(st.session_state.ledger)
-
+    if ledger:
         # Summary by Type
         st.write("### By Transaction Type")
-        type_summary = ledger_df.groupby("Type")["Amount"].sum().reset_index()
+        type_summary = to_dollars(ledger.group_totals("Type", "Amount")).reset_index()
         st.table(type_summary)
 
         # Summary by Category
         st.write("### By Category")
-        category_summary = ledger_df.groupby("Category")["Amount"].sum().reset_index()
+        category_summary = to_dollars(ledger.group_totals("Category", "Amount")).reset_index()
         st.table(category_summary)
 
         # Total Debits and Credits
-        debit_total = sum(
-            entry["Amount"] for entry in st.session_state.ledger
-            if entry["Debit Account"] in ["Cash", "Accounts Receivable", "Inventory", "Equipment"]
-        )
-        credit_total = sum(
-            entry["Amount"] for entry in st.session_state.ledger
-            if entry["Credit Account"] in ["Cash", "Accounts Payable", "Sales Revenue", "Loans Payable"]
-        )
-        st.write(f"**Total Debits**: ${debit_total:.2f}")
-        st.write(f"**Total Credits**: ${credit_total:.2f}")
-        if abs(debit_total - credit_total) < 0.01:  # Allow for rounding errors
+        debit_total = ledger.sum("Amount", "Debit Account", ["Cash", "Accounts Receivable", "Inventory", "Equipment"])
+        credit_total = ledger.sum("Amount", "Credit Account", ["Cash", "Accounts Payable", "Sales Revenue", "Loans Payable"])
+        st.write(f"**Total Debits**: ${format_cents(debit_total)}")
+        st.write(f"**Total Credits**: ${format_cents(credit_total)}")
+        if debit_total == credit_total:  # Both are exact sums in cents
             st.success("Debits and Credits are balanced!")
         else:
             st.warning("Debits and Credits are not balanced. Check your entries.")
@@ -159,25 +163,33 @@ elif option == "Visualization":
     st.subheader("Visualization")
     st.write("Visualize your bookkeeping data.")
 
-    if st.session_state.ledger:
-        ledger_df = pd.DataFrame(st.session_state.ledger)
-
+    if ledger:
         # Pie Chart by Transaction Type
         st.write("### Transaction Types")
-        type_summary = ledger_df.groupby("Type")["Amount"].sum()
-        fig1, ax1 = plt.subplots()
-        ax1.pie(type_summary, labels=type_summary.index, autopct="%1.1f%%", startangle=90)
-        ax1.axis("equal")
-        st.pyplot(fig1)
+        type_summary = to_dollars(ledger.group_totals("Type", "Amount"))
+
+        @png_chart
+        def draw_types(type_summary):
+            fig1, ax1 = subplots()
+            ax1.pie(type_summary, labels=type_summary.index, autopct="%1.1f%%", startangle=90)
+            ax1.axis("equal")
+            return fig1
+
+        st.image(draw_types(type_summary), use_column_width=True)
 
         # Bar Chart by Category
         st.write("### Categories")
-        category_summary = ledger_df.groupby("Category")["Amount"].sum()
-        fig2, ax2 = plt.subplots()
-        category_summary.plot(kind="bar", ax=ax2, color="#4CAF50")
-        ax2.set_ylabel("Total Amount ($)")
-        ax2.set_title("Transactions by Category")
-        st.pyplot(fig2)
+        category_summary = to_dollars(ledger.group_totals("Category", "Amount"))
+
+        @png_chart
+        def draw_categories(category_summary):
+            fig2, ax2 = subplots()
+            category_summary.plot(kind="bar", ax=ax2, color="#4CAF50")
+            ax2.set_ylabel("Total Amount ($)")
+            ax2.set_title("Transactions by Category")
+            return fig2
+
+        st.image(draw_categories(category_summary), use_column_width=True)
     else:
         st.write("Add transactions to see visualizations.")
 
@@ -192,7 +204,7 @@ Try these:
 
 # Reset Ledger
 if st.sidebar.button("Reset Ledger"):
-    st.session_state.ledger = []
+    ledger.clear()
     st.sidebar.success("Ledger reset successfully!")
 
 # Footer
@@ -1,7 +1,9 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 from datetime import datetime
+from ledger.accounts import ChartOfAccounts
+from ledger.charts import png_chart, subplots
+from ledger.money import format_cents, to_cents, to_dollars
 
 # Page Configuration
 st.set_page_config(page_title="Bookkeeping vs. Accounting", layout="wide")
@@ -14,6 +16,20 @@ st.write("""
 """)
 st.write("This app demonstrates both processes and how they work together.")
 
+# Ledger records hold account codes from the chart rather than account names
+CHART = ChartOfAccounts()
+CASH = CHART.code("Cash")
+EQUIPMENT = CHART.code("Equipment")
+
+
+def ledger_frame(records):
+    """Return the ledger records as a DataFrame with the account codes shown as Categorical names."""
+    frame = pd.DataFrame(records)
+    for field in ("Debit Account", "Credit Account"):
+        frame[field] = CHART.categorical(frame[field].to_numpy(dtype="int16"))
+    return frame
+
+
 # Tabs for Bookkeeping and Accounting
 tab1, tab2, tab3 = st.tabs(["Bookkeeping", "Accounting", "Integration"])
 
@@ -51,8 +67,8 @@ with tab1:
                 "Description": description,
                 "Amount": amount,
                 "Type": trans_type,
-                "Debit Account": debit_account,
-                "Credit Account": credit_account
+                "Debit Account": CHART.code(debit_account),
+                "Credit Account": CHART.code(credit_account)
             }
             st.session_state.bookkeeping_ledger.append(transaction)
             st.success(f"Transaction recorded: {description} for ${amount:.2f}")
@@ -60,7 +76,7 @@ with tab1:
     # Display Ledger
     st.write("### General Ledger")
     if st.session_state.bookkeeping_ledger:
-        ledger_df = pd.DataFrame(st.session_state.bookkeeping_ledger)
+        ledger_df = ledger_frame(st.session_state.bookkeeping_ledger)
         st.dataframe(ledger_df)
     else:
         st.write("No transactions recorded yet.")
@@ -68,13 +84,18 @@ with tab1:
     # Visualization
     st.write("### Transaction Breakdown")
     if st.session_state.bookkeeping_ledger:
-        ledger_df = pd.DataFrame(st.session_state.bookkeeping_ledger)
+        ledger_df = ledger_frame(st.session_state.bookkeeping_ledger)
         type_summary = ledger_df.groupby("Type")["Amount"].sum()
-        fig, ax = plt.subplots()
-        type_summary.plot(kind="pie", ax=ax, autopct="%1.1f%%", startangle=90)
-        ax.set_title("Transactions by Type")
-        ax.axis("equal")
-        st.pyplot(fig)
+
+        @png_chart
+        def draw_type_breakdown(type_summary):
+            fig, ax = subplots()
+            type_summary.plot(kind="pie", ax=ax, autopct="%1.1f%%", startangle=90)
+            ax.set_title("Transactions by Type")
+            ax.axis("equal")
+            return fig
+
+        st.image(draw_type_breakdown(type_summary), use_column_width=True)
 
 # --- Accounting Tab ---
 with tab2:
@@ -89,59 +110,66 @@ with tab2:
 
     # Use Bookkeeping Data if Available
     if st.session_state.bookkeeping_ledger:
-        ledger_df = pd.DataFrame(st.session_state.bookkeeping_ledger)
+        ledger_df = ledger_frame(st.session_state.bookkeeping_ledger)
+        debit_codes = ledger_df["Debit Account"].cat.codes
+        credit_codes = ledger_df["Credit Account"].cat.codes
+
+        # Amounts are summed as int cents and shown in dollars
+        amounts = pd.Series(to_cents(ledger_df["Amount"]), index=ledger_df.index)
 
         # Simple Income Statement
         st.write("### Income Statement (Derived from Ledger)")
-        revenue = ledger_df[ledger_df["Type"] == "Income"]["Amount"].sum()
-        expenses = ledger_df[ledger_df["Type"] == "Expense"]["Amount"].sum()
+        revenue = amounts[ledger_df["Type"] == "Income"].sum()
+        expenses = amounts[ledger_df["Type"] == "Expense"].sum()
         net_income = revenue - expenses
-        income_data = {"Revenue": revenue, "Expenses": expenses, "Net Income": net_income}
+        income_data = {"Revenue": to_dollars(revenue), "Expenses": to_dollars(expenses), "Net Income": to_dollars(net_income)}
         income_df = pd.DataFrame.from_dict(income_data, orient="index", columns=["Amount"])
         st.table(income_df)
 
         # Profitability Feedback
         if net_income > 0:
-            st.success(f"Net Income: ${net_income:.2f} (Profit)")
+            st.success(f"Net Income: ${format_cents(net_income)} (Profit)")
         elif net_income < 0:
-            st.warning(f"Net Income: ${net_income:.2f} (Loss)")
+            st.warning(f"Net Income: ${format_cents(net_income)} (Loss)")
         else:
             st.info("Net Income: $0.00 (Break-even)")
 
         # Simple Balance Sheet
         st.write("### Balance Sheet (Derived from Ledger)")
-        cash = sum(
-            entry["Amount"] if entry["Debit Account"] == "Cash" else -entry["Amount"]
-            for entry in st.session_state.bookkeeping_ledger
-            if entry["Debit Account"] == "Cash" or entry["Credit Account"] == "Cash"
-        )
-        equipment = ledger_df[ledger_df["Debit Account"] == "Equipment"]["Amount"].sum()
+        cash = amounts[debit_codes == CASH].sum() - amounts[credit_codes == CASH].sum()
+        equipment = amounts[debit_codes == EQUIPMENT].sum()
         total_assets = cash + equipment
-        liabilities = ledger_df[ledger_df["Type"] == "Liability Payment"]["Amount"].sum()
+        liabilities = amounts[ledger_df["Type"] == "Liability Payment"].sum()
         equity = total_assets - liabilities
 
         balance_data = {
-            "Assets": {"Cash": cash, "Equipment": equipment, "Total Assets": total_assets},
-            "Liabilities & Equity": {"Liabilities": liabilities, "Equity": equity, "Total": liabilities + equity}
+            "Assets": {"Cash": to_dollars(cash), "Equipment": to_dollars(equipment), "Total Assets": to_dollars(total_assets)},
+            "Liabilities & Equity": {
+                "Liabilities": to_dollars(liabilities), "Equity": to_dollars(equity), "Total": to_dollars(liabilities + equity)
+            }
         }
         balance_df = pd.DataFrame.from_dict(balance_data, orient="index").T
         st.table(balance_df)
 
         # Balance Check
-        if abs(total_assets - (liabilities + equity)) < 0.01:
+        if total_assets == liabilities + equity:
             st.success("Balance Sheet balances!")
         else:
             st.error("Balance Sheet does not balance!")
 
         # Visualization
         st.write("### Financial Snapshot")
-        fig, ax = plt.subplots()
-        balance_totals = [total_assets, liabilities, equity]
-        labels = ["Assets", "Liabilities", "Equity"]
-        ax.bar(labels, balance_totals, color=["#4CAF50", "#FF5722", "#2196F3"])
-        ax.set_ylabel("Amount ($)")
-        ax.set_title("Balance Sheet Breakdown")
-        st.pyplot(fig)
+
+        @png_chart
+        def draw_balance_breakdown(balance_totals):
+            fig, ax = subplots()
+            labels = ["Assets", "Liabilities", "Equity"]
+            ax.bar(labels, balance_totals, color=["#4CAF50", "#FF5722", "#2196F3"])
+            ax.set_ylabel("Amount ($)")
+            ax.set_title("Balance Sheet Breakdown")
+            return fig
+
+        st.image(draw_balance_breakdown([to_dollars(total_assets), to_dollars(liabilities), to_dollars(equity)]), use_column_width=True)
     else:
         st.write("Add transactions in the Bookkeeping tab to see accounting reports.")
 
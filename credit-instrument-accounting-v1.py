@@ -1,7 +1,9 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
+from ledger.charts import png_chart, subplots
+from ledger.money import to_cents
+from ledger.records import SortedRecords
 
 # Page Configuration
 st.set_page_config(page_title="Credit Instrument Accounting", layout="wide")
@@ -18,8 +20,9 @@ This app manages transactions for a credit instrument (e.g., credit card, loan,
 st.write("Use this tool to simulate credit usage and its accounting implications.")
 
 # Initialize Session State
+TRANSACTION_COLUMNS = ["Date", "Type", "Description", "Amount", "Balance After"]
 if "credit_transactions" not in st.session_state:
-    st.session_state.credit_transactions = []
+    st.session_state.credit_transactions = SortedRecords(columns=TRANSACTION_COLUMNS)
 if "credit_limit" not in st.session_state:
     st.session_state.credit_limit = 5000.0
 
@@ -101,10 +104,7 @@ elif option == "Transaction Ledger":
     st.write("View all transactions for the credit instrument.")
 
     if st.session_state.credit_transactions:
-        ledger_df = pd.DataFrame(st.session_state.credit_transactions)
-        filtered_df = ledger_df[
-            (ledger_df["Date"] >= period_start) & (ledger_df["Date"] <= period_end)
-        ]
+        filtered_df = st.session_state.credit_transactions.between(period_start, period_end)
         st.dataframe(filtered_df)
 
         # Running Balance
@@ -122,10 +122,7 @@ elif option == "Accounting Entries":
     st.write("Generate double-entry journal entries for credit transactions.")
 
     if st.session_state.credit_transactions and "credit_instrument" in st.session_state:
-        ledger_df = pd.DataFrame(st.session_state.credit_transactions)
-        filtered_df = ledger_df[
-            (ledger_df["Date"] >= period_start) & (ledger_df["Date"] <= period_end)
-        ]
+        filtered_df = st.session_state.credit_transactions.between(period_start, period_end)
 
         # Journal Entries
         st.write("### Journal Entries")
@@ -145,9 +142,9 @@ elif option == "Accounting Entries":
         st.table(journal_df.groupby(["Date", "Account"]).sum().reset_index())
 
         # Balance Check
-        total_debits = journal_df["Debit"].sum()
-        total_credits = journal_df["Credit"].sum()
-        if abs(total_debits - total_credits) < 0.01:
+        total_debits = to_cents(journal_df["Debit"]).sum()
+        total_credits = to_cents(journal_df["Credit"]).sum()
+        if total_debits == total_credits:
             st.success("Journal entries balance!")
         else:
             st.error("Journal entries do not balance!")
@@ -160,10 +157,7 @@ elif option == "Balance & Analysis":
     st.write("Track credit balance and analyze usage.")
 
     if st.session_state.credit_transactions and "credit_instrument" in st.session_state:
-        ledger_df = pd.DataFrame(st.session_state.credit_transactions)
-        filtered_df = ledger_df[
-            (ledger_df["Date"] >= period_start) & (ledger_df["Date"] <= period_end)
-        ]
+        filtered_df = st.session_state.credit_transactions.between(period_start, period_end)
 
         # Current Balance
         opening_balance = st.session_state.credit_instrument["Opening Balance"]
@@ -195,13 +189,18 @@ elif option == "Balance & Analysis":
         st.write("### Balance Over Time")
         filtered_df["Balance"] = opening_balance + filtered_df["Amount"].cumsum() * \
                                 filtered_df["Type"].apply(lambda x: 1 if x in ["Charge (Debit)", "Interest Charge"] else -1)
-        fig, ax = plt.subplots()
-        filtered_df.plot(x="Date", y="Balance", kind="line", ax=ax, marker="o", color="#2196F3")
-        ax.axhline(st.session_state.credit_limit, color="red", linestyle="--", label="Credit Limit")
-        ax.set_ylabel("Balance ($)")
-        ax.set_title("Credit Balance Trend")
-        ax.legend()
-        st.pyplot(fig)
+
+        @png_chart
+        def draw_balance_trend(balances, credit_limit):
+            fig, ax = subplots()
+            balances.plot(x="Date", y="Balance", kind="line", ax=ax, marker="o", color="#2196F3")
+            ax.axhline(credit_limit, color="red", linestyle="--", label="Credit Limit")
+            ax.set_ylabel("Balance ($)")
+            ax.set_title("Credit Balance Trend")
+            ax.legend()
+            return fig
+
+        st.image(draw_balance_trend(filtered_df[["Date", "Balance"]], st.session_state.credit_limit), use_column_width=True)
     else:
         st.write("No data for analysis. Setup and record transactions first.")
 
@@ -211,7 +210,7 @@ st.sidebar.write("- Charge (Debit): $200, Purchased supplies")
 st.sidebar.write("- Repayment (Credit): $150, Payment to credit account")
 st.sidebar.write("- Interest Charge: $10, Monthly interest")
 if st.sidebar.button("Reset Data"):
-    st.session_state.credit_transactions = []
+    st.session_state.credit_transactions = SortedRecords(columns=TRANSACTION_COLUMNS)
     if "credit_instrument" in st.session_state:
         del st.session_state.credit_instrument
     st.sidebar.success("All data reset!")
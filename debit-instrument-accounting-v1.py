@@ -1,7 +1,9 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
+from ledger.charts import png_chart, subplots
+from ledger.money import to_cents
+from ledger.records import SortedRecords
 
 # Page Configuration
 st.set_page_config(page_title="Debit Instrument Accounting", layout="wide")
@@ -18,8 +20,9 @@ This app manages transactions for a debit instrument (e.g., checking account, de
 st.write("Use this tool to simulate debit account usage and its accounting implications.")
 
 # Initialize Session State
+TRANSACTION_COLUMNS = ["Date", "Type", "Description", "Amount", "Balance After"]
 if "debit_transactions" not in st.session_state:
-    st.session_state.debit_transactions = []
+    st.session_state.debit_transactions = SortedRecords(columns=TRANSACTION_COLUMNS)
 if "starting_balance" not in st.session_state:
     st.session_state.starting_balance = 10000.0
 
@@ -99,10 +102,7 @@ elif option == "Transaction Ledger":
     st.write("View all transactions for the debit instrument.")
 
     if st.session_state.debit_transactions:
-        ledger_df = pd.DataFrame(st.session_state.debit_transactions)
-        filtered_df = ledger_df[
-            (ledger_df["Date"] >= period_start) & (ledger_df["Date"] <= period_end)
-        ]
+        filtered_df = st.session_state.debit_transactions.between(period_start, period_end)
         st.dataframe(filtered_df)
 
         # Running Balance
@@ -120,10 +120,7 @@ elif option == "Accounting Entries":
     st.write("Generate double-entry journal entries for debit instrument transactions.")
 
     if st.session_state.debit_transactions and "debit_instrument" in st.session_state:
-        ledger_df = pd.DataFrame(st.session_state.debit_transactions)
-        filtered_df = ledger_df[
-            (ledger_df["Date"] >= period_start) & (ledger_df["Date"] <= period_end)
-        ]
+        filtered_df = st.session_state.debit_transactions.between(period_start, period_end)
 
         # Journal Entries
         st.write("### Journal Entries")
@@ -143,9 +140,9 @@ elif option == "Accounting Entries":
         st.table(journal_df.groupby(["Date", "Account"]).sum().reset_index())
 
         # Balance Check
-        total_debits = journal_df["Debit"].sum()
-        total_credits = journal_df["Credit"].sum()
-        if abs(total_debits - total_credits) < 0.01:
+        total_debits = to_cents(journal_df["Debit"]).sum()
+        total_credits = to_cents(journal_df["Credit"]).sum()
+        if total_debits == total_credits:
             st.success("Journal entries balance!")
         else:
             st.error("Journal entries do not balance!")
@@ -158,10 +155,7 @@ elif option == "Balance & Analysis":
     st.write("Track debit account balance and analyze usage.")
 
     if st.session_state.debit_transactions and "debit_instrument" in st.session_state:
-        ledger_df = pd.DataFrame(st.session_state.debit_transactions)
-        filtered_df = ledger_df[
-            (ledger_df["Date"] >= period_start) & (ledger_df["Date"] <= period_end)
-        ]
+        filtered_df = st.session_state.debit_transactions.between(period_start, period_end)
 
         # Current Balance
         opening_balance = st.session_state.debit_instrument["Starting Balance"]
@@ -194,14 +188,20 @@ elif option == "Balance & Analysis":
         st.write("### Balance Over Time")
         filtered_df["Balance"] = opening_balance + filtered_df["Amount"].cumsum() * \
                                 filtered_df["Type"].apply(lambda x: 1 if x == "Deposit (Credit)" else -1)
-        fig, ax = plt.subplots()
-        filtered_df.plot(x="Date", y="Balance", kind="line", ax=ax, marker="o", color="#2196F3")
-        ax.axhline(0, color="black", linestyle="--", label="Zero Balance")
-        ax.axhline(-st.session_state.debit_instrument["Overdraft Limit"], color="red", linestyle="--", label="Overdraft Limit")
-        ax.set_ylabel("Balance ($)")
-        ax.set_title("Debit Balance Trend")
-        ax.legend()
-        st.pyplot(fig)
+
+        @png_chart
+        def draw_balance_trend(balances, overdraft_limit):
+            fig, ax = subplots()
+            balances.plot(x="Date", y="Balance", kind="line", ax=ax, marker="o", color="#2196F3")
+            ax.axhline(0, color="black", linestyle="--", label="Zero Balance")
+            ax.axhline(-overdraft_limit, color="red", linestyle="--", label="Overdraft Limit")
+            ax.set_ylabel("Balance ($)")
+            ax.set_title("Debit Balance Trend")
+            ax.legend()
+            return fig
+
+        overdraft_limit = st.session_state.debit_instrument["Overdraft Limit"]
+        st.image(draw_balance_trend(filtered_df[["Date", "Balance"]], overdraft_limit), use_column_width=True)
     else:
         st.write("No data for analysis. Setup and record transactions first.")
 
@@ -211,7 +211,7 @@ st.sidebar.write("- Withdrawal (Debit): $200, Paid utilities")
 st.sidebar.write("- Deposit (Credit): $500, Sales revenue")
 st.sidebar.write("- Bank Fee: $10, Monthly fee")
 if st.sidebar.button("Reset Data"):
-    st.session_state.debit_transactions = []
+    st.session_state.debit_transactions = SortedRecords(columns=TRANSACTION_COLUMNS)
     if "debit_instrument" in st.session_state:
         del st.session_state.debit_instrument
     st.sidebar.success("All data reset!")
@@ -1,6 +1,9 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
+from ledger.backend import shared_backend
+from ledger.charts import png_chart, subplots
+from ledger.money import format_cents, to_cents, to_dollars
+from ledger.paging import paged_dataframe
 
 # Page configuration
 st.set_page_config(page_title="Double-Entry System", layout="wide")
@@ -22,9 +25,8 @@ st.write("""
 """)
 st.write("Let’s simulate transactions, track them in a ledger, and verify the balance.")
 
-# Initialize Session State for Ledger
-if "ledger" not in st.session_state:
-    st.session_state.ledger = []
+# Ledger of (possibly compound) entries, persisted one row per leg
+ledger = shared_backend().journal("double-entry", dated=False)
 
 # Transaction Entry Form
 st.subheader("Enter a Transaction")
@@ -51,58 +53,77 @@ with st.form(key="transaction_form"):
 
 # Process Transaction
 if submit_button:
-    if debit_amount != credit_amount:
+    if to_cents(debit_amount) != to_cents(credit_amount):
         st.error("Debits must equal Credits! Please adjust the amounts.")
     elif debit_account == credit_account:
         st.error("Debit and Credit accounts must be different!")
     else:
-        transaction = {
-            "Description": description,
-            "Debit Account": debit_account,
-            "Debit Amount": debit_amount,
-            "Credit Account": credit_account,
-            "Credit Amount": credit_amount
-        }
-        st.session_state.ledger.append(transaction)
+        ledger.append_entry(None, description, [(debit_account, debit_amount, 0.0), (credit_account, 0.0, credit_amount)])
         st.success("Transaction added successfully!")
 
+# Compound Entry Form
+st.subheader("Enter a Compound Transaction")
+st.write("Some transactions touch more than two accounts, e.g. buying equipment partly with cash and partly on a loan.")
+with st.form(key="compound_form"):
+    lines = st.data_editor(
+        pd.DataFrame({
+            "Account": ["Equipment", "Cash", "Loans Payable"],
+            "Debit": [0.0, 0.0, 0.0],
+            "Credit": [0.0, 0.0, 0.0],
+        }),
+        num_rows="dynamic",
+        use_container_width=True,
+        column_config={
+            "Account": st.column_config.SelectboxColumn(
+                "Account",
+                options=["Cash", "Equipment", "Inventory", "Rent Expense", "Accounts Receivable",
+                         "Loans Payable", "Sales Revenue", "Capital", "Accounts Payable"],
+                required=True
+            ),
+            "Debit": st.column_config.NumberColumn("Debit ($)", min_value=0.0, step=10.0),
+            "Credit": st.column_config.NumberColumn("Credit ($)", min_value=0.0, step=10.0),
+        },
+        key="compound_lines"
+    )
+    compound_description = st.text_input("Transaction Description", "e.g., Bought equipment with cash and a loan", key="compound_description")
+    compound_submit = st.form_submit_button(label="Add Compound Transaction")
+
+if compound_submit:
+    lines = lines.dropna(subset=["Account"]).fillna({"Debit": 0.0, "Credit": 0.0})
+    lines = lines[(lines["Debit"] != 0) | (lines["Credit"] != 0)]
+    try:
+        # Rejected before anything is written if debits do not equal credits
+        ledger.append_entry(None, compound_description, list(lines[["Account", "Debit", "Credit"]].itertuples(index=False, name=None)))
+    except ValueError as e:
+        st.error(str(e))
+    else:
+        st.success("Compound transaction added successfully!")
+
 # Display Ledger
 st.subheader("Ledger")
-if st.session_state.ledger:
-    ledger_df = pd.DataFrame(st.session_state.ledger)
-    st.table(ledger_df)
+if ledger:
+    paged_dataframe(ledger.page, "ledger", ledger.fields, filter_options={"Account": ledger.distinct("Account")})
 else:
     st.write("No transactions recorded yet.")
 
 # Trial Balance Calculation
 st.subheader("Trial Balance")
-if st.session_state.ledger:
-    accounts = {}
-    for entry in st.session_state.ledger:
-        # Update debit account
-        debit_acc = entry["Debit Account"]
-        if debit_acc in accounts:
-            accounts[debit_acc] += entry["Debit Amount"]
-        else:
-            accounts[debit_acc] = entry["Debit Amount"]
-        # Update credit account
-        credit_acc = entry["Credit Account"]
-        if credit_acc in accounts:
-            accounts[credit_acc] -= entry["Credit Amount"]
-        else:
-            accounts[credit_acc] = -entry["Credit Amount"]
-
-    trial_balance_df = pd.DataFrame(
-        list(accounts.items()), columns=["Account", "Net Balance"]
-    )
-    total_debits = sum(entry["Debit Amount"] for entry in st.session_state.ledger)
-    total_credits = sum(entry["Credit Amount"] for entry in st.session_state.ledger)
+if ledger:
+    # Per-account totals are summed over the legs by the database
+    account_totals = ledger.account_totals()
+    trial_balance_df = pd.DataFrame({
+        "Account": account_totals.index,
+        "Net Balance": to_dollars(account_totals["Debit"] - account_totals["Credit"])
+    }).reset_index(drop=True)
+    # Exact integer cents, so equal totals compare equal however many entries there are
+    total_debits = ledger.sum("Debit")
+    total_credits = ledger.sum("Credit")
     
     st.write("### Account Balances")
     st.table(trial_balance_df)
     
-    st.write(f"**Total Debits**: ${total_debits:.2f}")
-    st.write(f"**Total Credits**: ${total_credits:.2f}")
+    st.write(f"**Total Debits**: ${format_cents(total_debits)}")
+    st.write(f"**Total Credits**: ${format_cents(total_credits)}")
     
     if total_debits == total_credits:
         st.success("Trial Balance is balanced!")
@@ -111,13 +132,18 @@ if st.session_state.ledger:
 
 # Visualization
 st.subheader("Visualization")
-if st.session_state.ledger:
-    fig, ax = plt.subplots()
-    trial_balance_df.plot(kind="bar", x="Account", y="Net Balance", ax=ax, color="skyblue")
-    ax.set_title("Net Balance by Account")
-    ax.set_ylabel("Balance ($)")
-    ax.axhline(0, color="black", linewidth=0.8)
-    st.pyplot(fig)
+if ledger:
+
+    @png_chart
+    def draw_balances(trial_balance_df):
+        fig, ax = subplots()
+        trial_balance_df.plot(kind="bar", x="Account", y="Net Balance", ax=ax, color="skyblue")
+        ax.set_title("Net Balance by Account")
+        ax.set_ylabel("Balance ($)")
+        ax.axhline(0, color="black", linewidth=0.8)
+        return fig
+
+    st.image(draw_balances(trial_balance_df), use_column_width=True)
 else:
     st.write("Add transactions to see a visualization.")
 
@@ -132,7 +158,7 @@ Try these examples:
 
 # Reset Button
 if st.button("Reset Ledger"):
-    st.session_state.ledger = []
+    ledger.clear()
     st.write("Ledger reset successfully!")
 
 # Footer
@@ -1,7 +1,7 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 from datetime import datetime
+from ledger.charts import png_chart, subplots
 
 # Page Configuration
 st.set_page_config(page_title="Financial Statements", layout="wide")
@@ -15,6 +15,17 @@ Financial statements are reports that summarize a business’s financial perform
 - **Cash Flow Statement**: Tracks cash inflows and outflows (operations, investing, financing) over a period.
 """)
 
+
+@png_chart
+def draw_breakdown(labels, values, colors, title):
+    """Bar chart shared by the three statement tabs."""
+    fig, ax = subplots()
+    ax.bar(labels, values, color=colors)
+    ax.set_ylabel("Amount ($)")
+    ax.set_title(title)
+    return fig
+
+
 # Tabs for Each Statement
 tab1, tab2, tab3 = st.tabs(["Balance Sheet", "Income Statement", "Cash Flow Statement"])
 
@@ -66,13 +77,10 @@ with tab1:
 
     # Visualization
     st.write("### Visualization")
-    fig, ax = plt.subplots()
     balance_data = [total_assets, total_liabilities, total_equity]
     labels = ["Total Assets", "Total Liabilities", "Total Equity"]
-    ax.bar(labels, balance_data, color=["#4CAF50", "#FF5722", "#2196F3"])
-    ax.set_ylabel("Amount ($)")
-    ax.set_title(f"Balance Sheet Breakdown - {date}")
-    st.pyplot(fig)
+    chart = draw_breakdown(labels, balance_data, ["#4CAF50", "#FF5722", "#2196F3"], f"Balance Sheet Breakdown - {date}")
+    st.image(chart, use_column_width=True)
 
 # --- Income Statement ---
 with tab2:
@@ -121,13 +129,12 @@ with tab2:
 
     # Visualization
     st.write("### Visualization")
-    fig, ax = plt.subplots()
     income_data = [total_revenue, total_expenses, net_income]
     labels = ["Total Revenue", "Total Expenses", "Net Income"]
-    ax.bar(labels, income_data, color=["#4CAF50", "#FF5722", "#2196F3"])
-    ax.set_ylabel("Amount ($)")
-    ax.set_title(f"Income Statement - {period_start} to {period_end}")
-    st.pyplot(fig)
+    chart = draw_breakdown(
+        labels, income_data, ["#4CAF50", "#FF5722", "#2196F3"], f"Income Statement - {period_start} to {period_end}"
+    )
+    st.image(chart, use_column_width=True)
 
 # --- Cash Flow Statement ---
 with tab3:
@@ -183,13 +190,13 @@ with tab3:
 
     # Visualization
     st.write("### Visualization")
-    fig, ax = plt.subplots()
     cash_data = [net_cash_operations, net_cash_investing, net_cash_financing, net_cash_flow]
     labels = ["Operations", "Investing", "Financing", "Net Cash Flow"]
-    ax.bar(labels, cash_data, color=["#4CAF50", "#FF5722", "#2196F3", "#9C27B0"])
-    ax.set_ylabel("Amount ($)")
-    ax.set_title(f"Cash Flow Breakdown - {cash_period_start} to {cash_period_end}")
-    st.pyplot(fig)
+    chart = draw_breakdown(
+        labels, cash_data, ["#4CAF50", "#FF5722", "#2196F3", "#9C27B0"],
+        f"Cash Flow Breakdown - {cash_period_start} to {cash_period_end}"
+    )
+    st.image(chart, use_column_width=True)
 
 # Interconnection Note
 st.subheader("How They Connect")
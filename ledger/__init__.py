@@ -0,0 +1,47 @@
+"""
+Shared ledger building blocks for the Streamlit accounting apps.
+
+The names below are re-exported lazily, on first access, so importing a
+headless module (ledger.engine, ledger.score, a consolidation worker) does
+not pull in Streamlit through the UI helpers.
+"""
+
+import importlib
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    "AccountingEngine": "ledger.engine",
+    "ChartOfAccounts": "ledger.accounts",
+    "LedgerError": "ledger.engine",
+    "LedgerStore": "ledger.store",
+    "RenderCache": "ledger.cache",
+    "SQLiteBackend": "ledger.backend",
+    "STANDARD_ACCOUNTS": "ledger.accounts",
+    "SortedRecords": "ledger.records",
+    "TrialBalance": "ledger.trial_balance",
+    "build_statements": "ledger.statements",
+    "check_entries": "ledger.entries",
+    "consolidate": "ledger.consolidation",
+    "figure_png": "ledger.charts",
+    "format_cents": "ledger.money",
+    "import_transactions": "ledger.importer",
+    "open_backend": "ledger.backend",
+    "png_chart": "ledger.charts",
+    "shared_backend": "ledger.backend",
+    "to_cents": "ledger.money",
+    "to_dollars": "ledger.money",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'ledger' has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *__all__])
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+
+ACCOUNT_TYPES = ("asset", "liability", "equity", "revenue", "expense")
+
+# The accounts offered by the apps, in registration order
+STANDARD_ACCOUNTS = [
+    ("Cash", "asset"),
+    ("Accounts Receivable", "asset"),
+    ("Inventory", "asset"),
+    ("Equipment", "asset"),
+    ("Accounts Payable", "liability"),
+    ("Loans Payable", "liability"),
+    ("Capital", "equity"),
+    ("Retained Earnings", "equity"),
+    ("Sales Revenue", "revenue"),
+    ("Rent Expense", "expense"),
+    ("Salaries Expense", "expense"),
+    # Balances between business units, eliminated on consolidation
+    ("Due from Affiliates", "asset"),
+    ("Due to Affiliates", "liability"),
+    ("Intercompany Revenue", "revenue"),
+    ("Intercompany Expense", "expense"),
+]
+
+
+class ChartOfAccounts:
+    """
+    Registry mapping account names to small integer codes, with each
+    account's type (asset, liability, equity, revenue or expense).
+
+    Ledgers store an account's int16 code instead of its name, so account
+    filters are integer compares and display columns are Categoricals built
+    from the codes. Codes are handed out in registration order and never
+    change, so sorting by code lists accounts in chart order.
+    """
+
+    def __init__(self, accounts=STANDARD_ACCOUNTS):
+        self.names = []
+        self.types = []
+        self._codes = {}
+        for name, account_type in accounts:
+            self.add(name, account_type)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self._codes
+
+    def add(self, name, account_type=None):
+        """Return the code of `name`, registering it with `account_type` if it is new."""
+        code = self._codes.get(name)
+        if code is None:
+            if account_type is not None and account_type not in ACCOUNT_TYPES:
+                raise ValueError(f"Unknown account type: {account_type}")
+            if len(self.names) > np.iinfo(np.int16).max:
+                raise ValueError("The chart of accounts is full")
+            code = self._codes[name] = len(self.names)
+            self.names.append(name)
+            self.types.append(account_type)
+        return code
+
+    def code(self, name):
+        """Return the code of a registered account; KeyError if unknown."""
+        return self._codes[name]
+
+    def codes(self, names):
+        """Return int16 codes for an array of names, registering any new ones."""
+        names = np.asarray(names, dtype=object)
+        for name in pd.unique(names):
+            self.add(name)
+        return pd.Index(self.names).get_indexer(names).astype(np.int16)
+
+    def codes_of_type(self, account_type):
+        """Return the codes of every account of `account_type`, in chart order."""
+        return np.array([code for code, kind in enumerate(self.types) if kind == account_type], dtype=np.int16)
+
+    def categorical(self, codes):
+        """Return account codes as a Categorical of names (code -1 becomes missing)."""
+        return pd.Categorical.from_codes(codes, dtype=pd.CategoricalDtype(self.names), validate=False)
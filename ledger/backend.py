@@ -0,0 +1,697 @@
+import functools
+import os
+import queue
+import sqlite3
+from contextlib import contextmanager
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from ledger.accounts import STANDARD_ACCOUNTS, ChartOfAccounts
+from ledger.entries import check_entries, simple_entries
+from ledger.money import to_cents
+from ledger.statements import close_income
+
+# App record field -> SQL column
+FIELDS = {
+    "Date": "date",
+    "Description": "description",
+    "Type": "type",
+    "Amount": "amount",
+    "Debit Account": "debit_account",
+    "Debit Amount": "debit_amount",
+    "Credit Account": "credit_account",
+    "Credit Amount": "credit_amount",
+    "Category": "category",
+}
+
+# Journal leg field -> SQL column
+LEG_FIELDS = {
+    "Entry": "entry",
+    "Date": "date",
+    "Description": "description",
+    "Account": "account",
+    "Debit": "debit",
+    "Credit": "credit",
+}
+
+# Money fields are stored as INTEGER cents and read back as dollars
+MONEY_FIELDS = {"Amount", "Debit Amount", "Credit Amount", "Debit", "Credit"}
+
+# Account fields are stored as INTEGER codes from the `accounts` table and read back as names
+ACCOUNT_FIELDS = {"Debit Account", "Credit Account", "Account"}
+
+TRANSACTIONS_TABLE = """
+CREATE TABLE IF NOT EXISTS {name} (
+    id INTEGER PRIMARY KEY,
+    ledger TEXT NOT NULL,
+    date TEXT,
+    description TEXT,
+    type TEXT,
+    amount INTEGER,
+    debit_account INTEGER REFERENCES accounts (code),
+    debit_amount INTEGER,
+    credit_account INTEGER REFERENCES accounts (code),
+    credit_amount INTEGER,
+    category TEXT
+);
+"""
+
+JOURNAL_TABLE = """
+CREATE TABLE IF NOT EXISTS {name} (
+    id INTEGER PRIMARY KEY,
+    ledger TEXT NOT NULL,
+    entry INTEGER NOT NULL,
+    date TEXT,
+    description TEXT,
+    account INTEGER NOT NULL REFERENCES accounts (code),
+    debit INTEGER NOT NULL DEFAULT 0,
+    credit INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+INDEXES = """
+CREATE INDEX IF NOT EXISTS transactions_date ON transactions (ledger, date);
+CREATE INDEX IF NOT EXISTS transactions_debit ON transactions (ledger, debit_account, date);
+CREATE INDEX IF NOT EXISTS transactions_credit ON transactions (ledger, credit_account, date);
+CREATE INDEX IF NOT EXISTS journal_legs_entry ON journal_legs (ledger, entry);
+CREATE INDEX IF NOT EXISTS journal_legs_date ON journal_legs (ledger, date);
+CREATE INDEX IF NOT EXISTS journal_legs_account ON journal_legs (ledger, account, date);
+"""
+
+# Closing balances per account (debits minus credits, in cents) for every closed period of a journal
+PERIOD_CLOSES_TABLE = """
+CREATE TABLE IF NOT EXISTS period_closes (
+    ledger TEXT NOT NULL,
+    close_date TEXT NOT NULL,
+    account INTEGER NOT NULL REFERENCES accounts (code),
+    balance INTEGER NOT NULL,
+    PRIMARY KEY (ledger, close_date, account)
+);
+"""
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS accounts (code INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, type TEXT);"
+    + TRANSACTIONS_TABLE.format(name="transactions")
+    + JOURNAL_TABLE.format(name="journal_legs")
+    + PERIOD_CLOSES_TABLE
+    + INDEXES
+)
+
+# PRAGMA user_version -> script that brings a database from the previous version to it
+MIGRATIONS = {
+    # Amounts were REAL dollars before they became INTEGER cents
+    1: """
+    BEGIN;
+    UPDATE transactions SET
+        amount = CAST(ROUND(amount * 100) AS INTEGER),
+        debit_amount = CAST(ROUND(debit_amount * 100) AS INTEGER),
+        credit_amount = CAST(ROUND(credit_amount * 100) AS INTEGER);
+    UPDATE journal_legs SET
+        debit = CAST(ROUND(debit * 100) AS INTEGER),
+        credit = CAST(ROUND(credit * 100) AS INTEGER);
+    PRAGMA user_version = 1;
+    COMMIT;
+    """,
+    # Account names were stored as TEXT in every row before they became codes
+    2: """
+    BEGIN;
+    INSERT INTO accounts (code, name)
+        SELECT (SELECT COALESCE(MAX(code), -1) FROM accounts) + ROW_NUMBER() OVER (ORDER BY name), name FROM (
+            SELECT debit_account AS name FROM transactions
+            UNION SELECT credit_account FROM transactions
+            UNION SELECT account FROM journal_legs
+        ) WHERE name IS NOT NULL AND name NOT IN (SELECT name FROM accounts);
+    """ + TRANSACTIONS_TABLE.format(name="transactions_coded") + """
+    INSERT INTO transactions_coded
+        SELECT id, ledger, date, description, type, amount,
+            (SELECT code FROM accounts WHERE name = debit_account), debit_amount,
+            (SELECT code FROM accounts WHERE name = credit_account), credit_amount, category
+        FROM transactions;
+    DROP TABLE transactions;
+    ALTER TABLE transactions_coded RENAME TO transactions;
+    """ + JOURNAL_TABLE.format(name="journal_legs_coded") + """
+    INSERT INTO journal_legs_coded
+        SELECT id, ledger, entry, date, description, (SELECT code FROM accounts WHERE name = account), debit, credit
+        FROM journal_legs;
+    DROP TABLE journal_legs;
+    ALTER TABLE journal_legs_coded RENAME TO journal_legs;
+    """ + INDEXES + """
+    PRAGMA user_version = 2;
+    COMMIT;
+    """,
+    # accounting-v4 and double-entry-system-v1 kept simple transactions before they became journals of
+    # legs; each old row becomes a two-leg entry numbered after the journal's existing entries
+    3: """
+    BEGIN;
+    CREATE TEMP TABLE moved_entries AS
+        SELECT ledger, date, description, debit_account, credit_account,
+            COALESCE(debit_amount, amount, 0) AS debit, COALESCE(credit_amount, amount, 0) AS credit,
+            (SELECT COALESCE(MAX(entry), -1) FROM journal_legs WHERE journal_legs.ledger = transactions.ledger)
+                + ROW_NUMBER() OVER (PARTITION BY ledger ORDER BY date, id) AS entry
+        FROM transactions WHERE ledger IN ('accounting', 'double-entry');
+    INSERT INTO journal_legs (ledger, entry, date, description, account, debit, credit)
+        SELECT ledger, entry, date, description, account, debit, credit FROM (
+            SELECT ledger, entry, 0 AS leg, date, description, debit_account AS account, debit, 0 AS credit
+            FROM moved_entries WHERE debit_account IS NOT NULL
+            UNION ALL
+            SELECT ledger, entry, 1, date, description, credit_account, 0, credit
+            FROM moved_entries WHERE credit_account IS NOT NULL
+        ) ORDER BY ledger, entry, leg;
+    DELETE FROM transactions WHERE ledger IN ('accounting', 'double-entry');
+    DROP TABLE moved_entries;
+    PRAGMA user_version = 3;
+    COMMIT;
+    """,
+}
+
+
+class ConnectionPool:
+    """Fixed-size pool of SQLite connections that can be shared across threads and sessions."""
+
+    def __init__(self, path, size=4):
+        uri = path.startswith("file:")
+        self._connections = queue.Queue()
+        for _ in range(size):
+            connection = sqlite3.connect(path, uri=uri, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._connections.put(connection)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection; the block is committed on success and rolled back on error."""
+        connection = self._connections.get()
+        try:
+            with connection:
+                yield connection
+        finally:
+            self._connections.put(connection)
+
+
+class SQLiteBackend:
+    """
+    SQLite-backed storage for the apps' transaction lists.
+
+    Every app ledger is a named set of rows in one `transactions` table with
+    (ledger, date) and (ledger, account, date) indexes, so period filters and
+    account aggregates run as SQL instead of Python loops over session state.
+    Accounts are integer codes into a shared `accounts` table, mirrored in
+    `chart`. Pass ":memory:" for a database that lives only as long as the
+    process.
+    """
+
+    def __init__(self, path, pool_size=4):
+        if path == ":memory:":
+            path = "file:ledger?mode=memory&cache=shared"
+        self.path = path
+        self.pool = ConnectionPool(path, pool_size)
+        with self.pool.connection() as connection:
+            fresh = connection.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()[0] == 0
+            connection.executescript(SCHEMA)
+            # Standard accounts missing from an older database get the next free codes
+            connection.execute("BEGIN IMMEDIATE")
+            for name, kind in STANDARD_ACCOUNTS:
+                connection.execute(
+                    "INSERT INTO accounts (code, name, type) SELECT (SELECT COALESCE(MAX(code) + 1, 0) FROM accounts), ?, ? "
+                    "WHERE NOT EXISTS (SELECT 1 FROM accounts WHERE name = ?)",
+                    (name, kind, name),
+                )
+                connection.execute("UPDATE accounts SET type = ? WHERE name = ? AND type IS NULL", (kind, name))
+            connection.commit()
+            if fresh:
+                connection.execute(f"PRAGMA user_version = {max(MIGRATIONS)}")
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            for target in sorted(MIGRATIONS):
+                if target > version:
+                    connection.executescript(MIGRATIONS[target])
+            self._load_chart(connection)
+
+    def _read_chart(self, connection):
+        return ChartOfAccounts(connection.execute("SELECT name, type FROM accounts ORDER BY code").fetchall())
+
+    def _load_chart(self, connection):
+        self.chart = self._read_chart(connection)
+
+    def account_codes(self, names, register=True):
+        """
+        Return the codes of account `names` as a list for SQL parameters (None
+        for missing names), registering new accounts in the `accounts` table
+        unless `register` is False.
+        """
+        names = pd.Series(names, dtype=object)
+        new = [name for name in names.dropna().unique() if name not in self.chart]
+        if new and register:
+            types = dict(STANDARD_ACCOUNTS)
+            with self.pool.connection() as connection:
+                connection.execute("BEGIN IMMEDIATE")
+                # Another process may have registered accounts since the chart was loaded
+                chart = self._read_chart(connection)
+                for name in new:
+                    if name not in chart:
+                        code = chart.add(name, types.get(name))
+                        connection.execute(
+                            "INSERT INTO accounts (code, name, type) VALUES (?, ?, ?)", (code, name, types.get(name))
+                        )
+            # Publish the new accounts only once they are committed, so a rollback leaves the chart as it was
+            self.chart = chart
+        codes = pd.Index(self.chart.names).get_indexer(names)
+        return [int(code) if code >= 0 else None for code in codes]
+
+    def reload_chart(self):
+        """Reload the chart from the `accounts` table, picking up accounts registered by other processes."""
+        with self.pool.connection() as connection:
+            self._load_chart(connection)
+
+    def refresh_chart(self, codes, connection=None):
+        """
+        Reload the chart if `codes` include accounts registered by another
+        process; pass the `connection` already held by the caller, if any,
+        rather than borrowing a second one from the pool.
+        """
+        if len(codes) and max(codes) >= len(self.chart):
+            if connection is None:
+                self.reload_chart()
+            else:
+                self._load_chart(connection)
+
+    def account_names(self, codes):
+        """Return account codes read from the database as a Categorical of names."""
+        codes = pd.Series(codes).fillna(-1).to_numpy(dtype=np.int16)
+        self.refresh_chart(codes)
+        return self.chart.categorical(codes)
+
+    def table(self, name, fields):
+        return LedgerTable(self, name, fields)
+
+    def journal(self, name, dated=True):
+        return JournalTable(self, name, dated)
+
+    def journals(self):
+        """Return the names of the journals that hold entries, sorted."""
+        with self.pool.connection() as connection:
+            rows = connection.execute("SELECT DISTINCT ledger FROM journal_legs ORDER BY ledger").fetchall()
+        return [name for name, in rows]
+
+
+def open_backend(path=None):
+    """Open the backend at `path`, or at $LEDGER_DB (default "ledger.db" in the working directory)."""
+    return SQLiteBackend(path or os.environ.get("LEDGER_DB", "ledger.db"))
+
+
+@functools.cache
+def shared_backend():
+    """
+    Return the backend opened by open_backend() on first call, so every
+    session of a Streamlit app in this process shares one connection pool.
+    """
+    return open_backend()
+
+
+def _to_sql(field, value):
+    if field == "Date" and isinstance(value, date):
+        return value.strftime("%Y-%m-%d")
+    if field in MONEY_FIELDS and value is not None:
+        return to_cents(value)
+    return value
+
+
+def _column_sql(column, field):
+    if field in MONEY_FIELDS:
+        return f'{column} / 100.0 AS "{field}"'
+    return f'{column} AS "{field}"'
+
+
+class LedgerTable:
+    """One app's ledger inside a SQLiteBackend, exposing the app's own record fields."""
+
+    TABLE = "transactions"
+    COLUMNS = FIELDS
+    ORDER_BY = "date"
+
+    def __init__(self, backend, name, fields):
+        unknown = [field for field in fields if field not in self.COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown ledger fields: {', '.join(unknown)}")
+        self.backend = backend
+        self.name = name
+        self.fields = list(fields)
+        self._columns = [self.COLUMNS[field] for field in self.fields]
+        self._select = ", ".join(_column_sql(self.COLUMNS[field], field) for field in self.fields)
+
+    def __len__(self):
+        return self.count()
+
+    def count(self):
+        with self.backend.pool.connection() as connection:
+            return connection.execute(f"SELECT COUNT(*) FROM {self.TABLE} WHERE ledger = ?", (self.name,)).fetchone()[0]
+
+    def append(self, record):
+        self.extend([record])
+
+    def _sql_values(self, field, values, register=True):
+        """Return `values` of `field` as SQL parameters; account names become codes."""
+        if field in ACCOUNT_FIELDS:
+            return self.backend.account_codes(values, register)
+        return [_to_sql(field, value) for value in values]
+
+    def extend(self, records):
+        placeholders = ", ".join("?" for _ in self._columns)
+        records = list(records)
+        columns = [self._sql_values(field, [record.get(field) for record in records]) for field in self.fields]
+        rows = [[self.name, *row] for row in zip(*columns)]
+        with self.backend.pool.connection() as connection:
+            connection.executemany(
+                f"INSERT INTO {self.TABLE} (ledger, {', '.join(self._columns)}) VALUES (?, {placeholders})", rows
+            )
+
+    def append_frame(self, frame):
+        """Insert every row of a DataFrame whose columns are (a subset of) the ledger fields."""
+        frame = frame[[field for field in self.fields if field in frame.columns]]
+        if "Date" in frame.columns:
+            frame = frame.assign(Date=pd.to_datetime(frame["Date"]).dt.strftime("%Y-%m-%d"))
+        frame = frame.assign(**{field: to_cents(frame[field]) for field in frame.columns if field in MONEY_FIELDS})
+        frame = frame.assign(**{
+            field: pd.Series(self.backend.account_codes(frame[field]), index=frame.index, dtype=object)
+            for field in frame.columns if field in ACCOUNT_FIELDS
+        })
+        columns = [self.COLUMNS[field] for field in frame.columns]
+        placeholders = ", ".join("?" for _ in columns)
+        with self.backend.pool.connection() as connection:
+            connection.executemany(
+                f"INSERT INTO {self.TABLE} (ledger, {', '.join(columns)}) VALUES (?, {placeholders})",
+                ([self.name, *row] for row in frame.itertuples(index=False, name=None)),
+            )
+
+    def update(self, row_id, **fields):
+        """Update fields of one row, e.g. update(row_id, Category="Sales")."""
+        assignments = ", ".join(f"{self.COLUMNS[field]} = ?" for field in fields)
+        values = [self._sql_values(field, [value])[0] for field, value in fields.items()]
+        with self.backend.pool.connection() as connection:
+            connection.execute(
+                f"UPDATE {self.TABLE} SET {assignments} WHERE ledger = ? AND id = ?", [*values, self.name, row_id]
+            )
+
+    def clear(self):
+        with self.backend.pool.connection() as connection:
+            connection.execute(f"DELETE FROM {self.TABLE} WHERE ledger = ?", (self.name,))
+
+    def _query(self, where="", params=(), order=None, limit=None, offset=0, select=None):
+        order = order or f"{self.ORDER_BY}, id"
+        sql = f"SELECT id, {select or self._select} FROM {self.TABLE} WHERE ledger = ? {where} ORDER BY {order}"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params = (*params, limit, offset)
+        with self.backend.pool.connection() as connection:
+            frame = pd.read_sql_query(sql, connection, params=(self.name, *params), index_col="id")
+        if "Date" in frame.columns:
+            frame["Date"] = pd.to_datetime(frame["Date"]).dt.date
+        for field in ACCOUNT_FIELDS.intersection(frame.columns):
+            frame[field] = self.backend.account_names(frame[field])
+        return frame
+
+    def frame(self):
+        """Return the whole ledger as a DataFrame indexed by row id, in date (journals: entry) order."""
+        return self._query()
+
+    def between(self, start, end):
+        """Return the rows dated start..end inclusive, filtered in SQL."""
+        return self._query("AND date BETWEEN ? AND ?", (_to_sql("Date", start), _to_sql("Date", end)))
+
+    def date_range(self):
+        """Return the (first, last) dates in the ledger, or (None, None) when it is empty."""
+        with self.backend.pool.connection() as connection:
+            first, last = connection.execute(
+                f"SELECT MIN(date), MAX(date) FROM {self.TABLE} WHERE ledger = ?", (self.name,)
+            ).fetchone()
+        if first is None:
+            return None, None
+        return date.fromisoformat(first), date.fromisoformat(last)
+
+    def _where(self, filters=None, search=None, start=None, end=None):
+        clauses, params = [], []
+        if start is not None:
+            clauses.append("date BETWEEN ? AND ?")
+            params += [_to_sql("Date", start), _to_sql("Date", end)]
+        for field, values in (filters or {}).items():
+            clauses.append(f"{self.COLUMNS[field]} IN ({', '.join('?' for _ in values)})")
+            params += self._sql_values(field, values, register=False)
+        if search:
+            clauses.append("description LIKE ?")
+            params.append(f"%{search}%")
+        return "".join(f" AND {clause}" for clause in clauses), params
+
+    def page(self, offset, limit, sort=None, descending=False, filters=None, search=None, start=None, end=None):
+        """
+        Return (rows, total) for one page of the ledger.
+
+        Filtering (`filters` maps a field to its accepted values, `search`
+        matches the description), sorting and the LIMIT/OFFSET slice all run
+        in SQL, so only the visible rows are read into pandas.
+        """
+        where, params = self._where(filters, search, start, end)
+        with self.backend.pool.connection() as connection:
+            total = connection.execute(
+                f"SELECT COUNT(*) FROM {self.TABLE} WHERE ledger = ?{where}", (self.name, *params)
+            ).fetchone()[0]
+        if sort is not None and sort not in self.fields:
+            raise ValueError(f"Unknown ledger field: {sort}")
+        column = self.COLUMNS[sort] if sort is not None else self.ORDER_BY
+        direction = "DESC" if descending else "ASC"
+        return self._query(
+            where, params, order=f"{column} {direction}, id {direction}", limit=limit, offset=offset
+        ), total
+
+    def distinct(self, field):
+        """Return the distinct values of `field`, sorted (accounts in chart order)."""
+        with self.backend.pool.connection() as connection:
+            rows = connection.execute(
+                f"SELECT DISTINCT {self.COLUMNS[field]} FROM {self.TABLE} WHERE ledger = ? ORDER BY 1", (self.name,)
+            ).fetchall()
+        values = [value for value, in rows]
+        if field in ACCOUNT_FIELDS:
+            return list(self.backend.account_names(values))
+        return values
+
+    def group_totals(self, field, value_field, start=None, end=None):
+        """Return SUM(value_field) grouped by `field` as a Series (int64 cents for money fields)."""
+        period, params = self._where(start=start, end=end)
+        sql = (
+            f"SELECT {self.COLUMNS[field]} AS key, SUM({self.COLUMNS[value_field]}) AS total FROM {self.TABLE} "
+            f"WHERE ledger = ?{period} GROUP BY {self.COLUMNS[field]} ORDER BY {self.COLUMNS[field]}"
+        )
+        with self.backend.pool.connection() as connection:
+            rows = connection.execute(sql, (self.name, *params)).fetchall()
+        dtype = "int64" if value_field in MONEY_FIELDS else "float64"
+        keys = [key for key, _ in rows]
+        if field in ACCOUNT_FIELDS:
+            keys = self.backend.account_names(keys)
+        return pd.Series([total for _, total in rows], index=pd.Index(keys, name=field), name=value_field, dtype=dtype)
+
+    def sum(self, value_field, where_field=None, values=None, start=None, end=None):
+        """
+        Return SUM(value_field), optionally restricted to rows whose
+        `where_field` is in `values`. Money fields are summed exactly, in cents.
+        """
+        period, params = self._where(start=start, end=end)
+        sql = f"SELECT COALESCE(SUM({self.COLUMNS[value_field]}), 0) FROM {self.TABLE} WHERE ledger = ?{period}"
+        if where_field is not None:
+            sql += f" AND {self.COLUMNS[where_field]} IN ({', '.join('?' for _ in values)})"
+            params = (*params, *self._sql_values(where_field, values, register=False))
+        with self.backend.pool.connection() as connection:
+            total = connection.execute(sql, (self.name, *params)).fetchone()[0]
+        return int(total) if value_field in MONEY_FIELDS else total
+
+    def account_totals(self, start=None, end=None):
+        """Return per-account Debit and Credit totals in cents, aggregated in SQL."""
+        period, params = self._where(start=start, end=end)
+        if "Debit Amount" in self.fields:
+            debit, credit = FIELDS["Debit Amount"], FIELDS["Credit Amount"]
+        else:
+            debit = credit = FIELDS["Amount"]
+        sql = f"""
+            SELECT account, SUM(debit) AS Debit, SUM(credit) AS Credit FROM (
+                SELECT debit_account AS account, {debit} AS debit, 0 AS credit
+                FROM {self.TABLE} WHERE ledger = ?{period}
+                UNION ALL
+                SELECT credit_account, 0, {credit}
+                FROM {self.TABLE} WHERE ledger = ?{period}
+            ) GROUP BY account ORDER BY account
+        """
+        with self.backend.pool.connection() as connection:
+            frame = pd.read_sql_query(sql, connection, params=(self.name, *params, self.name, *params))
+        frame = frame.set_index("account").rename_axis("Account").astype("int64")
+        frame.index = pd.CategoricalIndex(self.backend.account_names(frame.index), name="Account")
+        return frame
+
+
+class JournalTable(LedgerTable):
+    """
+    One app's journal of compound entries inside a SQLiteBackend.
+
+    Entries are stored one row per leg (entry number, account, debit, credit)
+    in the `journal_legs` table, so an entry can have any number of legs and
+    the trial balance is a single GROUP BY account over the legs.
+    """
+
+    TABLE = "journal_legs"
+    COLUMNS = LEG_FIELDS
+    ORDER_BY = "entry"
+
+    def __init__(self, backend, name, dated=True):
+        super().__init__(backend, name, [field for field in LEG_FIELDS if dated or field != "Date"])
+        self.dated = dated
+
+    def count(self):
+        """Return the number of entries (not legs)."""
+        with self.backend.pool.connection() as connection:
+            return connection.execute(
+                f"SELECT COUNT(DISTINCT entry) FROM {self.TABLE} WHERE ledger = ?", (self.name,)
+            ).fetchone()[0]
+
+    def frame(self, cents=False):
+        """
+        Return every leg as a DataFrame indexed by row id, in entry order;
+        with `cents=True` Debit and Credit stay int64 cents, ready for
+        LedgerStore.extend_legs.
+        """
+        if not cents:
+            return self._query()
+        select = ", ".join(f'{self.COLUMNS[field]} AS "{field}"' for field in self.fields)
+        return self._query(select=select).astype({"Debit": "int64", "Credit": "int64"})
+
+    def append_entry(self, date, description, legs):
+        """Record one compound entry; `legs` is a list of (account, debit, credit) in dollars."""
+        accounts, debits, credits = zip(*legs) if legs else ((), (), ())
+        self.append_entries([date], [description], [0], accounts, to_cents(debits), to_cents(credits))
+
+    def append_entries(self, dates, descriptions, offsets, accounts, debits, credits):
+        """
+        Record compound entries laid out like LedgerStore.extend_entries: one
+        date and description per entry, flat leg arrays (amounts in cents) and
+        the offset of each entry's first leg. Raises ValueError if an entry
+        does not balance.
+        """
+        check_entries(offsets, debits, credits)
+        if len(offsets) == 0:
+            return
+        sizes = np.diff(np.append(offsets, len(debits)))
+        columns = ["entry", "description", "account", "debit", "credit"]
+        legs = [
+            np.repeat(np.asarray(descriptions, dtype=object), sizes).tolist(),
+            self.backend.account_codes(accounts),
+            np.asarray(debits, dtype=np.int64).tolist(),
+            np.asarray(credits, dtype=np.int64).tolist(),
+        ]
+        if self.dated:
+            columns.append("date")
+            legs.append(np.repeat(pd.to_datetime(pd.Series(dates)).dt.strftime("%Y-%m-%d").to_numpy(), sizes).tolist())
+        with self.backend.pool.connection() as connection:
+            # Take the write lock before numbering so concurrent sessions cannot reuse an entry number
+            connection.execute("BEGIN IMMEDIATE")
+            closed = self._closed_through(connection)
+            if self.dated and closed is not None and min(legs[-1]) <= closed:
+                raise ValueError(f"The books are closed through {closed}")
+            first = connection.execute(
+                f"SELECT COALESCE(MAX(entry) + 1, 0) FROM {self.TABLE} WHERE ledger = ?", (self.name,)
+            ).fetchone()[0]
+            entries = np.repeat(np.arange(first, first + len(offsets)), sizes).tolist()
+            connection.executemany(
+                f"INSERT INTO {self.TABLE} (ledger, {', '.join(columns)}) VALUES (?, {', '.join('?' for _ in columns)})",
+                zip([self.name] * len(entries), entries, *legs),
+            )
+
+    def clear(self):
+        super().clear()
+        with self.backend.pool.connection() as connection:
+            connection.execute("DELETE FROM period_closes WHERE ledger = ?", (self.name,))
+
+    def _closed_through(self, connection, as_of=None):
+        """Return the latest close date (on or before `as_of`) as an ISO string, or None."""
+        sql = "SELECT MAX(close_date) FROM period_closes WHERE ledger = ?"
+        params = (self.name,)
+        if as_of is not None:
+            sql += " AND close_date <= ?"
+            params += (as_of,)
+        return connection.execute(sql, params).fetchone()[0]
+
+    def _balances(self, connection, as_of):
+        closed = self._closed_through(connection, as_of)
+        rows = connection.execute(
+            f"SELECT account, SUM(debit - credit) FROM {self.TABLE} WHERE ledger = ? AND date > ? AND date <= ? "
+            "GROUP BY account",
+            (self.name, closed or "", as_of),
+        ).fetchall()
+        if closed is not None:
+            rows += connection.execute(
+                "SELECT account, balance FROM period_closes WHERE ledger = ? AND close_date = ?", (self.name, closed)
+            ).fetchall()
+        codes = [code for code, _ in rows]
+        self.backend.refresh_chart(codes, connection)
+        balances = np.zeros(len(self.backend.chart), dtype=np.int64)
+        np.add.at(balances, np.asarray(codes, dtype=np.intp), np.asarray([total for _, total in rows], dtype=np.int64))
+        return balances
+
+    def balances(self, as_of):
+        """
+        Return every account's balance as of `as_of` (int64 cents, debits minus
+        credits, indexed by backend chart code): the latest close snapshot on
+        or before that date plus the legs dated after it, so only the delta
+        since the close is aggregated.
+        """
+        with self.backend.pool.connection() as connection:
+            return self._balances(connection, _to_sql("Date", as_of))
+
+    def close_period(self, close_date):
+        """
+        Close the books through `close_date`: materialize every account's
+        closing balance into `period_closes`, with revenue and expenses rolled
+        into Retained Earnings. Legs dated on or before it are refused from
+        then on. Raises ValueError if the books are already closed through a
+        later date.
+        """
+        close_date = _to_sql("Date", close_date)
+        with self.backend.pool.connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            closed = self._closed_through(connection)
+            if closed is not None and close_date <= closed:
+                raise ValueError(f"The books are already closed through {closed}")
+            balances = close_income(self.backend.chart, self._balances(connection, close_date))
+            connection.executemany(
+                "INSERT INTO period_closes (ledger, close_date, account, balance) VALUES (?, ?, ?, ?)",
+                [(self.name, close_date, code, int(balance)) for code, balance in enumerate(balances)],
+            )
+
+    def closes(self):
+        """Return every close snapshot as a (Date, Account, Balance) DataFrame, balances in cents."""
+        with self.backend.pool.connection() as connection:
+            frame = pd.read_sql_query(
+                "SELECT close_date AS Date, account AS Account, balance AS Balance FROM period_closes "
+                "WHERE ledger = ? ORDER BY close_date, account",
+                connection, params=(self.name,),
+            )
+        frame["Date"] = pd.to_datetime(frame["Date"]).dt.date
+        frame["Account"] = self.backend.account_names(frame["Account"])
+        return frame
+
+    def append_frame(self, frame):
+        """Record every row of a DataFrame of simple transactions (Debit Account, Credit Account, Amount in dollars) as two legs."""
+        self.append_entries(
+            frame["Date"].to_numpy() if self.dated else [None] * len(frame),
+            frame["Description"].to_numpy() if "Description" in frame.columns else [""] * len(frame),
+            *simple_entries(frame["Debit Account"].to_numpy(), frame["Credit Account"].to_numpy(), to_cents(frame["Amount"])),
+        )
+
+    def account_totals(self, start=None, end=None):
+        """Return per-account Debit and Credit totals in cents, summed over the legs in SQL."""
+        period, params = self._where(start=start, end=end)
+        sql = (
+            f"SELECT account AS Account, SUM(debit) AS Debit, SUM(credit) AS Credit FROM {self.TABLE} "
+            f"WHERE ledger = ?{period} GROUP BY account ORDER BY account"
+        )
+        with self.backend.pool.connection() as connection:
+            frame = pd.read_sql_query(sql, connection, params=(self.name, *params))
+        frame = frame.set_index("Account").astype("int64")
+        frame.index = pd.CategoricalIndex(self.backend.account_names(frame.index), name="Account")
+        return frame
@@ -0,0 +1,37 @@
+from collections import OrderedDict
+
+
+class RenderCache:
+    """
+    Small LRU cache for computed tables and rendered figures.
+
+    Keys are built by the caller from whatever the value depends on (ledger
+    version, period, page, ...), so a rerun with the same inputs returns the
+    stored value instead of recomputing it. The least recently used entries
+    are evicted once `maxsize` is reached.
+    """
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, compute):
+        """Return the cached value for `key`, calling `compute()` to fill it on a miss."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        value = compute()
+        self._entries[key] = value
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,44 @@
+import functools
+from io import BytesIO
+
+import streamlit as st
+
+
+def pyplot():
+    """Import pyplot on first use, on the non-interactive Agg backend."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def subplots(*args, **kwargs):
+    """plt.subplots without paying for the matplotlib import until a chart is drawn."""
+    return pyplot().subplots(*args, **kwargs)
+
+
+def figure_png(fig):
+    """Render a matplotlib figure to PNG bytes (as st.pyplot would) and release it from pyplot."""
+    buffer = BytesIO()
+    fig.savefig(buffer, format="png", dpi=200, bbox_inches="tight")
+    pyplot().close(fig)
+    return buffer.getvalue()
+
+
+def png_chart(draw):
+    """
+    Turn `draw(*data)`, which builds and returns a figure, into a function
+    returning the chart as PNG bytes.
+
+    The bytes are cached by st.cache_data on the arguments, so reruns with the
+    same data skip matplotlib entirely; `draw` must take everything the chart
+    depends on as arguments. The figure is closed once it has been rendered.
+    """
+    @st.cache_data(max_entries=64, show_spinner=False)
+    @functools.wraps(draw)
+    def render(*args, **kwargs):
+        return figure_png(draw(*args, **kwargs))
+
+    return render
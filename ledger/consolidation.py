@@ -0,0 +1,100 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+import pandas as pd
+
+from ledger.backend import SQLiteBackend
+from ledger.money import to_dollars
+from ledger.statements import build_statements
+
+# (debit account, credit account) pairs of reciprocal intercompany accounts
+INTERCOMPANY_ELIMINATIONS = [
+    ("Due from Affiliates", "Due to Affiliates"),
+    ("Intercompany Expense", "Intercompany Revenue"),
+]
+
+
+def _statements(chart, period, balances):
+    """Build statements from per-account nets (Series of cents indexed by account name)."""
+    period = period.reindex(chart.names, fill_value=0).to_numpy(dtype=np.int64)
+    balances = balances.reindex(chart.names, fill_value=0).to_numpy(dtype=np.int64)
+    return build_statements(chart, period, np.zeros_like(period), balances)
+
+
+def entity_statements(path, name, start, end):
+    """
+    Compute one entity's statements in a worker process.
+
+    Returns (period, balances, statements): the entity's per-account net
+    activity for start..end and its balances as of `end`, both int64 cents
+    (debits minus credits) in Series indexed by account name.
+    """
+    backend = SQLiteBackend(path, pool_size=1)
+    journal = backend.journal(name)
+    totals = journal.account_totals(start, end)
+    period = pd.Series((totals["Debit"] - totals["Credit"]).to_numpy(), index=totals.index.astype(str), dtype=np.int64)
+    balances = pd.Series(journal.balances(end), index=backend.chart.names, dtype=np.int64)
+    return period, balances, _statements(backend.chart, period, balances)
+
+
+def eliminate(period, balances, eliminations):
+    """
+    Apply intercompany elimination rules to consolidated nets in place.
+
+    Each rule is a (debit account, credit account) pair of reciprocal
+    intercompany accounts, e.g. ("Due from Affiliates", "Due to Affiliates").
+    The matched amount, the smaller of the debit account's debit balance and
+    the credit account's credit balance, is reversed out of both, in the
+    period activity and in the balances. Returns a DataFrame of the
+    eliminations with any unmatched difference, in dollars.
+    """
+    rows = []
+    for debit_account, credit_account in eliminations:
+        for nets in (period, balances):
+            for account in (debit_account, credit_account):
+                if account not in nets.index:
+                    nets[account] = 0
+        debit_balance, credit_balance = balances[debit_account], -balances[credit_account]
+        for nets in (period, balances):
+            amount = max(0, min(nets[debit_account], -nets[credit_account]))
+            nets[debit_account] -= amount
+            nets[credit_account] += amount
+        rows.append({
+            "Debit Account": debit_account,
+            "Credit Account": credit_account,
+            "Eliminated": to_dollars(max(0, min(debit_balance, credit_balance))),
+            "Unmatched": to_dollars(abs(debit_balance - credit_balance)),
+        })
+    return pd.DataFrame(rows, columns=["Debit Account", "Credit Account", "Eliminated", "Unmatched"])
+
+
+def consolidate(backend, entities, start, end, eliminations=INTERCOMPANY_ELIMINATIONS, max_workers=None):
+    """
+    Build the statements of several entity journals in parallel and merge
+    them into consolidated statements.
+
+    Each entity's trial balance and statements are computed in its own
+    process (`max_workers` defaults to the number of cores), straight from
+    the SQLite file, so the work scales with core count. The per-account
+    results are summed, the `eliminations` rules applied (see `eliminate`)
+    and the consolidated Income Statement and Balance Sheet built from the
+    result. Returns {"Entities": {name: statements}, "Eliminations": frame,
+    "Consolidated": statements}.
+    """
+    if "mode=memory" in backend.path:
+        raise ValueError("Consolidation needs a database file that worker processes can open")
+    entities = list(entities)
+    if not entities:
+        raise ValueError("Choose at least one entity to consolidate")
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(entity_statements, repeat(backend.path), entities, repeat(start), repeat(end)))
+    period = pd.concat([result[0] for result in results], axis=1).fillna(0).sum(axis=1).astype(np.int64)
+    balances = pd.concat([result[1] for result in results], axis=1).fillna(0).sum(axis=1).astype(np.int64)
+    eliminated = eliminate(period, balances, eliminations)
+    backend.reload_chart()
+    return {
+        "Entities": {name: result[2] for name, result in zip(entities, results)},
+        "Eliminations": eliminated,
+        "Consolidated": _statements(backend.chart, period, balances),
+    }
@@ -0,0 +1,226 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from ledger.accounts import ACCOUNT_TYPES
+
+
+class LedgerError(ValueError):
+    """Base class for errors raised by AccountingEngine."""
+
+
+class DuplicateAccountError(LedgerError):
+    def __init__(self, name):
+        super().__init__(f"Account with name '{name}' already exists.")
+        self.name = name
+
+
+class UnknownAccountError(LedgerError):
+    def __init__(self, names):
+        super().__init__(f"Account(s) do not exist: {', '.join(repr(name) for name in names)}")
+        self.names = names
+
+
+class InvalidAmountError(LedgerError):
+    def __init__(self, amount):
+        super().__init__(f"Transaction amount must be positive, got {amount}.")
+        self.amount = amount
+
+
+class InvalidAccountTypeError(LedgerError):
+    def __init__(self, account_type):
+        super().__init__(f"Unknown account type '{account_type}'; expected one of {', '.join(ACCOUNT_TYPES)}.")
+        self.account_type = account_type
+
+
+class Account:
+    """
+    One account of an AccountingEngine: a slotted view onto row `index` of
+    the engine's parallel name, type-code and balance arrays.
+    """
+
+    __slots__ = ("_engine", "_index")
+
+    def __init__(self, engine, index):
+        self._engine = engine
+        self._index = index
+
+    @property
+    def name(self):
+        return self._engine._names[self._index]
+
+    @property
+    def account_type(self):
+        return ACCOUNT_TYPES[self._engine._types[self._index]]
+
+    @property
+    def balance(self):
+        return float(self._engine._balances[self._index])
+
+    @balance.setter
+    def balance(self, value):
+        engine = self._engine
+        engine._type_totals[engine._types[self._index]] += value - engine._balances[self._index]
+        engine._balances[self._index] = value
+        engine.version += 1
+
+    def __repr__(self):
+        return f"{self.name} ({self.account_type}): {self.balance:.2f}"
+
+
+# Result of AccountingEngine.record_transaction
+Posting = namedtuple("Posting", ["debit_account", "credit_account", "amount"])
+
+# Result of AccountingEngine.record_transactions
+PostingBatch = namedtuple("PostingBatch", ["count", "total"])
+
+
+class BalanceSheet:
+    """
+    Result of AccountingEngine.generate_balance_sheet: the section totals and
+    equity, plus {name: balance} breakdowns of the assets and liabilities
+    that are only built when read (from the engine's balances at that time).
+    """
+
+    __slots__ = ("total_assets", "total_liabilities", "equity", "_engine")
+
+    def __init__(self, engine, total_assets, total_liabilities):
+        self._engine = engine
+        self.total_assets = total_assets
+        self.total_liabilities = total_liabilities
+        self.equity = total_assets - total_liabilities
+
+    @property
+    def assets(self):
+        return self._engine.section("asset")
+
+    @property
+    def liabilities(self):
+        return self._engine.section("liability")
+
+    def to_dict(self):
+        return {"Assets": self.assets, "Liabilities": self.liabilities, "Equity": self.equity}
+
+
+class AccountingEngine:
+    """
+    Account registry and posting engine behind the AccountingApp scripts.
+
+    It has no Streamlit dependency: operations return result objects and
+    raise LedgerError subclasses (which are ValueErrors), so the ledger can
+    be driven from scripts, workers and benchmarks, with the apps as thin
+    shells that turn results and errors into messages.
+
+    Accounts live in parallel NumPy arrays (names, int8 type codes into
+    ACCOUNT_TYPES, float64 balances) that double in capacity as they fill;
+    `accounts` maps each name to its slotted Account view. Running totals
+    per account type are updated on every write, so the balance sheet
+    summary is O(1). `version` counts writes, so derived reports can be
+    cached until the ledger changes.
+    """
+
+    def __init__(self, capacity=64):
+        self.accounts = {}
+        self._size = 0
+        self._names = np.empty(capacity, dtype=object)
+        self._types = np.empty(capacity, dtype=np.int8)
+        self._balances = np.empty(capacity, dtype=np.float64)
+        self._type_totals = np.zeros(len(ACCOUNT_TYPES), dtype=np.float64)
+        self.version = 0
+
+    def _grow(self):
+        capacity = 2 * len(self._balances)
+        for attr in ("_names", "_types", "_balances"):
+            old = getattr(self, attr)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, attr, new)
+
+    def create_account(self, name, account_type, initial_balance=0):
+        """Register an account and return it; raises DuplicateAccountError or InvalidAccountTypeError."""
+        if name in self.accounts:
+            raise DuplicateAccountError(name)
+        if account_type not in ACCOUNT_TYPES:
+            raise InvalidAccountTypeError(account_type)
+        if self._size == len(self._balances):
+            self._grow()
+        i = self._size
+        self._names[i] = name
+        self._types[i] = ACCOUNT_TYPES.index(account_type)
+        self._balances[i] = initial_balance
+        self._type_totals[self._types[i]] += initial_balance
+        self._size += 1
+        self.version += 1
+        account = self.accounts[name] = Account(self, i)
+        return account
+
+    def record_transaction(self, debit_account, credit_account, amount):
+        """Debit one account and credit another; raises UnknownAccountError or InvalidAmountError."""
+        missing = [name for name in (debit_account, credit_account) if name not in self.accounts]
+        if missing:
+            raise UnknownAccountError(missing)
+        if not amount > 0:
+            raise InvalidAmountError(amount)
+        debit, credit = self.accounts[debit_account]._index, self.accounts[credit_account]._index
+        self._balances[debit] += amount
+        self._balances[credit] -= amount
+        self._type_totals[self._types[debit]] += amount
+        self._type_totals[self._types[credit]] -= amount
+        self.version += 1
+        return Posting(debit_account, credit_account, amount)
+
+    def record_transactions(self, debit_accounts, credit_accounts, amounts):
+        """
+        Post many (debit, credit, amount) transactions given as parallel arrays.
+
+        Every posting is validated before any balance changes, so a batch is
+        recorded whole or not at all; raises UnknownAccountError naming every
+        unknown account or InvalidAmountError for the first amount that is not
+        positive. Account names are resolved with one vectorized index lookup
+        and the balance changes scatter-added into the balance array with
+        `np.add.at`.
+        """
+        debit_accounts = np.asarray(debit_accounts, dtype=object)
+        credit_accounts = np.asarray(credit_accounts, dtype=object)
+        amounts = np.asarray(amounts, dtype=np.float64)
+        if not len(debit_accounts) == len(credit_accounts) == len(amounts):
+            raise LedgerError("Debit accounts, credit accounts and amounts must have the same length.")
+        names = pd.Index(self._names[:self._size])
+        debits = names.get_indexer(debit_accounts)
+        credits = names.get_indexer(credit_accounts)
+        unknown = np.concatenate([debit_accounts[debits < 0], credit_accounts[credits < 0]])
+        if len(unknown):
+            raise UnknownAccountError(list(pd.unique(unknown)))
+        invalid = np.flatnonzero(~(amounts > 0))
+        if len(invalid):
+            raise InvalidAmountError(amounts[invalid[0]])
+        balances = self._balances[:self._size]
+        np.add.at(balances, debits, amounts)
+        np.add.at(balances, credits, -amounts)
+        np.add.at(self._type_totals, self._types[debits], amounts)
+        np.add.at(self._type_totals, self._types[credits], -amounts)
+        self.version += 1
+        return PostingBatch(len(amounts), float(amounts.sum()))
+
+    def total(self, account_type):
+        """Return the running total balance of every account of `account_type`."""
+        return float(self._type_totals[ACCOUNT_TYPES.index(account_type)])
+
+    def section(self, account_type):
+        """Return {name: balance} for the accounts of `account_type`, from one type mask over the arrays."""
+        mask = self._types[:self._size] == ACCOUNT_TYPES.index(account_type)
+        return dict(zip(self._names[:self._size][mask], self._balances[:self._size][mask].tolist()))
+
+    def generate_balance_sheet(self):
+        """Return the BalanceSheet in O(1) from the running totals; equity is total assets minus total liabilities."""
+        return BalanceSheet(self, self.total("asset"), self.total("liability"))
+
+    def list_accounts(self):
+        """Return the accounts in creation order."""
+        return list(self.accounts.values())
+
+    def account_arrays(self):
+        """Return (names, account types, balances) arrays in creation order, for building tables."""
+        n = self._size
+        return self._names[:n], np.asarray(ACCOUNT_TYPES, dtype=object)[self._types[:n]], self._balances[:n]
@@ -0,0 +1,60 @@
+import numpy as np
+
+from ledger.money import format_cents
+
+
+def check_entries(offsets, debits, credits):
+    """
+    Validate compound entries stored CSR-style: legs in flat arrays, and
+    `offsets[i]` the position of entry i's first leg.
+
+    Amounts are int64 cents. Every entry needs at least two legs, no leg may
+    be negative or carry both a debit and a credit, and its debits must equal
+    its credits exactly. The per-entry balance is one `np.add.reduceat` over
+    the legs. Raises ValueError naming the first bad entry (1-based).
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    debits = np.asarray(debits, dtype=np.int64)
+    credits = np.asarray(credits, dtype=np.int64)
+    if len(offsets) == 0:
+        return
+    sizes = np.diff(np.append(offsets, len(debits)))
+    short = np.flatnonzero(sizes < 2)
+    if short.size:
+        raise ValueError(f"Entry {short[0] + 1} needs at least one debit and one credit line")
+    invalid = (debits < 0) | (credits < 0) | ((debits > 0) & (credits > 0))
+    if invalid.any():
+        entry = np.searchsorted(offsets, np.flatnonzero(invalid)[0], side="right")
+        raise ValueError(f"Entry {entry}: a line cannot be negative or carry both a debit and a credit")
+    net = np.add.reduceat(debits - credits, offsets)
+    unbalanced = np.flatnonzero(net)
+    if unbalanced.size:
+        i = unbalanced[0]
+        raise ValueError(f"Entry {i + 1} does not balance: debits and credits differ by {format_cents(abs(net[i]))}")
+
+
+def simple_entries(debit_accounts, credit_accounts, amounts):
+    """
+    Lay out simple debit/credit pairs (amounts in cents) as two-leg compound entries.
+
+    Returns (offsets, accounts, debits, credits) with the debit leg of each
+    entry at an even position and its credit leg right after it.
+    """
+    n = len(amounts)
+    amounts = np.asarray(amounts, dtype=np.int64)
+    accounts = np.empty(2 * n, dtype=object)
+    accounts[0::2] = debit_accounts
+    accounts[1::2] = credit_accounts
+    debits = np.zeros(2 * n, dtype=np.int64)
+    credits = np.zeros(2 * n, dtype=np.int64)
+    debits[0::2] = amounts
+    credits[1::2] = amounts
+    return np.arange(0, 2 * n, 2), accounts, debits, credits
+
+
+def entry_offsets(entry_ids):
+    """Return the CSR offsets of legs grouped by entry (legs must be ordered by entry)."""
+    entry_ids = np.asarray(entry_ids)
+    if len(entry_ids) == 0:
+        return np.empty(0, dtype=np.int64)
+    return np.flatnonzero(np.r_[True, entry_ids[1:] != entry_ids[:-1]])
@@ -0,0 +1,146 @@
+import mimetypes
+import re
+from io import BytesIO
+
+import pandas as pd
+import streamlit as st
+
+from ledger.reports import pdf_bytes
+
+# Rows serialized per to_csv call; large frames are written chunk by chunk
+# instead of being rendered into one giant string
+CSV_CHUNK_ROWS = 10_000
+
+
+def write_csv(file, frame, index=False):
+    """Write `frame` as UTF-8 CSV to the binary file object `file`, CSV_CHUNK_ROWS rows at a time."""
+    for start in range(0, max(len(frame), 1), CSV_CHUNK_ROWS):
+        chunk = frame.iloc[start:start + CSV_CHUNK_ROWS]
+        file.write(chunk.to_csv(index=index, header=start == 0).encode("utf-8"))
+
+
+def csv_bytes(frame, index=False):
+    """Return the `write_csv` output of `frame` as bytes, built in memory."""
+    buffer = BytesIO()
+    write_csv(buffer, frame, index=index)
+    return buffer.getvalue()
+
+
+def _sheet_title(name):
+    # Excel sheet names are at most 31 characters and cannot contain []:*?/\
+    return re.sub(r"[\[\]:*?/\\]", "-", str(name))[:31]
+
+
+def _frame_chunks(frame):
+    if not isinstance(frame, pd.DataFrame):
+        yield from frame
+        return
+    if not isinstance(frame.index, pd.RangeIndex) or frame.index.name is not None:
+        # Labelled rows (statement lines, months) become the first column
+        frame = frame.reset_index(names=frame.index.name or "")
+    for start in range(0, max(len(frame), 1), CSV_CHUNK_ROWS):
+        yield frame.iloc[start:start + CSV_CHUNK_ROWS]
+
+
+def _sheet_rows(chunks, header_cell):
+    header = None
+    for chunk in chunks:
+        if header is None:
+            header = [header_cell(str(column)) for column in chunk.columns]
+            yield header
+        # Missing values (NaN, NaT, None) become empty cells
+        values = chunk.astype(object).where(chunk.notna(), None)
+        yield from values.itertuples(index=False, name=None)
+
+
+def write_xlsx(file, sheets):
+    """
+    Write an Excel workbook with one worksheet per item of `sheets` to the
+    binary file object `file`.
+
+    `sheets` maps sheet names to DataFrames or to iterables of DataFrame
+    chunks (with the same columns), e.g. a long ledger read a slice at a time. The
+    workbook is written with openpyxl's write-only worksheets, which spool
+    rows to temporary files as they are appended, so only the finished,
+    compressed workbook ends up in `file`. openpyxl is imported on first use.
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+
+    workbook = Workbook(write_only=True)
+    bold = Font(bold=True)
+
+    def header_cell(value):
+        cell = WriteOnlyCell(sheet, value=value)
+        cell.font = bold
+        return cell
+
+    for name, frame in sheets.items():
+        sheet = workbook.create_sheet(_sheet_title(name))
+        for row in _sheet_rows(_frame_chunks(frame), header_cell):
+            sheet.append(row)
+    workbook.save(file)
+
+
+def xlsx_bytes(sheets):
+    """Return the `write_xlsx` workbook of `sheets` as bytes, built in memory."""
+    buffer = BytesIO()
+    write_xlsx(buffer, sheets)
+    return buffer.getvalue()
+
+
+def frame_version(frame):
+    """Content hash of `frame`, for data that has no version counter of its own."""
+    return int(pd.util.hash_pandas_object(frame, index=True).sum())
+
+
+def offer_download(file_name, build, version, container=None):
+    """
+    Offer the file `build()` returns (bytes) for download without building it
+    on every rerun.
+
+    The file is built in memory, at most once per data `version`: Streamlit's
+    download button needs the whole file when it is drawn, so until the file
+    has been built for the current version only a "Prepare" button is shown.
+    Once clicked, the bytes are kept in the session with the version, so the
+    download button stays up across reruns (including the one the download
+    itself triggers). Bytes built for an older version are dropped as soon as
+    the data changes.
+    """
+    container = container or st
+    key = f"export_{file_name}"
+    prepared = st.session_state.get(key)
+    if prepared is None or prepared[0] != version:
+        st.session_state.pop(key, None)
+        if not container.button(f"Prepare {file_name}", key=f"prepare_{file_name}"):
+            return
+        with st.spinner(f"Generating {file_name}..."):
+            prepared = st.session_state[key] = (version, build())
+    container.download_button(
+        label=f"Download {file_name}",
+        data=prepared[1],
+        file_name=file_name,
+        mime=mimetypes.guess_type(file_name)[0],
+        key=f"download_{file_name}",
+    )
+
+
+def forget_download(file_name):
+    """Drop the prepared bytes of `file_name`, e.g. when data is reset and its version counter restarts."""
+    st.session_state.pop(f"export_{file_name}", None)
+
+
+def download_csv(build_frame, name, version, index=False, container=None):
+    """Offer `build_frame()` as `name`.csv; see offer_download."""
+    offer_download(f"{name}.csv", lambda: csv_bytes(build_frame(), index=index), version, container)
+
+
+def download_pdf(build_data, name, version, container=None):
+    """Offer the `pdf_bytes` report of `build_data()` as `name`.pdf; see offer_download."""
+    offer_download(f"{name}.pdf", lambda: pdf_bytes(name, build_data()), version, container)
+
+
+def download_xlsx(build_sheets, name, version, container=None):
+    """Offer the `write_xlsx` workbook of `build_sheets()` as `name`.xlsx; see offer_download."""
+    offer_download(f"{name}.xlsx", lambda: xlsx_bytes(build_sheets()), version, container)
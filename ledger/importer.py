@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+
+REQUIRED_COLUMNS = ["Date", "Debit Account", "Credit Account", "Amount"]
+
+
+def read_chunks(file, name, chunksize=100_000):
+    """
+    Yield DataFrame chunks from a CSV or Parquet file without loading it whole.
+
+    `file` may be a path or a file-like object such as a Streamlit upload;
+    `name` decides the format by its extension.
+    """
+    if name.lower().endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(file).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(file, chunksize=chunksize, dtype={"Debit Account": str, "Credit Account": str})
+
+
+def validate_chunk(chunk, period_start, period_end, accounts):
+    """
+    Split a chunk of journal lines into (accepted, rejected).
+
+    Accepted rows are normalized to Date, Description, Debit Account, Credit
+    Account and Amount columns. Rejected rows keep their original values plus
+    a "Reason" column naming the first check they failed.
+    """
+    missing = [column for column in REQUIRED_COLUMNS if column not in chunk.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+    dates = pd.to_datetime(chunk["Date"], errors="coerce").to_numpy(dtype="datetime64[s]")
+    amounts = pd.to_numeric(chunk["Amount"], errors="coerce").to_numpy(dtype=np.float64)
+    debit_accounts = chunk["Debit Account"]
+    credit_accounts = chunk["Credit Account"]
+    start = np.datetime64(period_start, "D")
+    end = np.datetime64(period_end, "D") + np.timedelta64(1, "D")
+
+    checks = [
+        (np.isnat(dates), "Invalid date"),
+        ((dates < start) | (dates >= end), "Date outside the selected period"),
+        (np.isnan(amounts) | (amounts < 0), "Invalid amount"),
+        (~debit_accounts.isin(accounts).to_numpy(), "Unknown debit account"),
+        (~credit_accounts.isin(accounts).to_numpy(), "Unknown credit account"),
+        ((debit_accounts == credit_accounts).to_numpy(), "Debit and Credit accounts must be different"),
+    ]
+    if "Debit Amount" in chunk.columns and "Credit Amount" in chunk.columns:
+        checks.append(((chunk["Debit Amount"] != chunk["Credit Amount"]).to_numpy(), "Debits must equal Credits"))
+
+    reasons = np.select([mask for mask, _ in checks], [reason for _, reason in checks], default="")
+    ok = reasons == ""
+
+    if "Description" in chunk.columns:
+        descriptions = chunk["Description"].fillna("").astype(str).to_numpy()
+    else:
+        descriptions = np.full(len(chunk), "", dtype=object)
+    accepted = pd.DataFrame({
+        "Date": dates[ok],
+        "Description": descriptions[ok],
+        "Debit Account": debit_accounts.to_numpy()[ok],
+        "Credit Account": credit_accounts.to_numpy()[ok],
+        "Amount": amounts[ok],
+    })
+    rejected = chunk[~ok].assign(Reason=reasons[~ok])
+    return accepted, rejected
+
+
+def import_transactions(store, file, name, period_start, period_end, accounts, chunksize=100_000, table=None):
+    """
+    Stream a CSV/Parquet journal file into a LedgerStore, and into the
+    backend LedgerTable `table` when one is given.
+
+    The file is read and validated chunk by chunk first; only when every
+    chunk has been read are the accepted rows written, in one database
+    transaction, so an error part-way through the file imports nothing.
+    Returns (imported_count, rejected) where `rejected` holds every rejected
+    row with its "Reason".
+    """
+    accepted_chunks = []
+    rejected_chunks = []
+    for chunk in read_chunks(file, name, chunksize):
+        accepted, rejected = validate_chunk(chunk, period_start, period_end, accounts)
+        accepted_chunks.append(accepted)
+        if len(rejected):
+            rejected_chunks.append(rejected)
+    accepted = pd.concat(accepted_chunks, ignore_index=True) if accepted_chunks else None
+    if accepted is not None and len(accepted):
+        if table is not None:
+            table.append_frame(accepted)
+        store.extend_frame(accepted)
+    rejected = pd.concat(rejected_chunks) if rejected_chunks else pd.DataFrame(columns=REQUIRED_COLUMNS + ["Reason"])
+    return 0 if accepted is None else len(accepted), rejected
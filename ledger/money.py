@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+# Money is stored and summed as int64 cents; dollars (floats) only exist at
+# the edges: widget input, file import and display.
+
+
+def to_cents(dollars):
+    """
+    Convert a dollar amount, array or Series to int64 cents, rounding half
+    away from zero on the decimal value (0.285 -> 29): the scaled amount is
+    first rounded to 1e-6 cent, which absorbs binary float error such as
+    0.285 * 100 == 28.499999999999996. Raises ValueError for NaN or inf.
+    """
+    if isinstance(dollars, pd.Series):
+        dollars = dollars.to_numpy(dtype=np.float64)
+    dollars = np.asarray(dollars, dtype=np.float64)
+    if not np.isfinite(dollars).all():
+        raise ValueError("Money amounts must be finite numbers, got NaN or infinity")
+    scaled = np.round(dollars * 100, 6)
+    cents = np.trunc(scaled + np.copysign(0.5, scaled)).astype(np.int64)
+    return int(cents) if cents.ndim == 0 else cents
+
+
+def to_dollars(cents):
+    """Convert int cents (scalar, array or Series) to float dollars for display and charts."""
+    if isinstance(cents, (pd.Series, pd.DataFrame)):
+        return cents / 100
+    cents = np.asarray(cents)
+    return float(cents) / 100 if cents.ndim == 0 else cents / 100
+
+
+def format_cents(cents):
+    """Format int cents as a dollar string with exactly two decimals, e.g. -1234.05 -> "-1234.05"."""
+    cents = int(cents)
+    sign = "-" if cents < 0 else ""
+    return f"{sign}{abs(cents) // 100}.{abs(cents) % 100:02d}"
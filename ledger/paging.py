@@ -0,0 +1,67 @@
+import math
+
+import numpy as np
+import streamlit as st
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+
+def frame_page(frame, offset, limit, sort=None, descending=False, filters=None, search=None, search_field="Description"):
+    """
+    Return (rows, total) for one page of an in-memory DataFrame.
+
+    Same contract as LedgerStore.page and LedgerTable.page, for apps that keep
+    their records in session state: the filter and sort work on positions,
+    and only the page's rows are taken from the frame.
+    """
+    mask = np.ones(len(frame), dtype=bool)
+    for field, values in (filters or {}).items():
+        mask &= frame[field].isin(values).to_numpy()
+    if search:
+        mask &= frame[search_field].astype(str).str.contains(search, case=False, regex=False).to_numpy()
+    positions = np.flatnonzero(mask)
+    if sort is not None:
+        positions = positions[np.argsort(frame[sort].to_numpy()[positions], kind="stable")]
+    if descending:
+        positions = positions[::-1]
+    return frame.iloc[positions[offset:offset + limit]], len(positions)
+
+
+def paged_dataframe(fetch, key, sort_columns, filter_options=None, search="Search description", page_size=50):
+    """
+    Show a ledger table one page at a time and return the page's rows.
+
+    `fetch(offset, limit, sort, descending, filters, search)` must return
+    (rows, total) for the requested page, with sorting and filtering done by
+    the store behind it; only the visible page is sent to the browser.
+    `filter_options` maps a column to the values offered in its filter, and
+    `search` labels the free-text search box (None hides it).
+    """
+    controls = st.columns(4 if search else 3)
+    sort = controls[0].selectbox("Sort by", sort_columns, key=f"{key}_sort")
+    descending = controls[1].checkbox("Descending", key=f"{key}_descending")
+    page_size = controls[2].selectbox(
+        "Rows per page", PAGE_SIZES, index=PAGE_SIZES.index(page_size), key=f"{key}_page_size"
+    )
+    text = controls[3].text_input(search, key=f"{key}_search") if search else None
+
+    filters = {}
+    if filter_options:
+        filter_columns = st.columns(len(filter_options))
+        for column, (field, options) in zip(filter_columns, filter_options.items()):
+            selected = column.multiselect(f"Filter {field}", options, key=f"{key}_filter_{field}")
+            if selected:
+                filters[field] = selected
+
+    page = st.number_input("Page", min_value=1, value=1, step=1, key=f"{key}_page")
+    rows, total = fetch((page - 1) * page_size, page_size, sort, descending, filters, text)
+    pages = max(1, math.ceil(total / page_size))
+    if page > pages:
+        # Filters shrank the result set; show its last page instead
+        page = pages
+        rows, total = fetch((page - 1) * page_size, page_size, sort, descending, filters, text)
+
+    st.dataframe(rows)
+    first = (page - 1) * page_size + 1 if total else 0
+    st.caption(f"Page {page} of {pages} · rows {first}–{first + len(rows) - 1 if total else 0} of {total}")
+    return rows
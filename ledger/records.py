@@ -0,0 +1,64 @@
+from bisect import bisect_right
+
+import numpy as np
+import pandas as pd
+
+
+class SortedRecords:
+    """
+    List of dict records kept sorted by a date field.
+
+    Records are inserted in date order, and the DataFrame view (with the date
+    stored as datetime64) is rebuilt only after an insert, so slicing a period
+    with `between` is a binary search plus the slice instead of a full-table
+    comparison on every rerun.
+    """
+
+    def __init__(self, date_key="Date", columns=None):
+        self.date_key = date_key
+        self.columns = columns
+        self._records = []
+        self._keys = []
+        self.version = 0
+        self._frame = None
+        self._frame_version = -1
+
+    def __len__(self):
+        return len(self._records)
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __getitem__(self, index):
+        return self._records[index]
+
+    def append(self, record):
+        key = record[self.date_key]
+        position = bisect_right(self._keys, key)
+        self._keys.insert(position, key)
+        self._records.insert(position, record)
+        self.version += 1
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def frame(self):
+        """Return all records as a date-sorted DataFrame."""
+        if self._frame_version != self.version:
+            frame = pd.DataFrame(self._records, columns=self.columns)
+            if self.date_key in frame:
+                frame[self.date_key] = pd.to_datetime(frame[self.date_key])
+            self._frame = frame
+            self._frame_version = self.version
+        return self._frame
+
+    def between(self, start, end):
+        """Return the records dated start..end inclusive."""
+        frame = self.frame()
+        if frame.empty:
+            return frame
+        dates = frame[self.date_key].to_numpy()
+        lo = np.searchsorted(dates, np.datetime64(start, "D"), side="left")
+        hi = np.searchsorted(dates, np.datetime64(end, "D") + np.timedelta64(1, "D"), side="left")
+        return frame.iloc[lo:hi].copy()
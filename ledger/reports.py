@@ -0,0 +1,87 @@
+from io import BytesIO
+from xml.sax.saxutils import escape
+
+import pandas as pd
+
+# Rows per table flowable; long tables are split into chunks so platypus lays
+# out (and splits across pages) a bounded number of rows at a time
+TABLE_CHUNK_ROWS = 500
+
+
+def _format(value):
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
+
+
+def _table_flowables(frame):
+    from reportlab.lib import colors
+    from reportlab.platypus import Table, TableStyle
+
+    style = TableStyle([
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 9),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+        ("LINEBELOW", (0, 0), (-1, 0), 0.5, colors.black),
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+    ])
+    header = [str(column) for column in frame.columns]
+    for start in range(0, max(len(frame), 1), TABLE_CHUNK_ROWS):
+        chunk = frame.iloc[start:start + TABLE_CHUNK_ROWS]
+        rows = [[_format(value) for value in row] for row in chunk.itertuples(index=False, name=None)]
+        # repeatRows keeps the header on every page the chunk spills onto
+        yield Table([header, *rows], repeatRows=1, hAlign="LEFT", style=style)
+
+
+def _flowables(title, data):
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Paragraph, Spacer
+
+    styles = getSampleStyleSheet()
+    yield Paragraph(escape(title), styles["Title"])
+    if isinstance(data, pd.DataFrame):
+        yield from _table_flowables(data)
+        return
+    for key, values in data.items():
+        if isinstance(values, pd.DataFrame):
+            yield Paragraph(escape(f"{key}:"), styles["Heading3"])
+            yield from _table_flowables(values)
+        elif isinstance(values, dict):
+            yield Paragraph(escape(f"{key}:"), styles["Heading3"])
+            for subkey, subvalue in values.items():
+                yield Paragraph(escape(f"- {subkey}: {_format(subvalue)}"), styles["Normal"])
+        elif isinstance(values, list):
+            yield Paragraph(escape(f"{key}:"), styles["Heading3"])
+            for value in values:
+                yield Paragraph(escape(f"- {_format(value)}"), styles["Normal"])
+        else:
+            yield Paragraph(escape(f"{key}: {_format(values)}"), styles["Normal"])
+        yield Spacer(1, 8)
+
+
+def _page_number(canvas, doc):
+    canvas.setFont("Helvetica", 8)
+    canvas.drawRightString(doc.pagesize[0] - doc.rightMargin, doc.bottomMargin / 2, f"Page {doc.page}")
+
+
+def write_pdf(file, title, data):
+    """
+    Write a paginated PDF report to the binary file object `file`.
+
+    `data` is a DataFrame, rendered as a table, or a dict whose values are
+    DataFrames (tables), dicts (one line per item), lists (one line per
+    value) or scalars. Pages break automatically and table headers repeat on
+    every page. reportlab is imported on first use.
+    """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate
+
+    doc = SimpleDocTemplate(file, pagesize=letter, title=title)
+    doc.build(list(_flowables(title, data)), onFirstPage=_page_number, onLaterPages=_page_number)
+
+
+def pdf_bytes(title, data):
+    """Return the `write_pdf` report as bytes, built in memory."""
+    buffer = BytesIO()
+    write_pdf(buffer, title, data)
+    return buffer.getvalue()
@@ -0,0 +1,134 @@
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+import pandas as pd
+
+# Columns of the combined table built by score_batch
+BATCH_COLUMNS = ["Client", "Month", "Cash Inflow", "Cash Outflow", "Net Cash Flow"]
+
+# Marker columns of the SCORE 12-month cash flow template: the first filled
+# cell of each marks the row where its section starts (or its total sits)
+SECTIONS = {
+    "Cash Inflow": ("CASH RECEIPTS", "TOTAL CASH RECEIPTS"),
+    "Cash Outflow": ("CASH PAID OUT", "TOTAL CASH PAID OUT"),
+}
+
+
+def _first_row(df, column):
+    if column not in df.columns:
+        raise ValueError(f"Not a SCORE cash flow template: missing the '{column}' column.")
+    row = df[column].first_valid_index()
+    if row is None:
+        raise ValueError(f"Not a SCORE cash flow template: the '{column}' column is empty.")
+    return df.index.get_loc(row)
+
+
+def parse_score_cashflow(df):
+    """
+    Return Month, Cash Inflow and Cash Outflow for every month column
+    (named like "Jan-YY") of a SCORE cash flow sheet.
+
+    Each section's rows are located once, then all month columns are summed
+    in one vectorized pass; cells that are not numbers count as zero. Raises
+    ValueError when the sheet does not look like the template.
+    """
+    months = [column for column in df.columns if str(column).endswith("-YY")]
+    if not months:
+        raise ValueError("Not a SCORE cash flow template: no month columns (like 'Jan-YY') found.")
+    values = df[months].apply(pd.to_numeric, errors="coerce")
+    result = pd.DataFrame({"Month": [str(month).replace("-YY", "") for month in months]})
+    for name, (start_column, total_column) in SECTIONS.items():
+        # The section runs from its header row up to the row before its total
+        start, total = _first_row(df, start_column), _first_row(df, total_column)
+        result[name] = values.iloc[start:total].sum(axis=0).to_numpy()
+    return result
+
+
+def process_score_cashflow(file):
+    """
+    Read a SCORE cash flow workbook (path or file-like) and return its
+    Month, Cash Inflow and Cash Outflow columns; see parse_score_cashflow.
+    """
+    return parse_score_cashflow(pd.read_excel(file))
+
+
+def score_file(client, source):
+    """
+    Parse one workbook for score_batch. `source` is a path or the file's
+    bytes; returns (client, frame, None), or (client, None, error message)
+    when the file cannot be read or is not a SCORE template.
+    """
+    try:
+        frame = process_score_cashflow(BytesIO(source) if isinstance(source, bytes) else source)
+    except Exception as e:
+        # Corrupt or foreign files fail in many ways (zip, xlrd, pandas); each is reported, not raised
+        return client, None, f"{type(e).__name__}: {e}"
+    return client, frame, None
+
+
+def score_batch(files, max_workers=None):
+    """
+    Parse many SCORE workbooks in parallel.
+
+    `files` is an iterable of (client, path or bytes). The workbooks are
+    parsed across a process pool (`max_workers` defaults to the number of
+    cores; a single file is parsed in-process). Returns (table, errors):
+    one long table with a row per client and month (BATCH_COLUMNS), in
+    input order, and a Client/Error frame for the files that failed.
+    """
+    files = list(files)
+    if len(files) <= 1 or max_workers == 1:
+        results = [score_file(client, source) for client, source in files]
+    else:
+        clients, sources = zip(*files)
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(score_file, clients, sources, chunksize=max(1, len(files) // 64)))
+    frames = [frame.assign(Client=client) for client, frame, _ in results if frame is not None]
+    if frames:
+        table = pd.concat(frames, ignore_index=True)
+        table["Net Cash Flow"] = table["Cash Inflow"] - table["Cash Outflow"]
+        table = table[BATCH_COLUMNS]
+    else:
+        table = pd.DataFrame(columns=BATCH_COLUMNS)
+    errors = pd.DataFrame(
+        [(client, error) for client, _, error in results if error is not None], columns=["Client", "Error"]
+    )
+    return table, errors
+
+
+def workbook_paths(paths):
+    """Expand files and directories (searched for .xls/.xlsx) into workbook paths."""
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from sorted(p for p in path.iterdir() if p.suffix.lower() in (".xls", ".xlsx"))
+        else:
+            yield path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m ledger.score",
+        description="Combine SCORE 12-month cash flow workbooks into one long-format CSV (one row per client and month).",
+    )
+    parser.add_argument("paths", nargs="+", help="workbooks, or directories of workbooks; the client is the file name")
+    parser.add_argument("--output", default="score_cashflow.csv", help="combined CSV (default: %(default)s)")
+    parser.add_argument("--errors", help="also write the files that failed to this CSV")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per core)")
+    args = parser.parse_args(argv)
+
+    paths = list(workbook_paths(args.paths))
+    table, errors = score_batch(((path.stem, str(path)) for path in paths), max_workers=args.workers)
+    table.to_csv(args.output, index=False)
+    if args.errors:
+        errors.to_csv(args.errors, index=False)
+    for client, error in errors.itertuples(index=False, name=None):
+        print(f"{client}: {error}", file=sys.stderr)
+    print(f"Parsed {len(paths) - len(errors)} of {len(paths)} workbooks into {args.output}")
+    return 1 if paths and len(errors) == len(paths) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+
+from ledger.money import to_dollars
+
+
+def _padded(chart, values):
+    padded = np.zeros(len(chart), dtype=np.int64)
+    padded[:len(values)] = values
+    return padded
+
+
+def close_income(chart, balances):
+    """
+    Return per-account balances (int64 cents, debits minus credits) with the
+    revenue and expense balances rolled into Retained Earnings, as closing
+    entries would leave them.
+    """
+    balances = _padded(chart, balances)
+    income = np.concatenate([chart.codes_of_type("revenue"), chart.codes_of_type("expense")])
+    balances[chart.code("Retained Earnings")] += balances[income].sum()
+    balances[income] = 0
+    return balances
+
+
+def build_statements(chart, debits, credits, balances=None):
+    """
+    Build the Income Statement, Balance Sheet and ratio metrics from
+    per-account debit and credit totals in int64 cents, indexed by the codes
+    of the ChartOfAccounts `chart`.
+
+    Each account lands on the statement line of its type. Debit-normal
+    accounts (assets, expenses) report debits minus credits and credit-normal
+    accounts (liabilities, equity, revenue) report credits minus debits.
+    Every line is summed in cents and reported in dollars.
+
+    The Income Statement covers the period totals. The Balance Sheet uses
+    `balances` (debits minus credits as of the period end, e.g. from
+    LedgerStore.balances) when given, else the period totals; revenue and
+    expenses not yet closed are added to Retained Earnings. Accounts without
+    a type (e.g. names registered on the fly) are listed debit-normal in an
+    "Unclassified" section, which only appears when such an account has a
+    balance, and are counted on the asset side of the balance check.
+    """
+    net = _padded(chart, np.asarray(debits, dtype=np.int64) - np.asarray(credits, dtype=np.int64))
+    closing = net if balances is None else _padded(chart, balances)
+
+    def lines(account_type, sign, source=net):
+        return {chart.names[code]: int(sign * source[code]) for code in chart.codes_of_type(account_type)}
+
+    revenue = sum(lines("revenue", -1).values())
+    expenses = sum(lines("expense", 1).values())
+    net_income = revenue - expenses
+
+    assets = lines("asset", 1, closing)
+    total_assets = sum(assets.values())
+    liabilities = lines("liability", -1, closing)
+    total_liabilities = sum(liabilities.values())
+    equity = lines("equity", -1, closing)
+    unclosed_income = sum(lines("revenue", -1, closing).values()) - sum(lines("expense", 1, closing).values())
+    equity["Retained Earnings"] = equity.get("Retained Earnings", 0) + unclosed_income
+    total_equity = sum(equity.values())
+    unclassified = {name: cents for name, cents in lines(None, 1, closing).items() if cents}
+    total_unclassified = sum(unclassified.values())
+
+    def dollars(section):
+        return {name: to_dollars(cents) for name, cents in section.items()}
+
+    balance_sheet = {
+        "Assets": dollars({**assets, "Total Assets": total_assets}),
+        "Liabilities": dollars({**liabilities, "Total Liabilities": total_liabilities}),
+        "Equity": dollars({**equity, "Total Equity": total_equity}),
+    }
+    if unclassified:
+        balance_sheet["Unclassified"] = dollars({**unclassified, "Total Unclassified": total_unclassified})
+
+    return {
+        "Income Statement": dollars({"Revenue": revenue, "Expenses": expenses, "Net Income": net_income}),
+        "Balance Sheet": balance_sheet,
+        # Compared in cents, so no rounding tolerance is needed
+        "Balance Sheet Balances": total_assets + total_unclassified == total_liabilities + total_equity,
+        "Ratios": {
+            "Profit Margin": (net_income / revenue * 100) if revenue > 0 else 0,
+            "Return on Assets": (net_income / total_assets * 100) if total_assets > 0 else 0,
+        },
+    }
+
+
+def monthly_ratios(chart, debits, credits, opening):
+    """
+    Return Revenue, Expenses, Net Income and Total Assets (dollars) with the
+    Profit Margin and Return on Assets (%) for each month, from monthly
+    rollups of per-account debits and credits in cents (LedgerStore.rollup)
+    and the account balances before the first month. Total Assets are the
+    month-end balances.
+    """
+    net = debits.to_numpy(dtype=np.int64) - credits.to_numpy(dtype=np.int64)
+    revenue = -net[:, chart.codes_of_type("revenue")].sum(axis=1)
+    expenses = net[:, chart.codes_of_type("expense")].sum(axis=1)
+    net_income = revenue - expenses
+    assets = chart.codes_of_type("asset")
+    total_assets = np.asarray(opening, dtype=np.int64)[assets].sum() + np.cumsum(net[:, assets].sum(axis=1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        profit_margin = np.where(revenue > 0, net_income / revenue * 100, 0.0)
+        return_on_assets = np.where(total_assets > 0, net_income / total_assets * 100, 0.0)
+    return pd.DataFrame(
+        {
+            "Revenue": to_dollars(revenue),
+            "Expenses": to_dollars(expenses),
+            "Net Income": to_dollars(net_income),
+            "Total Assets": to_dollars(total_assets),
+            "Profit Margin": profit_margin,
+            "Return on Assets": return_on_assets,
+        },
+        index=debits.index,
+    )
@@ -0,0 +1,316 @@
+import numpy as np
+import pandas as pd
+
+from ledger.accounts import ChartOfAccounts
+from ledger.entries import check_entries, entry_offsets, simple_entries
+from ledger.money import to_cents, to_dollars
+from ledger.statements import build_statements, close_income
+from ledger.trial_balance import TrialBalance
+
+
+def to_datetime64(value):
+    """Convert a date/datetime from a Streamlit widget to the store's date type."""
+    return np.datetime64(value, "D").astype("datetime64[s]")
+
+
+class LedgerStore:
+    """
+    Append-only columnar store of ledger postings.
+
+    Every transaction is stored as one row per leg (date, account id, debit
+    and credit amounts in int64 cents) in preallocated NumPy arrays that double in size
+    when full, so appends are amortized O(1). Pages and export chunks are
+    built as DataFrames only for the legs they show, with amounts converted
+    to dollars at that point, instead of copying the whole ledger.
+
+    A transaction may have any number of legs: like a CSR matrix, the legs of
+    all entries sit back to back and `_offsets` holds the position of each
+    entry's first leg. Accounts are int16 codes from the store's `chart`.
+
+    Closing a period snapshots every account's balance, so balance sheets
+    start from the latest close and only aggregate the postings after it.
+    Postings dated on or before the latest close are rejected.
+    """
+
+    def __init__(self, capacity=1024, chart=None):
+        self._size = 0
+        self._entry_count = 0
+        self._dates = np.empty(capacity, dtype="datetime64[s]")
+        self._entries = np.empty(capacity, dtype=np.int64)
+        self._accounts = np.empty(capacity, dtype=np.int16)
+        self._debits = np.empty(capacity, dtype=np.int64)
+        self._credits = np.empty(capacity, dtype=np.int64)
+        self._descriptions = np.empty(capacity, dtype=object)
+        self._offsets = np.empty(capacity, dtype=np.int64)
+        self.chart = chart if chart is not None else ChartOfAccounts()
+        self.trial_balance = TrialBalance()
+        self.version = 0
+        self._statements = None
+        self._statements_key = None
+        self._in_date_order = True
+        self._order = None
+        self._order_version = -1
+        self._close_dates = []
+        self._closes = []
+
+    def __len__(self):
+        return self._entry_count
+
+    @property
+    def size(self):
+        """Number of posting legs in the store."""
+        return self._size
+
+    @property
+    def account_names(self):
+        """Account names indexed by code."""
+        return self.chart.names
+
+    def _grow(self, attrs, used, needed):
+        capacity = len(getattr(self, attrs[0]))
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for attr in attrs:
+            old = getattr(self, attr)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:used] = old[:used]
+            setattr(self, attr, new)
+
+    def _reserve(self, legs, entries):
+        self._grow(("_dates", "_entries", "_accounts", "_debits", "_credits", "_descriptions"),
+                   self._size, self._size + legs)
+        self._grow(("_offsets",), self._entry_count, self._entry_count + entries)
+
+    def append(self, date, description, debit_account, credit_account, amount):
+        """Record a simple transaction of `amount` dollars as a debit leg and a credit leg."""
+        self.append_entry(date, description, [(debit_account, amount, 0.0), (credit_account, 0.0, amount)])
+
+    def append_entry(self, date, description, legs):
+        """Record one compound entry; `legs` is a list of (account, debit, credit) in dollars."""
+        accounts, debits, credits = zip(*legs) if legs else ((), (), ())
+        self.extend_entries(
+            [to_datetime64(date)], [description], [0], accounts, to_cents(debits), to_cents(credits)
+        )
+
+    def extend(self, dates, descriptions, debit_accounts, credit_accounts, amounts):
+        """Record many simple transactions at once from parallel arrays (amounts in dollars)."""
+        if len(amounts) == 0:
+            return
+        self.extend_entries(dates, descriptions, *simple_entries(debit_accounts, credit_accounts, to_cents(amounts)))
+
+    def extend_entries(self, dates, descriptions, offsets, accounts, debits, credits):
+        """
+        Record many compound entries at once. `dates` and `descriptions` hold
+        one value per entry; the legs of all entries are flat `accounts`,
+        `debits` and `credits` (int64 cents) arrays and `offsets[i]` is the
+        position of entry i's first leg. Raises ValueError, before anything is
+        stored, if an entry does not balance.
+        """
+        n = len(offsets)
+        if n == 0:
+            return
+        offsets = np.asarray(offsets, dtype=np.int64)
+        debits = np.asarray(debits, dtype=np.int64)
+        credits = np.asarray(credits, dtype=np.int64)
+        check_entries(offsets, debits, credits)
+        sizes = np.diff(np.append(offsets, len(debits)))
+        dates = np.asarray(dates).astype("datetime64[s]")
+        if self._close_dates and dates.min() < self._close_dates[-1] + np.timedelta64(1, "D"):
+            raise ValueError(f"The books are closed through {self.closed_through}")
+        accounts = self.chart.codes(accounts)
+        i = self._size
+        self._reserve(len(debits), n)
+        if (i and dates[0] < self._dates[i - 1]) or (n > 1 and (np.diff(dates) < np.timedelta64(0)).any()):
+            self._in_date_order = False
+        legs = slice(i, i + len(debits))
+        self._dates[legs] = np.repeat(dates, sizes)
+        self._entries[legs] = np.repeat(np.arange(self._entry_count, self._entry_count + n), sizes)
+        self._accounts[legs] = accounts
+        self._debits[legs] = debits
+        self._credits[legs] = credits
+        self._descriptions[legs] = np.repeat(np.asarray(descriptions, dtype=object), sizes)
+        self._offsets[self._entry_count:self._entry_count + n] = offsets + i
+        if n == 1:
+            self.trial_balance.add(dates[0], self._accounts[legs], debits, credits)
+        else:
+            self.trial_balance.add_many(self._dates[legs], self._accounts[legs], debits, credits)
+        self._size += len(debits)
+        self._entry_count += n
+        self.version += 1
+
+    def extend_legs(self, frame):
+        """
+        Record the entries of a legs DataFrame (Entry, Date, Description,
+        Account, Debit, Credit) ordered by Entry, with amounts in cents.
+        """
+        offsets = entry_offsets(frame["Entry"].to_numpy())
+        self.extend_entries(
+            frame["Date"].to_numpy()[offsets],
+            frame["Description"].to_numpy()[offsets],
+            offsets,
+            frame["Account"].to_numpy(),
+            frame["Debit"].to_numpy(dtype=np.int64),
+            frame["Credit"].to_numpy(dtype=np.int64),
+        )
+
+    def extend_frame(self, frame):
+        """Record every row of a DataFrame with Date, Description, Debit Account, Credit Account and Amount columns."""
+        self.extend(
+            frame["Date"].to_numpy(),
+            frame["Description"].to_numpy(),
+            frame["Debit Account"].to_numpy(),
+            frame["Credit Account"].to_numpy(),
+            frame["Amount"].to_numpy(),
+        )
+
+    def period_totals(self, start, end):
+        """Return per-account Debit/Credit totals in cents for start..end from the running trial balance."""
+        debits, credits = self.trial_balance.totals(start, end, len(self.account_names))
+        return pd.DataFrame({"Debit": debits, "Credit": credits}, index=pd.Index(self.account_names, name="Account"))
+
+    @property
+    def closed_through(self):
+        """Date of the latest period close, or None if no period has been closed."""
+        return self._close_dates[-1].astype("datetime64[D]").item() if self._close_dates else None
+
+    def close_period(self, close_date):
+        """
+        Close the books through `close_date`: snapshot each account's balance
+        (int64 cents, debits minus credits) with revenue and expenses rolled
+        into Retained Earnings, and return the snapshot.
+        """
+        close_date = to_datetime64(close_date)
+        if self._close_dates and close_date <= self._close_dates[-1]:
+            raise ValueError(f"The books are already closed through {self.closed_through}")
+        balances = close_income(self.chart, self.balances(close_date))
+        self._add_close(close_date, balances)
+        return balances
+
+    def restore_closes(self, frame):
+        """Add the close snapshots of a (Date, Account, Balance) DataFrame, e.g. from JournalTable.closes."""
+        for close_date, rows in frame.groupby("Date", sort=True):
+            codes = self.chart.codes(rows["Account"].to_numpy())
+            balances = np.zeros(len(self.chart), dtype=np.int64)
+            balances[codes] = rows["Balance"].to_numpy(dtype=np.int64)
+            self._add_close(to_datetime64(close_date), balances)
+
+    def _add_close(self, close_date, balances):
+        self._close_dates.append(close_date)
+        self._closes.append(balances)
+        self.version += 1
+
+    def balances(self, as_of):
+        """
+        Return every account's balance as of `as_of` (int64 cents, debits
+        minus credits): the latest close snapshot on or before that date plus
+        the postings after it, taken from the running trial balance.
+        """
+        as_of = to_datetime64(as_of)
+        balances = np.zeros(len(self.account_names), dtype=np.int64)
+        start = self.trial_balance.first_day
+        i = np.searchsorted(self._close_dates, as_of, side="right") if self._close_dates else 0
+        if i:
+            snapshot = self._closes[i - 1]
+            balances[:len(snapshot)] = snapshot
+            start = self._close_dates[i - 1] + np.timedelta64(1, "D")
+        if start is not None and start <= as_of:
+            debits, credits = self.trial_balance.totals(start, as_of, len(balances))
+            balances += debits - credits
+        return balances
+
+    def rollup(self, start, end, freq="D"):
+        """
+        Return (debits, credits) DataFrames of int64 cents per account (columns)
+        for each day ("D") or month ("M") of start..end, read from the trial
+        balance's day buckets in time proportional to the buckets, not the legs.
+        """
+        rollup = self.trial_balance.monthly if freq == "M" else self.trial_balance.daily
+        buckets, debits, credits = rollup(start, end, len(self.account_names))
+        index = pd.DatetimeIndex(buckets.astype("datetime64[ns]"), name="Date")
+        columns = pd.Index(self.account_names, name="Account")
+        return pd.DataFrame(debits.T, index=index, columns=columns), pd.DataFrame(credits.T, index=index, columns=columns)
+
+    def date_order(self):
+        """
+        Return (order, sorted_dates): the leg positions in date order and their
+        dates. While postings arrive in date order this is the identity and no
+        sort is needed; otherwise a stable argsort is computed once per version.
+        """
+        dates = self._dates[:self._size]
+        if self._in_date_order:
+            return None, dates
+        if self._order_version != self.version:
+            self._order = np.argsort(dates, kind="stable")
+            self._order_version = self.version
+        return self._order, dates[self._order]
+
+    def period_bounds(self, start, end):
+        """Return the (lo, hi) positions of start..end within the date-sorted legs."""
+        _, sorted_dates = self.date_order()
+        lo = np.searchsorted(sorted_dates, to_datetime64(start), side="left")
+        hi = np.searchsorted(sorted_dates, to_datetime64(end) + np.timedelta64(1, "D"), side="left")
+        return lo, hi
+
+    def period_chunks(self, start, end, rows):
+        """Yield the legs dated start..end, in date order, as DataFrames of at most `rows` legs."""
+        order, _ = self.date_order()
+        lo, hi = self.period_bounds(start, end)
+        for first in range(lo, hi, rows):
+            last = min(first + rows, hi)
+            yield self._legs(np.arange(first, last) if order is None else order[first:last])
+
+    def page(self, start, end, offset, limit, sort=None, descending=False, filters=None, search=None):
+        """
+        Return (legs, total) for one page of the legs dated start..end.
+
+        `filters` maps a column to its accepted values and `search` matches the
+        description. Filtering and sorting work on the raw arrays, and only the
+        rows of the requested page are converted for display.
+        """
+        order, _ = self.date_order()
+        lo, hi = self.period_bounds(start, end)
+        positions = np.arange(lo, hi) if order is None else order[lo:hi]
+        for name, values in (filters or {}).items():
+            if name == "Account":
+                values = [self.chart.code(value) for value in values if value in self.chart]
+            positions = positions[np.isin(self._leg_column(name)[positions], values)]
+        if search:
+            descriptions = pd.Series(self._descriptions[positions], dtype=object).astype(str)
+            positions = positions[descriptions.str.contains(search, case=False, regex=False).to_numpy()]
+        if sort is not None and sort != "Date":
+            # Accounts sort by code, i.e. in chart order
+            keys = self._leg_column(sort)[positions]
+            positions = positions[np.argsort(keys, kind="stable")]
+        if descending:
+            positions = positions[::-1]
+        return self._legs(positions[offset:offset + limit]), len(positions)
+
+    def _leg_column(self, name):
+        attr = {"Date": "_dates", "Entry": "_entries", "Description": "_descriptions",
+                "Account": "_accounts", "Debit": "_debits", "Credit": "_credits"}[name]
+        return getattr(self, attr)[:self._size]
+
+    def statements(self, start, end):
+        """Return the financial statements for start..end, reused until the ledger or period changes."""
+        key = (self.version, start, end)
+        if self._statements_key != key:
+            debits, credits = self.trial_balance.totals(start, end, len(self.account_names))
+            self._statements = build_statements(self.chart, debits, credits, self.balances(end))
+            self._statements_key = key
+        return self._statements
+
+    def _legs(self, positions):
+        """Return the legs at `positions` as a DataFrame, with Debit and Credit in dollars for display."""
+        return pd.DataFrame(
+            {
+                "Date": self._dates[positions],
+                "Entry": self._entries[positions],
+                "Description": self._descriptions[positions],
+                "Account": self.chart.categorical(self._accounts[positions]),
+                "Debit": to_dollars(self._debits[positions]),
+                "Credit": to_dollars(self._credits[positions]),
+            },
+            index=positions,
+        )
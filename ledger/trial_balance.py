@@ -0,0 +1,160 @@
+import numpy as np
+
+
+def _to_day(value):
+    return np.datetime64(value, "D").astype(np.int64)
+
+
+def _lowbit(i):
+    return i & -i
+
+
+class TrialBalance:
+    """
+    Running per-account debit/credit totals bucketed by day, in int64 cents.
+
+    Totals are kept in one Fenwick (binary indexed) tree per account over day
+    buckets, so recording a posting costs O(log days) and the trial balance for
+    any date window is two prefix sums, O(accounts x log days), instead of a
+    rescan of the ledger. The day buckets double as a daily rollup cube for
+    trend charts, and monthly rollups are summed from them.
+    """
+
+    def __init__(self, day_capacity=512, account_capacity=16):
+        self._origin = None  # day number stored in bucket 0
+        self._last = None  # latest day posted so far
+        self._daily = np.zeros((2, account_capacity, day_capacity), dtype=np.int64)
+        self._tree = np.zeros((2, account_capacity, day_capacity + 1), dtype=np.int64)
+
+    @property
+    def day_capacity(self):
+        return self._daily.shape[2]
+
+    @property
+    def first_day(self):
+        """First day covered by the buckets, or None before anything is posted."""
+        if self._origin is None:
+            return None
+        return np.datetime64(int(self._origin), "D")
+
+    def _ensure_accounts(self, count):
+        capacity = self._daily.shape[1]
+        if count <= capacity:
+            return
+        while capacity < count:
+            capacity *= 2
+        pad = ((0, 0), (0, capacity - self._daily.shape[1]), (0, 0))
+        self._daily = np.pad(self._daily, pad)
+        self._tree = np.pad(self._tree, pad)
+
+    def _ensure_days(self, first, last):
+        """Grow or shift the day buckets so that days first..last are covered."""
+        if self._origin is None:
+            self._origin = self._last = first
+        used = self._last - self._origin + 1
+        last = self._last = max(self._last, last)
+        origin = self._origin
+        if first < origin:
+            # Leave some headroom so back-dated postings don't rebase every time
+            origin = first - self.day_capacity // 4
+        capacity = self.day_capacity
+        while last - origin >= capacity:
+            capacity *= 2
+        if origin == self._origin and capacity == self.day_capacity:
+            return
+        shift = self._origin - origin
+        daily = np.zeros(self._daily.shape[:2] + (capacity,), dtype=self._daily.dtype)
+        daily[:, :, shift:shift + used] = self._daily[:, :, :used]
+        self._origin = origin
+        self._daily = daily
+        self._rebuild()
+
+    def _rebuild(self):
+        """Rebuild the Fenwick trees from the daily buckets in one vectorized pass."""
+        capacity = self.day_capacity
+        prefix = np.zeros(self._daily.shape[:2] + (capacity + 1,), dtype=self._daily.dtype)
+        np.cumsum(self._daily, axis=2, out=prefix[:, :, 1:])
+        index = np.arange(1, capacity + 1)
+        self._tree = np.zeros_like(prefix)
+        self._tree[:, :, 1:] = prefix[:, :, index] - prefix[:, :, index - _lowbit(index)]
+
+    def add(self, day, accounts, debits, credits):
+        """Post the legs of one transaction dated `day`."""
+        accounts = np.asarray(accounts, dtype=np.intp)
+        amounts = np.stack([np.asarray(debits, dtype=np.int64), np.asarray(credits, dtype=np.int64)])
+        day = _to_day(day)
+        self._ensure_accounts(int(accounts.max()) + 1)
+        self._ensure_days(day, day)
+        bucket = day - self._origin
+        np.add.at(self._daily[0], (accounts, bucket), amounts[0])
+        np.add.at(self._daily[1], (accounts, bucket), amounts[1])
+        i = bucket + 1
+        while i <= self.day_capacity:
+            np.add.at(self._tree[0], (accounts, i), amounts[0])
+            np.add.at(self._tree[1], (accounts, i), amounts[1])
+            i += _lowbit(i)
+
+    def add_many(self, days, accounts, debits, credits):
+        """Post many legs at once by scattering into the buckets and rebuilding the trees."""
+        if len(accounts) == 0:
+            return
+        days = np.asarray(days).astype("datetime64[D]").astype(np.int64)
+        accounts = np.asarray(accounts, dtype=np.intp)
+        self._ensure_accounts(int(accounts.max()) + 1)
+        self._ensure_days(int(days.min()), int(days.max()))
+        buckets = days - self._origin
+        np.add.at(self._daily[0], (accounts, buckets), np.asarray(debits, dtype=np.int64))
+        np.add.at(self._daily[1], (accounts, buckets), np.asarray(credits, dtype=np.int64))
+        self._rebuild()
+
+    def _prefix(self, bucket):
+        # Sum of buckets 0..bucket (inclusive) for every account
+        total = np.zeros(self._tree.shape[:2], dtype=self._tree.dtype)
+        i = min(bucket, self.day_capacity - 1) + 1
+        while i > 0:
+            total += self._tree[:, :, i]
+            i -= _lowbit(i)
+        return total
+
+    def totals(self, start, end, account_count):
+        """
+        Return (debits, credits) int64 cents arrays with each account's totals
+        for days start..end inclusive.
+        """
+        if self._origin is None:
+            return np.zeros(account_count, dtype=np.int64), np.zeros(account_count, dtype=np.int64)
+        self._ensure_accounts(account_count)
+        first = _to_day(start) - self._origin
+        last = _to_day(end) - self._origin
+        if last < 0 or first > last:
+            window = np.zeros(self._tree.shape[:2], dtype=self._tree.dtype)
+        elif first <= 0:
+            window = self._prefix(last)
+        else:
+            window = self._prefix(last) - self._prefix(first - 1)
+        return window[0, :account_count], window[1, :account_count]
+
+    def daily(self, start, end, account_count):
+        """
+        Return (days, debits, credits) for days start..end inclusive: the day
+        buckets and each account's per-day totals, shaped (account_count, days).
+        """
+        first, last = _to_day(start), _to_day(end)
+        days = np.arange(first, last + 1).astype("datetime64[D]")
+        window = np.zeros((2, account_count, len(days)), dtype=np.int64)
+        if self._origin is not None:
+            self._ensure_accounts(account_count)
+            lo, hi = max(first, self._origin), min(last, self._last)
+            if lo <= hi:
+                covered = self._daily[:, :account_count, lo - self._origin:hi - self._origin + 1]
+                window[:, :, lo - first:hi - first + 1] = covered
+        return days, window[0], window[1]
+
+    def monthly(self, start, end, account_count):
+        """Return (months, debits, credits) like `daily`, with the day buckets summed per calendar month."""
+        days, debits, credits = self.daily(start, end, account_count)
+        if len(days) == 0:
+            return days.astype("datetime64[M]"), debits, credits
+        months = days.astype("datetime64[M]")
+        starts = np.flatnonzero(np.r_[True, months[1:] != months[:-1]])
+        return months[starts], np.add.reduceat(debits, starts, axis=1), np.add.reduceat(credits, starts, axis=1)
@@ -1,7 +1,10 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 from datetime import datetime
+from functools import partial
+from ledger.charts import png_chart, subplots
+from ledger.money import to_cents
+from ledger.paging import frame_page, paged_dataframe
 
 # Page Configuration
 st.set_page_config(page_title="Loan Underwriting", layout="wide")
@@ -26,6 +29,9 @@ Key metrics include:
 if "applications" not in st.session_state:
     st.session_state.applications = []
 
+# Filters offered on the application tables
+APP_FILTERS = {"Loan Type": ["Housing Loan", "Car Loan", "Additional Loan"], "Status": ["Pending", "Approve", "Deny"]}
+
 # Sidebar Navigation
 st.sidebar.title("Underwriting Tools")
 option = st.sidebar.selectbox(
@@ -88,7 +94,7 @@ if option == "Submit Application":
     if st.session_state.applications:
         st.write("### Submitted Applications")
         apps_df = pd.DataFrame(st.session_state.applications)
-        st.dataframe(apps_df)
+        paged_dataframe(partial(frame_page, apps_df, search_field="Name"), "submitted", list(apps_df.columns), APP_FILTERS, search="Search name")
 
 # --- Review Applications ---
 elif option == "Review Applications":
@@ -98,7 +104,7 @@ elif option == "Review Applications":
     if st.session_state.applications:
         apps_df = pd.DataFrame(st.session_state.applications)
         filtered_df = apps_df[apps_df["Date Submitted"] == evaluation_date]
-        st.dataframe(filtered_df)
+        paged_dataframe(partial(frame_page, filtered_df, search_field="Name"), "review", list(apps_df.columns), APP_FILTERS, search="Search name")
     else:
         st.write("No applications submitted yet.")
 
@@ -192,11 +198,15 @@ elif option == "Accounting Entries":
                     "Credit": app["Loan Amount"]
                 })
             journal_df = pd.DataFrame(journal)
-            st.table(journal_df.groupby(["Date", "Account"]).sum().reset_index())
+            journal_summary = journal_df.groupby(["Date", "Account"]).sum().reset_index()
+            paged_dataframe(
+                partial(frame_page, journal_summary), "journal", list(journal_summary.columns),
+                {"Account": ["Loans Receivable", "Cash"]}, search=None
+            )
 
-            total_debits = journal_df["Debit"].sum()
-            total_credits = journal_df["Credit"].sum()
-            if abs(total_debits - total_credits) < 0.01:
+            total_debits = to_cents(journal_df["Debit"]).sum()
+            total_credits = to_cents(journal_df["Credit"]).sum()
+            if total_debits == total_credits:
                 st.success("Journal entries balance!")
             else:
                 st.error("Journal entries do not balance!")
@@ -226,30 +236,40 @@ elif option == "Analysis & Visualization":
 
         # Visualization
         st.write("### Loan Distribution")
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
-
-        # Pie Chart: Status
-        status_counts = filtered_df["Status"].value_counts()
-        ax1.pie(status_counts, labels=status_counts.index, autopct="%1.1f%%", startangle=90)
-        ax1.set_title("Application Status")
-        ax1.axis("equal")
-
-        # Bar Chart: Loan Type
-        type_totals = filtered_df.groupby("Loan Type")["Loan Amount"].sum()
-        ax2.bar(type_totals.index, type_totals, color=["#4CAF50", "#FF5722", "#2196F3"])
-        ax2.set_ylabel("Total Loan Amount ($)")
-        ax2.set_title("Loan Amount by Type")
-        plt.tight_layout()
-        st.pyplot(fig)
+
+        @png_chart
+        def draw_distribution(applications):
+            fig, (ax1, ax2) = subplots(1, 2, figsize=(12, 5))
+
+            # Pie Chart: Status
+            status_counts = applications["Status"].value_counts()
+            ax1.pie(status_counts, labels=status_counts.index, autopct="%1.1f%%", startangle=90)
+            ax1.set_title("Application Status")
+            ax1.axis("equal")
+
+            # Bar Chart: Loan Type
+            type_totals = applications.groupby("Loan Type")["Loan Amount"].sum()
+            ax2.bar(type_totals.index, type_totals, color=["#4CAF50", "#FF5722", "#2196F3"])
+            ax2.set_ylabel("Total Loan Amount ($)")
+            ax2.set_title("Loan Amount by Type")
+            fig.tight_layout()
+            return fig
+
+        st.image(draw_distribution(filtered_df[["Status", "Loan Type", "Loan Amount"]]), use_column_width=True)
 
         # Credit Score Distribution
         st.write("### Credit Score Distribution")
-        fig2, ax = plt.subplots()
-        filtered_df["Credit Score"].hist(bins=10, ax=ax, color="#2196F3")
-        ax.set_xlabel("Credit Score")
-        ax.set_ylabel("Number of Applicants")
-        ax.set_title("Credit Score Histogram")
-        st.pyplot(fig2)
+
+        @png_chart
+        def draw_credit_scores(credit_scores):
+            fig2, ax = subplots()
+            credit_scores.hist(bins=10, ax=ax, color="#2196F3")
+            ax.set_xlabel("Credit Score")
+            ax.set_ylabel("Number of Applicants")
+            ax.set_title("Credit Score Histogram")
+            return fig2
+
+        st.image(draw_credit_scores(filtered_df["Credit Score"]), use_column_width=True)
     else:
         st.write("No data for analysis. Submit applications first.")
 
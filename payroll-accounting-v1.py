@@ -1,7 +1,10 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
+from ledger.charts import png_chart, subplots
+from ledger.exports import download_xlsx, forget_download, frame_version
+from ledger.money import to_cents, to_dollars
+from ledger.records import SortedRecords
 
 # Page Configuration
 st.set_page_config(page_title="Payroll Accounting", layout="wide")
@@ -21,7 +24,9 @@ st.write("This app simulates payroll processing and its accounting impact.")
 if "employees" not in st.session_state:
     st.session_state.employees = []
 if "payroll_records" not in st.session_state:
-    st.session_state.payroll_records = []
+    st.session_state.payroll_records = SortedRecords(date_key="Pay Period Start")
+if "latest_payroll_run" not in st.session_state:
+    st.session_state.latest_payroll_run = []
 
 # Sidebar Navigation
 st.sidebar.title("Payroll Tools")
@@ -94,14 +99,19 @@ elif option == "Process Payroll":
                 else:
                     gross_pay = emp["Rate"] / 24  # Assuming semi-monthly pay (24 periods/year)
 
-                # Deductions
-                fed_tax = gross_pay * fed_tax_rate
-                state_tax = gross_pay * state_tax_rate
-                total_deductions = fed_tax + state_tax + insurance_deduction
-                net_pay = gross_pay - total_deductions
+                # Deductions, rounded to whole cents; net pay is what remains so the
+                # payroll journal entry balances to the cent
+                gross_cents = to_cents(gross_pay)
+                fed_cents = to_cents(gross_cents * fed_tax_rate / 100)
+                state_cents = to_cents(gross_cents * state_tax_rate / 100)
+                insurance_cents = to_cents(insurance_deduction)
+                net_cents = gross_cents - fed_cents - state_cents - insurance_cents
+                gross_pay, fed_tax, state_tax, net_pay = (
+                    to_dollars(gross_cents), to_dollars(fed_cents), to_dollars(state_cents), to_dollars(net_cents)
+                )
 
                 # Employer Costs
-                employer_taxes = gross_pay * employer_tax_rate
+                employer_taxes = to_dollars(to_cents(gross_cents * employer_tax_rate / 100))
 
                 payroll_entry = {
                     "Employee ID": emp["Employee ID"],
@@ -118,12 +128,13 @@ elif option == "Process Payroll":
                 payroll_data.append(payroll_entry)
 
             st.session_state.payroll_records.extend(payroll_data)
+            st.session_state.latest_payroll_run = payroll_data
             st.success(f"Payroll processed for {len(payroll_data)} employees!")
 
         # Display Latest Payroll
-        if st.session_state.payroll_records:
+        if st.session_state.latest_payroll_run:
             st.write("### Latest Payroll Run")
-            payroll_df = pd.DataFrame(st.session_state.payroll_records[-len(st.session_state.employees):])
+            payroll_df = pd.DataFrame(st.session_state.latest_payroll_run)
             st.dataframe(payroll_df)
 
 # --- Payroll Ledger ---
@@ -132,11 +143,9 @@ elif option == "Payroll Ledger":
     st.write("View all payroll transactions recorded.")
 
     if st.session_state.payroll_records:
-        ledger_df = pd.DataFrame(st.session_state.payroll_records)
-        filtered_df = ledger_df[
-            (ledger_df["Pay Period Start"] >= pay_period_start) & 
-            (ledger_df["Pay Period End"] <= pay_period_end)
-        ]
+        # Records are sorted by start date, so only the slice starting in the period needs the end-date check
+        period_df = st.session_state.payroll_records.between(pay_period_start, pay_period_end)
+        filtered_df = period_df[period_df["Pay Period End"] <= pay_period_end]
         st.dataframe(filtered_df)
     else:
         st.write("No payroll records yet. Process payroll first.")
@@ -147,19 +156,16 @@ elif option == "Financial Impact":
     st.write("Record payroll in the accounting system using double-entry.")
 
     if st.session_state.payroll_records:
-        ledger_df = pd.DataFrame(st.session_state.payroll_records)
-        filtered_df = ledger_df[
-            (ledger_df["Pay Period Start"] >= pay_period_start) & 
-            (ledger_df["Pay Period End"] <= pay_period_end)
-        ]
+        period_df = st.session_state.payroll_records.between(pay_period_start, pay_period_end)
+        filtered_df = period_df[period_df["Pay Period End"] <= pay_period_end]
 
-        # Calculate Totals
-        total_gross_pay = filtered_df["Gross Pay"].sum()
-        total_fed_tax = filtered_df["Federal Tax"].sum()
-        total_state_tax = filtered_df["State Tax"].sum()
-        total_insurance = filtered_df["Insurance"].sum()
-        total_net_pay = filtered_df["Net Pay"].sum()
-        total_employer_taxes = filtered_df["Employer Taxes"].sum()
+        # Calculate Totals (summed in cents, shown in dollars)
+        total_gross_pay = to_dollars(to_cents(filtered_df["Gross Pay"]).sum())
+        total_fed_tax = to_dollars(to_cents(filtered_df["Federal Tax"]).sum())
+        total_state_tax = to_dollars(to_cents(filtered_df["State Tax"]).sum())
+        total_insurance = to_dollars(to_cents(filtered_df["Insurance"]).sum())
+        total_net_pay = to_dollars(to_cents(filtered_df["Net Pay"]).sum())
+        total_employer_taxes = to_dollars(to_cents(filtered_df["Employer Taxes"]).sum())
 
         # Journal Entry
         st.write("### Journal Entry")
@@ -175,9 +181,9 @@ elif option == "Financial Impact":
         st.table(journal_df)
 
         # Balance Check
-        total_debits = journal_df["Debit"].sum()
-        total_credits = journal_df["Credit"].sum()
-        if abs(total_debits - total_credits) < 0.01:
+        total_debits = to_cents(journal_df["Debit"]).sum()
+        total_credits = to_cents(journal_df["Credit"]).sum()
+        if total_debits == total_credits:
             st.success("Journal entry balances!")
         else:
             st.error("Journal entry does not balance!")
@@ -188,11 +194,8 @@ elif option == "Reports & Visualization":
     st.write("Analyze payroll data.")
 
     if st.session_state.payroll_records:
-        ledger_df = pd.DataFrame(st.session_state.payroll_records)
-        filtered_df = ledger_df[
-            (ledger_df["Pay Period Start"] >= pay_period_start) & 
-            (ledger_df["Pay Period End"] <= pay_period_end)
-        ]
+        period_df = st.session_state.payroll_records.between(pay_period_start, pay_period_end)
+        filtered_df = period_df[period_df["Pay Period End"] <= pay_period_end]
 
         # Summary Report
         st.write("### Payroll Summary")
@@ -209,22 +212,32 @@ elif option == "Reports & Visualization":
 
         # Visualization
         st.write("### Cost Breakdown")
-        fig, ax = plt.subplots()
+
+        @png_chart
+        def draw_cost_breakdown(costs):
+            fig, ax = subplots()
+            labels = ["Gross Pay", "Employer Taxes", "Employee Taxes"]
+            ax.bar(labels, costs, color=["#4CAF50", "#2196F3", "#FF5722"])
+            ax.set_ylabel("Amount ($)")
+            ax.set_title("Payroll Cost Breakdown")
+            return fig
+
         costs = [summary["Total Gross Pay"], summary["Total Employer Taxes"], summary["Total Federal Tax"] + summary["Total State Tax"]]
-        labels = ["Gross Pay", "Employer Taxes", "Employee Taxes"]
-        ax.bar(labels, costs, color=["#4CAF50", "#2196F3", "#FF5722"])
-        ax.set_ylabel("Amount ($)")
-        ax.set_title("Payroll Cost Breakdown")
-        st.pyplot(fig)
+        st.image(draw_cost_breakdown(costs), use_column_width=True)
 
         # Pie Chart
         st.write("### Deductions Distribution")
-        fig2, ax2 = plt.subplots()
+
+        @png_chart
+        def draw_deductions(deductions):
+            fig2, ax2 = subplots()
+            ded_labels = ["Federal Tax", "State Tax", "Insurance"]
+            ax2.pie(deductions, labels=ded_labels, autopct="%1.1f%%", startangle=90)
+            ax2.axis("equal")
+            return fig2
+
         deductions = [summary["Total Federal Tax"], summary["Total State Tax"], summary["Total Insurance"]]
-        ded_labels = ["Federal Tax", "State Tax", "Insurance"]
-        ax2.pie(deductions, labels=ded_labels, autopct="%1.1f%%", startangle=90)
-        ax2.axis("equal")
-        st.pyplot(fig2)
+        st.image(draw_deductions(deductions), use_column_width=True)
     else:
         st.write("No payroll data for reports.")
 
@@ -234,8 +247,18 @@ st.sidebar.write("- ID: EMP001, Name: John Doe, Hourly, $20/hr, 80 hrs")
 st.sidebar.write("- ID: EMP002, Name: Jane Smith, Salary, $50,000/yr")
 if st.sidebar.button("Reset Data"):
     st.session_state.employees = []
-    st.session_state.payroll_records = []
+    st.session_state.payroll_records = SortedRecords(date_key="Pay Period Start")
+    st.session_state.latest_payroll_run = []
+    forget_download("payroll.xlsx")
     st.sidebar.success("All data reset!")
 
+# Workbook Export
+st.sidebar.write("**Export:**")
+employees_df = pd.DataFrame(st.session_state.employees)
+download_xlsx(
+    lambda: {"Employees": employees_df, "Payroll Ledger": st.session_state.payroll_records.frame()}, "payroll",
+    (st.session_state.payroll_records.version, frame_version(employees_df)), container=st.sidebar
+)
+
 # Footer
 st.write("Built with Streamlit by Nathan Rossow at (Burst Software)")
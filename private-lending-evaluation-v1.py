@@ -1,7 +1,8 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 from datetime import datetime
+from ledger.charts import png_chart, subplots
+from ledger.money import to_cents
 
 # Page Configuration
 st.set_page_config(page_title="Private Lending Evaluation", layout="wide")
@@ -202,9 +203,9 @@ elif option == "Accounting Entries":
             journal_df = pd.DataFrame(journal)
             st.table(journal_df.groupby(["Date", "Account"]).sum().reset_index())
 
-            total_debits = journal_df["Debit"].sum()
-            total_credits = journal_df["Credit"].sum()
-            if abs(total_debits - total_credits) < 0.01:
+            total_debits = to_cents(journal_df["Debit"]).sum()
+            total_credits = to_cents(journal_df["Credit"]).sum()
+            if total_debits == total_credits:
                 st.success("Journal entries balance!")
             else:
                 st.error("Journal entries do not balance!")
@@ -234,29 +235,41 @@ elif option == "Analysis & Visualization":
 
         # Visualization
         st.write("### Outcome Distribution")
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
-
-        # Pie Chart: Status
-        status_counts = filtered_df["Status"].value_counts()
-        ax1.pie(status_counts, labels=status_counts.index, autopct="%1.1f%%", startangle=90)
-        ax1.set_title("Loan Status Distribution")
-        ax1.axis("equal")
-
-        # Bar Chart: Loan Amounts by Status
-        approved_amounts = filtered_df[filtered_df["Status"] == "Approved"]["Loan Amount"]
-        denied_amounts = filtered_df[filtered_df["Status"] == "Denied"]["Loan Amount"]
-        ax2.bar(["Approved", "Denied"], [approved_amounts.sum(), denied_amounts.sum()], color=["#4CAF50", "#FF5722"])
-        ax2.set_ylabel("Total Loan Amount ($)")
-        ax2.set_title("Loan Amounts by Outcome")
-        plt.tight_layout()
-        st.pyplot(fig)
+
+        @png_chart
+        def draw_outcomes(outcomes):
+            fig, (ax1, ax2) = subplots(1, 2, figsize=(12, 5))
+
+            # Pie Chart: Status
+            status_counts = outcomes["Status"].value_counts()
+            ax1.pie(status_counts, labels=status_counts.index, autopct="%1.1f%%", startangle=90)
+            ax1.set_title("Loan Status Distribution")
+            ax1.axis("equal")
+
+            # Bar Chart: Loan Amounts by Status
+            approved_amounts = outcomes[outcomes["Status"] == "Approved"]["Loan Amount"]
+            denied_amounts = outcomes[outcomes["Status"] == "Denied"]["Loan Amount"]
+            ax2.bar(["Approved", "Denied"], [approved_amounts.sum(), denied_amounts.sum()], color=["#4CAF50", "#FF5722"])
+            ax2.set_ylabel("Total Loan Amount ($)")
+            ax2.set_title("Loan Amounts by Outcome")
+            fig.tight_layout()
+            return fig
+
+        st.image(draw_outcomes(filtered_df[["Status", "Loan Amount"]]), use_column_width=True)
 
         # Credit Score vs. Loan Amount
         st.write("### Credit Score vs. Loan Amount")
-        fig2, ax = plt.subplots()
-        filtered_df.plot(kind="scatter", x="Credit Score", y="Loan Amount", c="Status", colormap="viridis", ax=ax)
-        ax.set_title("Credit Score vs. Loan Amount")
-        st.pyplot(fig2)
+
+        @png_chart
+        def draw_score_scatter(scores):
+            fig2, ax = subplots()
+            # Color points by status code; matplotlib cannot map the status strings to colors
+            status_codes = scores["Status"].astype("category").cat.codes
+            scores.plot(kind="scatter", x="Credit Score", y="Loan Amount", c=status_codes, colormap="viridis", ax=ax)
+            ax.set_title("Credit Score vs. Loan Amount")
+            return fig2
+
+        st.image(draw_score_scatter(filtered_df[["Credit Score", "Loan Amount", "Status"]]), use_column_width=True)
     else:
         st.write("No data for analysis. Submit a loan request first.")
 
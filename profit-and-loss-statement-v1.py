@@ -1,7 +1,8 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
+from ledger.charts import png_chart, subplots
+from ledger.records import SortedRecords
 
 # Page Configuration
 st.set_page_config(page_title="Profit and Loss Statement", layout="wide")
@@ -17,10 +18,11 @@ The **Profit and Loss Statement (P&L)**, or Income Statement, shows a business
 st.write("This app lets you build and analyze a P&L statement interactively.")
 
 # Initialize Session State
+ENTRY_COLUMNS = ["Date", "Description", "Amount", "Category"]
 if "revenues" not in st.session_state:
-    st.session_state.revenues = []
+    st.session_state.revenues = SortedRecords(columns=ENTRY_COLUMNS)
 if "expenses" not in st.session_state:
-    st.session_state.expenses = []
+    st.session_state.expenses = SortedRecords(columns=ENTRY_COLUMNS)
 
 # Sidebar Navigation and Settings
 st.sidebar.title("P&L Tools")
@@ -56,10 +58,7 @@ if option == "Enter Revenues":
     # Display Revenues
     if st.session_state.revenues:
         st.write("### Recorded Revenues")
-        revenues_df = pd.DataFrame(st.session_state.revenues)
-        filtered_df = revenues_df[
-            (revenues_df["Date"] >= period_start) & (revenues_df["Date"] <= period_end)
-        ]
+        filtered_df = st.session_state.revenues.between(period_start, period_end)
         st.dataframe(filtered_df)
 
 # --- Enter Expenses ---
@@ -87,10 +86,7 @@ elif option == "Enter Expenses":
     # Display Expenses
     if st.session_state.expenses:
         st.write("### Recorded Expenses")
-        expenses_df = pd.DataFrame(st.session_state.expenses)
-        filtered_df = expenses_df[
-            (expenses_df["Date"] >= period_start) & (expenses_df["Date"] <= period_end)
-        ]
+        filtered_df = st.session_state.expenses.between(period_start, period_end)
         st.dataframe(filtered_df)
 
 # --- P&L Statement ---
@@ -102,14 +98,8 @@ elif option == "P&L Statement":
         st.warning("No revenues or expenses recorded yet. Add data in the respective sections.")
     else:
         # Filter Data by Period
-        revenues_df = pd.DataFrame(st.session_state.revenues)
-        expenses_df = pd.DataFrame(st.session_state.expenses)
-        filtered_revenues = revenues_df[
-            (revenues_df["Date"] >= period_start) & (revenues_df["Date"] <= period_end)
-        ]
-        filtered_expenses = expenses_df[
-            (expenses_df["Date"] >= period_start) & (expenses_df["Date"] <= period_end)
-        ]
+        filtered_revenues = st.session_state.revenues.between(period_start, period_end)
+        filtered_expenses = st.session_state.expenses.between(period_start, period_end)
 
         # Revenue Breakdown
         st.write("### Revenue")
@@ -162,14 +152,8 @@ elif option == "Analysis & Visualization":
     if not st.session_state.revenues and not st.session_state.expenses:
         st.write("No data for analysis. Add revenues and expenses first.")
     else:
-        revenues_df = pd.DataFrame(st.session_state.revenues)
-        expenses_df = pd.DataFrame(st.session_state.expenses)
-        filtered_revenues = revenues_df[
-            (revenues_df["Date"] >= period_start) & (revenues_df["Date"] <= period_end)
-        ]
-        filtered_expenses = expenses_df[
-            (expenses_df["Date"] >= period_start) & (expenses_df["Date"] <= period_end)
-        ]
+        filtered_revenues = st.session_state.revenues.between(period_start, period_end)
+        filtered_expenses = st.session_state.expenses.between(period_start, period_end)
 
         total_revenue = filtered_revenues["Amount"].sum()
         total_expenses = filtered_expenses["Amount"].sum()
@@ -186,22 +170,27 @@ elif option == "Analysis & Visualization":
 
         # Visualization
         st.write("### P&L Overview")
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
 
-        # Bar Chart
-        pl_data = {"Revenue": total_revenue, "Expenses": total_expenses, "Net Income": net_income}
-        ax1.bar(pl_data.keys(), pl_data.values(), color=["#4CAF50", "#FF5722", "#2196F3"])
-        ax1.set_ylabel("Amount ($)")
-        ax1.set_title("P&L Summary")
+        @png_chart
+        def draw_overview(pl_data, expense_by_category):
+            fig, (ax1, ax2) = subplots(1, 2, figsize=(12, 5))
+
+            # Bar Chart
+            ax1.bar(pl_data.keys(), pl_data.values(), color=["#4CAF50", "#FF5722", "#2196F3"])
+            ax1.set_ylabel("Amount ($)")
+            ax1.set_title("P&L Summary")
 
-        # Pie Chart for Expenses
-        if total_expenses > 0:
-            ax2.pie(expense_by_category, labels=expense_by_category.index, autopct="%1.1f%%", startangle=90)
-            ax2.set_title("Expense Distribution")
-            ax2.axis("equal")
+            # Pie Chart for Expenses
+            if pl_data["Expenses"] > 0:
+                ax2.pie(expense_by_category, labels=expense_by_category.index, autopct="%1.1f%%", startangle=90)
+                ax2.set_title("Expense Distribution")
+                ax2.axis("equal")
 
-        plt.tight_layout()
-        st.pyplot(fig)
+            fig.tight_layout()
+            return fig
+
+        pl_data = {"Revenue": total_revenue, "Expenses": total_expenses, "Net Income": net_income}
+        st.image(draw_overview(pl_data, expense_by_category), use_column_width=True)
 
         # Trend Analysis (if multiple dates)
         if len(filtered_revenues["Date"].unique()) > 1 or len(filtered_expenses["Date"].unique()) > 1:
@@ -212,19 +201,23 @@ elif option == "Analysis & Visualization":
             trend_df.columns = ["Revenue", "Expenses"]
             trend_df["Net Income"] = trend_df["Revenue"] - trend_df["Expenses"]
             
-            fig2, ax = plt.subplots()
-            trend_df.plot(ax=ax, marker="o")
-            ax.set_ylabel("Amount ($)")
-            ax.set_title("Daily P&L Trend")
-            st.pyplot(fig2)
+            @png_chart
+            def draw_trend(trend_df):
+                fig2, ax = subplots()
+                trend_df.plot(ax=ax, marker="o")
+                ax.set_ylabel("Amount ($)")
+                ax.set_title("Daily P&L Trend")
+                return fig2
+
+            st.image(draw_trend(trend_df), use_column_width=True)
 
 # Sidebar Info
 st.sidebar.write("**Sample Entries:**")
 st.sidebar.write("- Revenue: $1,000, Product sales, Sales")
 st.sidebar.write("- Expense: $500, Rent payment, Operating Expenses")
 if st.sidebar.button("Reset Data"):
-    st.session_state.revenues = []
-    st.session_state.expenses = []
+    st.session_state.revenues = SortedRecords(columns=ENTRY_COLUMNS)
+    st.session_state.expenses = SortedRecords(columns=ENTRY_COLUMNS)
     st.sidebar.success("All data reset!")
 
 # Footer